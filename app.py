@@ -13,12 +13,23 @@ import os
 import sqlite3
 import duckdb
 import pandas as pd
-from datetime import datetime
+import numpy as np
 import json
 import re
 import warnings
 import time
 import glob
+import logging
+import mmap
+import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Per-row diagnostics from the import fallbacks go here instead of stdout
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARNING)
 
 # Suppress pandas warnings about DuckDB connections
 warnings.filterwarnings('ignore', message='pandas only supports SQLAlchemy connectable.*')
@@ -48,7 +59,7 @@ from PyQt6.QtGui import (
     QTextCursor, QPalette, QKeySequence, QShortcut, QStandardItemModel, QStandardItem
 )
 from PyQt6.QtCore import (
-    Qt, QAbstractTableModel, QModelIndex, QSize, QThread, pyqtSignal,
+    Qt, QAbstractTableModel, QAbstractListModel, QModelIndex, QSize, QThread, pyqtSignal,
     QRegularExpression, QSettings, QTimer, QStringListModel, pyqtSlot
 )
 import qtawesome as qta
@@ -71,6 +82,73 @@ try:
 except ImportError:
     POLARS_AVAILABLE = False
 
+# Use the Rust-based calamine reader for Excel files when available (pandas >= 2.2)
+try:
+    import python_calamine
+    CALAMINE_AVAILABLE = tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+except ImportError:
+    CALAMINE_AVAILABLE = False
+EXCEL_ENGINE = 'calamine' if CALAMINE_AVAILABLE else None  # None lets pandas pick openpyxl/xlrd
+
+# Import PyArrow for streaming exports
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as pa_ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Import orjson for faster parsing of whole-document JSON files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# String values treated as NULL when sanitizing imported data
+_NULL_STRS = np.array(['nan', 'NaN', 'None', 'null', 'NULL', '', '<NA>'], dtype=object)
+
+# Spellings of infinity normalized when sanitizing imported data
+_INFINITY_REPLACEMENTS = {
+    'inf': 'infinity',
+    '-inf': '-infinity',
+    'Infinity': 'infinity',
+    '-Infinity': '-infinity'
+}
+
+# Runs of non-word characters/underscores, collapsed to one underscore in column and table names
+_COLUMN_JUNK_RE = re.compile(r'[\W_]+')
+
+# Runs of anything but ASCII letters/digits, collapsed to one underscore in SQL-safe column names
+_ASCII_NAME_JUNK_RE = re.compile(r'[^A-Za-z0-9]+')
+
+# Characters that are not allowed in database file names
+_INVALID_NAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Single characters replaced with an underscore when a file name becomes a table name
+_NON_IDENT_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+# Rows handed to the database per batch, so a large import never holds every row as tuples at once
+IMPORT_CHUNK_SIZE = 50_000
+
+# Rows per DataFrame streamed from a running query to the results table
+QUERY_CHUNK_SIZE = 50_000
+
+# File dialog flags that skip symlink resolution and per-entry icon probing, which stall on network shares
+_FILE_DIALOG_OPTIONS = QFileDialog.Option.DontResolveSymlinks | QFileDialog.Option.DontUseCustomDirectoryIcons
+_DIR_DIALOG_OPTIONS = QFileDialog.Option.ShowDirsOnly | _FILE_DIALOG_OPTIONS
+
+# Table names that get a tbl_ prefix because they are SQL keywords
+_SQL_RESERVED_TABLE_NAMES = frozenset({
+    'select', 'from', 'where', 'insert', 'update', 'delete', 'create', 'drop',
+    'alter', 'table', 'index', 'view', 'database', 'schema', 'primary', 'key',
+    'foreign', 'references', 'constraint', 'unique', 'not', 'null', 'default',
+    'check', 'order', 'by', 'group', 'having', 'union', 'join', 'inner', 'outer',
+    'left', 'right', 'on', 'as', 'distinct', 'count', 'sum', 'avg', 'max', 'min'
+})
+
 # Set application style
 QApplication.setStyle('Fusion')
 
@@ -97,13 +175,53 @@ class ColorScheme:
     COLUMN_NAME = QColor(152, 195, 121)      # Light green for column names
     DATA_TYPE = QColor(209, 154, 102)        # Tan for data types
 
+# Case-insensitive prefix tree of completion words
+class CompletionTrie:
+    """Maps uppercased words to their first spelling, so a prefix lookup only walks the matching branch"""
+    
+    def __init__(self, words=()):
+        self._root = {}
+        self._count = 0
+        for word in words:
+            self.add(word)
+    
+    def add(self, word):
+        """Add a word unless it is already present in another case"""
+        node = self._root
+        for char in word.upper():
+            node = node.setdefault(char, {})
+        if None not in node:
+            # The None key holds (insertion order, original spelling) for a word ending here
+            node[None] = (self._count, word)
+            self._count += 1
+    
+    def matches(self, prefix):
+        """Words starting with prefix (case-insensitive), in the order they were added"""
+        node = self._root
+        for char in prefix.upper():
+            node = node.get(char)
+            if node is None:
+                return []
+        
+        found = []
+        stack = [node]
+        while stack:
+            for key, child in stack.pop().items():
+                if key is None:
+                    found.append(child)
+                else:
+                    stack.append(child)
+        found.sort()
+        return [word for _, word in found]
+
 # SQL Auto-completion and suggestions
 class SQLCompleter(QCompleter):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_completions()
         self.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        # The model only ever holds the trie matches for the current prefix, so Qt need not filter it
+        self.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
         self.setWrapAround(False)
         
         # Customize the popup appearance
@@ -242,11 +360,13 @@ class SQLCompleter(QCompleter):
             'ROW_COUNT', 'FOUND_ROWS'
         ]
         
-        # Combine all completions
-        all_completions = self.sql_keywords + self.sql_functions
+        # Combine all completions, deduplicated once (case-insensitively, keeping the first spelling)
+        self._static_trie = CompletionTrie(self.sql_keywords + self.sql_functions)
+        self._static_upper = frozenset(item.upper() for item in self.sql_keywords + self.sql_functions)
+        self._dynamic_trie = CompletionTrie()
         
         # Create model
-        self.model = QStringListModel(all_completions)
+        self.model = QStringListModel()
         self.setModel(self.model)
         
         # Store for dynamic updates
@@ -265,18 +385,20 @@ class SQLCompleter(QCompleter):
         
     def refresh_completions(self):
         """Refresh the completion model with current keywords, functions, tables, and columns"""
-        all_completions = (self.sql_keywords + self.sql_functions + 
-                         self.table_names + self.column_names)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_completions = []
-        for item in all_completions:
-            if item.upper() not in seen:
-                unique_completions.append(item)
-                seen.add(item.upper())
-                
-        self.model.setStringList(unique_completions)
+        # Rebuilt on the next lookup, so back-to-back table and column updates cost one build
+        self._dynamic_trie = None
+        
+    def filter_prefix(self, prefix):
+        """Load the completions starting with prefix into the model; returns how many there are"""
+        if self._dynamic_trie is None:
+            # Keywords and functions are already unique; only dedupe the table and column names against them
+            static_upper = self._static_upper
+            self._dynamic_trie = CompletionTrie(
+                item for item in chain(self.table_names, self.column_names) if item.upper() not in static_upper
+            )
+        completions = self._static_trie.matches(prefix) + self._dynamic_trie.matches(prefix)
+        self.model.setStringList(completions)
+        return len(completions)
 
 # Enhanced SQL Text Editor with auto-completion
 class SQLTextEdit(QTextEdit):
@@ -291,12 +413,19 @@ class SQLTextEdit(QTextEdit):
         self.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
         self.setTabStopDistance(40)  # 4 spaces for tab
         
-        # Connect to text change for auto-completion
+        # Connect to text change for auto-completion, debounced so a burst of keystrokes completes once
+        self._complete_timer = QTimer(self)
+        self._complete_timer.setSingleShot(True)
+        self._complete_timer.setInterval(80)
+        self._complete_timer.timeout.connect(self._do_complete)
         self.textChanged.connect(self.on_text_changed)
         
         # Track cursor position for better completion
         self.cursorPositionChanged.connect(self.on_cursor_changed)
         
+        # ((block, position in block), word) of the last get_current_word lookup
+        self._word_cache = (None, None)
+        
     def insert_completion(self, completion):
         """Insert the selected completion into the text"""
         cursor = self.textCursor()
@@ -315,16 +444,26 @@ class SQLTextEdit(QTextEdit):
     def get_current_word(self):
         """Get the word currently being typed"""
         cursor = self.textCursor()
+        key = (cursor.blockNumber(), cursor.positionInBlock())
+        if key == self._word_cache[0]:
+            return self._word_cache[1]
         cursor.select(QTextCursor.SelectionType.WordUnderCursor)
-        return cursor.selectedText()
+        word = cursor.selectedText()
+        self._word_cache = (key, word)
+        return word
         
     def on_text_changed(self):
-        """Handle text changes for auto-completion"""
+        """Handle text changes for auto-completion once typing pauses"""
+        # Edits invalidate the cached word; cursor moves are covered by its (block, position) key
+        self._word_cache = (None, None)
+        self._complete_timer.start()
+        
+    def _do_complete(self):
+        """Show or hide the completion popup for the word under the cursor"""
         current_word = self.get_current_word()
         
-        # Only show completions if we have at least 2 characters
-        if len(current_word) >= 2:
-            self.completer.setCompletionPrefix(current_word)
+        # Only show completions if we have at least 2 characters and something matches
+        if len(current_word) >= 2 and self.completer.filter_prefix(current_word):
             
             # Position the completion popup
             cursor_rect = self.cursorRect()
@@ -342,6 +481,12 @@ class SQLTextEdit(QTextEdit):
             
     def keyPressEvent(self, event):
         """Handle key press events"""
+        # A pending completion is stale once the user escapes or navigates away
+        if event.key() in (Qt.Key.Key_Escape, Qt.Key.Key_Left, Qt.Key.Key_Right, Qt.Key.Key_Up,
+                           Qt.Key.Key_Down, Qt.Key.Key_Home, Qt.Key.Key_End,
+                           Qt.Key.Key_PageUp, Qt.Key.Key_PageDown):
+            self._complete_timer.stop()
+        
         # Handle special keys for completion
         if self.completer.popup().isVisible():
             if event.key() in (Qt.Key.Key_Enter, Qt.Key.Key_Return, Qt.Key.Key_Tab):
@@ -409,148 +554,201 @@ class SQLTextEdit(QTextEdit):
             self.completer.update_column_names(column_names)
 
 # SQL Syntax Highlighter
+_IDENT_RE = re.compile(r"\b[A-Za-z_][A-Za-z0-9_]*")
+
+def _add_word_formats(word_formats, phrase_formats, words, format_obj):
+    """Map each single word to its format, later categories winning; phrases like GROUP BY are kept whole"""
+    for word in words:
+        if ' ' in word:
+            phrase_formats[word.upper()] = format_obj
+        else:
+            word_formats[word.upper()] = format_obj
+
+def _phrase_rules(word_formats, phrase_formats):
+    """Whole-phrase rules for the phrases whose words are not all highlighted on their own (GROUP BY, LEFT JOIN)"""
+    by_format = {}
+    for phrase, format_obj in phrase_formats.items():
+        words = phrase.split()
+        if not all(word in word_formats for word in words):
+            by_format.setdefault(id(format_obj), (format_obj, []))[1].append("\\s+".join(words))
+    option = QRegularExpression.PatternOption.CaseInsensitiveOption
+    return [(QRegularExpression(f"\\b(?:{'|'.join(patterns)})\\b", option), format_obj)
+            for format_obj, patterns in by_format.values()]
+
+def _char_format(color, bold=False, italic=False):
+    """A highlight format with the given foreground color and weight/style"""
+    format_obj = QTextCharFormat()
+    format_obj.setForeground(color)
+    if bold:
+        format_obj.setFontWeight(QFont.Weight.Bold)
+    if italic:
+        format_obj.setFontItalic(True)
+    return format_obj
+
+def _build_sql_rules():
+    """Build the word -> format table, the (regex, format) rules and multi-line comment setup shared by every editor"""
+    rules = []
+    word_formats = {}
+    phrase_formats = {}
+
+    # SQL Keywords (Primary commands) - Most important, put first
+    keyword_format = SQLHighlighter.KEYWORD_FMT
+    
+    sql_keywords = [
+        'SELECT', 'FROM', 'WHERE', 'INSERT', 'UPDATE', 'DELETE', 'CREATE', 'ALTER', 'DROP',
+        'TRUNCATE', 'BEGIN', 'COMMIT', 'ROLLBACK', 'DISTINCT', 'AS', 'INTO', 'VALUES', 'SET',
+        'GROUP BY', 'ORDER BY', 'HAVING', 'LIMIT', 'OFFSET', 'UNION', 'UNION ALL',
+        'INTERSECT', 'EXCEPT', 'WITH', 'RECURSIVE'
+    ]
+    
+    _add_word_formats(word_formats, phrase_formats, sql_keywords, keyword_format)
+
+    # SQL Operators and Logic
+    operator_format = SQLHighlighter.OP_FMT
+    
+    operators = [
+        'AND', 'OR', 'NOT', 'IN', 'LIKE', 'BETWEEN', 'EXISTS', 'IS', 'NULL',
+        'IS NULL', 'IS NOT NULL', 'ALL', 'ANY', 'SOME'
+    ]
+    
+    _add_word_formats(word_formats, phrase_formats, operators, operator_format)
+
+    # Operator symbols
+    operator_symbols = ['=', '!=', '<>', '<', '>', '<=', '>=', '\\+', '-', '\\*', '/', '%']
+    rules.append((QRegularExpression("|".join(sorted(operator_symbols, key=len, reverse=True))), operator_format))
+
+    # SQL Functions
+    function_format = SQLHighlighter.FUNC_FMT
+    
+    functions = [
+        'COUNT', 'SUM', 'AVG', 'MAX', 'MIN', 'GROUP_CONCAT', 'COALESCE', 'NULLIF',
+        'CAST', 'CONVERT', 'SUBSTRING', 'SUBSTR', 'LENGTH', 'UPPER', 'LOWER',
+        'TRIM', 'LTRIM', 'RTRIM', 'REPLACE', 'NOW', 'CURRENT_DATE', 'CURRENT_TIME'
+    ]
+    
+    _add_word_formats(word_formats, phrase_formats, functions, function_format)
+
+    # JOIN keywords
+    join_format = SQLHighlighter.JOIN_FMT
+    
+    joins = ['JOIN', 'INNER JOIN', 'LEFT JOIN', 'RIGHT JOIN', 'FULL JOIN', 'CROSS JOIN', 'ON', 'USING']
+    _add_word_formats(word_formats, phrase_formats, joins, join_format)
+
+    # Data Types
+    datatype_format = SQLHighlighter.DT_FMT
+    
+    datatypes = [
+        'INTEGER', 'INT', 'BIGINT', 'SMALLINT', 'TINYINT', 'VARCHAR', 'CHAR', 'TEXT',
+        'REAL', 'FLOAT', 'DOUBLE', 'NUMERIC', 'DECIMAL', 'DATE', 'TIME', 'TIMESTAMP',
+        'DATETIME', 'BOOLEAN', 'BOOL', 'BLOB', 'BINARY'
+    ]
+    
+    _add_word_formats(word_formats, phrase_formats, datatypes, datatype_format)
+
+    # Phrases go before the other rules, so strings and comments still override them
+    rules[:0] = _phrase_rules(word_formats, phrase_formats)
+
+    # String literals (quoted strings)
+    string_format = SQLHighlighter.STRING_FMT
+    
+    # Single quoted strings
+    rules.append((QRegularExpression("'[^']*'"), string_format))
+    # Double quoted strings
+    rules.append((QRegularExpression('"[^"]*"'), string_format))
+
+    # Numbers
+    number_format = SQLHighlighter.NUM_FMT
+    
+    # Decimal numbers
+    rules.append((QRegularExpression("\\b\\d+\\.\\d+\\b"), number_format))
+    # Integer numbers
+    rules.append((QRegularExpression("\\b\\d+\\b"), number_format))
+
+    # Comments
+    comment_format = SQLHighlighter.COMMENT_FMT
+    
+    # Single line comments
+    rules.append((QRegularExpression("--[^\n]*"), comment_format))
+    
+    # Multi-line comment setup
+    multiline_comment_format = SQLHighlighter.MULTI_COMMENT_FMT
+    comment_start_expression = QRegularExpression("/\\*")
+    comment_end_expression = QRegularExpression("\\*/")
+    
+    return word_formats, rules, multiline_comment_format, comment_start_expression, comment_end_expression
+
 class SQLHighlighter(QSyntaxHighlighter):
+    # One format object per category, shared by every rule and every highlighter
+    KEYWORD_FMT = _char_format(QColor(198, 120, 221), bold=True)     # Purple
+    OP_FMT = _char_format(QColor(86, 182, 194), bold=True)           # Cyan
+    FUNC_FMT = _char_format(QColor(97, 175, 239), bold=True)         # Blue
+    JOIN_FMT = _char_format(QColor(75, 160, 240), bold=True)         # Accent blue
+    DT_FMT = _char_format(QColor(209, 154, 102), bold=True)          # Tan
+    STRING_FMT = _char_format(QColor(152, 195, 121), italic=True)    # Green
+    NUM_FMT = _char_format(QColor(229, 192, 123), bold=True)         # Orange
+    COMMENT_FMT = _char_format(QColor(128, 128, 128), italic=True)   # Gray
+    MULTI_COMMENT_FMT = COMMENT_FMT
+    
+    # Compiled once on first use and shared by all highlighters
+    _WORD_FORMATS = None
+    _RULES = None
+    _MULTILINE_FMT = None
+    _COMMENT_START = None
+    _COMMENT_END = None
+    # Lines whose single-line spans are remembered, so rehighlighting an unchanged line skips the rules
+    _SPAN_CACHE_SIZE = 2000
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.highlighting_rules = []
+        self._span_cache = OrderedDict()
         self.setup_highlighting_rules()
 
     def setup_highlighting_rules(self):
-        # Clear existing rules
-        self.highlighting_rules = []
-
-        # SQL Keywords (Primary commands) - Most important, put first
-        keyword_format = QTextCharFormat()
-        keyword_format.setForeground(QColor(198, 120, 221))  # Purple - explicit color
-        keyword_format.setFontWeight(QFont.Weight.Bold)
-        
-        sql_keywords = [
-            'SELECT', 'FROM', 'WHERE', 'INSERT', 'UPDATE', 'DELETE', 'CREATE', 'ALTER', 'DROP',
-            'TRUNCATE', 'BEGIN', 'COMMIT', 'ROLLBACK', 'DISTINCT', 'AS', 'INTO', 'VALUES', 'SET',
-            'GROUP BY', 'ORDER BY', 'HAVING', 'LIMIT', 'OFFSET', 'UNION', 'UNION ALL',
-            'INTERSECT', 'EXCEPT', 'WITH', 'RECURSIVE'
-        ]
-        
-        for keyword in sql_keywords:
-            # Use word boundaries to match whole words only
-            pattern = f"\\b{keyword}\\b"
-            regex = QRegularExpression(pattern, QRegularExpression.CaseInsensitiveOption)
-            self.highlighting_rules.append((regex, keyword_format))
-
-        # SQL Operators and Logic
-        operator_format = QTextCharFormat()
-        operator_format.setForeground(QColor(86, 182, 194))  # Cyan - explicit color
-        operator_format.setFontWeight(QFont.Weight.Bold)
-        
-        operators = [
-            'AND', 'OR', 'NOT', 'IN', 'LIKE', 'BETWEEN', 'EXISTS', 'IS', 'NULL',
-            'IS NULL', 'IS NOT NULL', 'ALL', 'ANY', 'SOME'
-        ]
-        
-        for operator in operators:
-            pattern = f"\\b{operator}\\b"
-            regex = QRegularExpression(pattern, QRegularExpression.CaseInsensitiveOption)
-            self.highlighting_rules.append((regex, operator_format))
-
-        # Operator symbols
-        operator_symbols = ['=', '!=', '<>', '<', '>', '<=', '>=', '\\+', '-', '\\*', '/', '%']
-        for symbol in operator_symbols:
-            regex = QRegularExpression(symbol)
-            self.highlighting_rules.append((regex, operator_format))
+        if SQLHighlighter._RULES is None:
+            (SQLHighlighter._WORD_FORMATS, SQLHighlighter._RULES, SQLHighlighter._MULTILINE_FMT,
+             SQLHighlighter._COMMENT_START, SQLHighlighter._COMMENT_END) = _build_sql_rules()
+        self.word_formats = SQLHighlighter._WORD_FORMATS
+        self.highlighting_rules = SQLHighlighter._RULES
+        self.multiline_comment_format = SQLHighlighter._MULTILINE_FMT
+        self.comment_start_expression = SQLHighlighter._COMMENT_START
+        self.comment_end_expression = SQLHighlighter._COMMENT_END
 
-        # SQL Functions
-        function_format = QTextCharFormat()
-        function_format.setForeground(QColor(97, 175, 239))  # Blue - explicit color
-        function_format.setFontWeight(QFont.Weight.Bold)
-        
-        functions = [
-            'COUNT', 'SUM', 'AVG', 'MAX', 'MIN', 'GROUP_CONCAT', 'COALESCE', 'NULLIF',
-            'CAST', 'CONVERT', 'SUBSTRING', 'SUBSTR', 'LENGTH', 'UPPER', 'LOWER',
-            'TRIM', 'LTRIM', 'RTRIM', 'REPLACE', 'NOW', 'CURRENT_DATE', 'CURRENT_TIME'
-        ]
-        
-        for function in functions:
-            pattern = f"\\b{function}\\b"
-            regex = QRegularExpression(pattern, QRegularExpression.CaseInsensitiveOption)
-            self.highlighting_rules.append((regex, function_format))
-
-        # JOIN keywords
-        join_format = QTextCharFormat()
-        join_format.setForeground(QColor(75, 160, 240))  # Accent blue - explicit color
-        join_format.setFontWeight(QFont.Weight.Bold)
-        
-        joins = ['JOIN', 'INNER JOIN', 'LEFT JOIN', 'RIGHT JOIN', 'FULL JOIN', 'CROSS JOIN', 'ON', 'USING']
-        for join in joins:
-            pattern = f"\\b{join}\\b"
-            regex = QRegularExpression(pattern, QRegularExpression.CaseInsensitiveOption)
-            self.highlighting_rules.append((regex, join_format))
-
-        # Data Types
-        datatype_format = QTextCharFormat()
-        datatype_format.setForeground(QColor(209, 154, 102))  # Tan - explicit color
-        datatype_format.setFontWeight(QFont.Weight.Bold)
-        
-        datatypes = [
-            'INTEGER', 'INT', 'BIGINT', 'SMALLINT', 'TINYINT', 'VARCHAR', 'CHAR', 'TEXT',
-            'REAL', 'FLOAT', 'DOUBLE', 'NUMERIC', 'DECIMAL', 'DATE', 'TIME', 'TIMESTAMP',
-            'DATETIME', 'BOOLEAN', 'BOOL', 'BLOB', 'BINARY'
-        ]
+    def compute_spans(self, text):
+        """Run the single-line rules over a line and return its (start, length, format) spans in apply order"""
+        spans = []
+        
+        # Keywords, operators, functions, joins and datatypes: one tokenizing pass with dict lookups
+        word_formats = self.word_formats
+        for match in _IDENT_RE.finditer(text):
+            format_obj = word_formats.get(match.group().upper())
+            if format_obj is not None:
+                spans.append((match.start(), match.end() - match.start(), format_obj))
+        
+        # Apply the remaining single-line highlighting rules (symbols, strings, numbers, comments)
+        for pattern, format_obj in self.highlighting_rules:
+            match_iterator = pattern.globalMatch(text)
+            while match_iterator.hasNext():
+                match = match_iterator.next()
+                spans.append((match.capturedStart(), match.capturedLength(), format_obj))
         
-        for datatype in datatypes:
-            pattern = f"\\b{datatype}\\b"
-            regex = QRegularExpression(pattern, QRegularExpression.CaseInsensitiveOption)
-            self.highlighting_rules.append((regex, datatype_format))
-
-        # String literals (quoted strings)
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor(152, 195, 121))  # Green - explicit color
-        string_format.setFontItalic(True)
-        
-        # Single quoted strings
-        self.highlighting_rules.append((QRegularExpression("'[^']*'"), string_format))
-        # Double quoted strings
-        self.highlighting_rules.append((QRegularExpression('"[^"]*"'), string_format))
-
-        # Numbers
-        number_format = QTextCharFormat()
-        number_format.setForeground(QColor(229, 192, 123))  # Orange - explicit color
-        number_format.setFontWeight(QFont.Weight.Bold)
-        
-        # Decimal numbers
-        self.highlighting_rules.append((QRegularExpression("\\b\\d+\\.\\d+\\b"), number_format))
-        # Integer numbers
-        self.highlighting_rules.append((QRegularExpression("\\b\\d+\\b"), number_format))
-
-        # Comments
-        comment_format = QTextCharFormat()
-        comment_format.setForeground(QColor(128, 128, 128))  # Gray - explicit color
-        comment_format.setFontItalic(True)
-        
-        # Single line comments
-        self.highlighting_rules.append((QRegularExpression("--[^\n]*"), comment_format))
-        
-        # Multi-line comment setup
-        self.multiline_comment_format = QTextCharFormat()
-        self.multiline_comment_format.setForeground(QColor(128, 128, 128))  # Gray - explicit color
-        self.multiline_comment_format.setFontItalic(True)
-        self.comment_start_expression = QRegularExpression("/\\*")
-        self.comment_end_expression = QRegularExpression("\\*/")
+        return spans
 
     def highlightBlock(self, text):
         # Debug: Print what we're highlighting (comment out in production)
         # print(f"Highlighting text: '{text}'")
         
-        # Apply single-line highlighting rules
-        for pattern, format_obj in self.highlighting_rules:
-            match_iterator = pattern.globalMatch(text)
-            while match_iterator.hasNext():
-                match = match_iterator.next()
-                start = match.capturedStart()
-                length = match.capturedLength()
-                matched_text = text[start:start+length]
-                # Debug: Print matches (comment out in production)
-                # print(f"  Matched: '{matched_text}' at {start}-{start+length}")
-                self.setFormat(start, length, format_obj)
+        # Single-line spans depend only on the line's text, so replay them when the line is unchanged
+        spans = self._span_cache.get(text)
+        if spans is None:
+            spans = self.compute_spans(text)
+            self._span_cache[text] = spans
+            if len(self._span_cache) > self._SPAN_CACHE_SIZE:
+                self._span_cache.popitem(last=False)
+        else:
+            self._span_cache.move_to_end(text)
+        
+        for start, length, format_obj in spans:
+            self.setFormat(start, length, format_obj)
 
         # Handle multi-line comments
         self.setCurrentBlockState(0)
@@ -592,7 +790,7 @@ class LazyLoadTableModel(QAbstractTableModel):
         self.chunk_size = chunk_size or settings.value('chunk_size', 1000, type=int)
         self.max_cache_size = settings.value('max_cache_chunks', 50, type=int)
         
-        # Cache for loaded chunks: {start_row: DataFrame}
+        # Cache for loaded chunks: {start_row: 2-D object ndarray of the chunk's values}
         self.data_cache = {}
         
         # Metadata
@@ -665,13 +863,14 @@ class LazyLoadTableModel(QAbstractTableModel):
             else:
                 df = pd.DataFrame()  # Fallback
             
-            # Cache the chunk
-            self.data_cache[start_row] = df
-            return df
+            # Cache the chunk as a plain array so cell lookups skip pandas indexing
+            values = df.to_numpy(dtype=object)
+            self.data_cache[start_row] = values
+            return values
             
         except Exception as e:
             print(f"Error loading chunk at row {start_row}: {e}")
-            return pd.DataFrame()
+            return np.empty((0, 0), dtype=object)
     
     def rowCount(self, parent=QModelIndex()):
         return self.total_rows
@@ -692,18 +891,18 @@ class LazyLoadTableModel(QAbstractTableModel):
         if role == Qt.ItemDataRole.DisplayRole:
             # Determine which chunk this row belongs to
             chunk_start = self._get_chunk_start(row)
-            chunk_df = self._load_chunk(chunk_start)
+            chunk_values = self._load_chunk(chunk_start)
             
-            if chunk_df.empty:
+            if chunk_values.size == 0:
                 return "Loading..."
             
             # Get the row within the chunk
             chunk_row = row - chunk_start
-            if chunk_row >= len(chunk_df):
+            if chunk_row >= len(chunk_values):
                 return "Loading..."
             
             try:
-                value = chunk_df.iloc[chunk_row, col]
+                value = chunk_values[chunk_row, col]
                 if pd.isna(value):
                     return "NULL"
                 elif isinstance(value, (float, int)):
@@ -716,13 +915,13 @@ class LazyLoadTableModel(QAbstractTableModel):
         elif role == Qt.ItemDataRole.TextAlignmentRole:
             # Try to get value for alignment
             chunk_start = self._get_chunk_start(row)
-            chunk_df = self._load_chunk(chunk_start)
+            chunk_values = self._load_chunk(chunk_start)
             
-            if not chunk_df.empty:
+            if chunk_values.size:
                 chunk_row = row - chunk_start
-                if chunk_row < len(chunk_df):
+                if chunk_row < len(chunk_values):
                     try:
-                        value = chunk_df.iloc[chunk_row, col]
+                        value = chunk_values[chunk_row, col]
                         if isinstance(value, (int, float)):
                             return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
                     except (IndexError, KeyError):
@@ -779,57 +978,139 @@ class LazyLoadTableModel(QAbstractTableModel):
 
 # Table model for displaying regular query results (backward compatibility)
 class PandasTableModel(QAbstractTableModel):
+    # str() applied element-wise in one C loop, producing Python strings rather than fixed-width unicode
+    _STR_UFUNC = np.frompyfunc(str, 1, 1)
+    # Roles as plain ints, so data() compares ints instead of enum members
+    _ROLE_DISPLAY = int(Qt.ItemDataRole.DisplayRole)
+    _ROLE_ALIGN = int(Qt.ItemDataRole.TextAlignmentRole)
+    
     def __init__(self, data=None):
         super().__init__()
         self._data = pd.DataFrame() if data is None else data
+        self._build_display_cache()
+
+    def _build_display_cache(self):
+        """Stringify every cell and work out column alignment once, so data() is a plain array lookup"""
+        self._str = self._display_strings(self._data)
+        self._rows = len(self._data)
+        self._pending = []  # Streamed chunks not yet concatenated onto _data
+        self._isnum = self._numeric_columns(self._data)
+        self._align = self._alignments(self._isnum)
+        self._columns_str = self._data.columns.astype(str).tolist()
+        # Display row -> row of _data; sorting only reorders this, never the frame or its strings
+        self._row_perm = np.arange(self._rows)
+        self._sort_key = None  # (column, order) of the active sort, re-applied when rows are appended
+
+    @staticmethod
+    def _numeric_columns(df):
+        """Which columns hold numbers (and so align right)"""
+        return np.array([pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+                         for dtype in df.dtypes], dtype=bool)
+
+    @staticmethod
+    def _alignments(isnum):
+        """Text alignment flag for each column, as plain ints"""
+        return np.where(isnum,
+                        int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter),
+                        int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)).tolist()
+
+    @staticmethod
+    def _display_strings(df):
+        """2-D object array of the frame's cells as display text, with NULL for missing values"""
+        strings = PandasTableModel._STR_UFUNC(df.to_numpy(dtype=object))
+        strings[df.isna().to_numpy()] = "NULL"
+        return strings
+
+    def _frame(self):
+        """The whole result, concatenating the streamed chunks once, when it is first needed"""
+        if self._pending:
+            self._data = pd.concat([self._data, *self._pending], ignore_index=True)
+            self._pending = []
+        return self._data
+
+    def append_rows(self, df):
+        """Append a streamed chunk of rows, stringifying only the new ones"""
+        if df.empty:
+            return
+        first = self._rows
+        last = first + len(df)
+        self.beginInsertRows(QModelIndex(), first, last - 1)
+        if last > len(self._str):
+            # Grow the string buffer geometrically, so streaming n rows copies O(n) cells in total
+            grown = np.empty((max(2 * len(self._str), last), self._str.shape[1]), dtype=object)
+            grown[:first] = self._str[:first]
+            self._str = grown
+            if self._sort_key is None:
+                self._row_perm = np.arange(len(grown))
+        self._str[first:last] = self._display_strings(df)
+        self._pending.append(df)
+        self._rows = last
+        self.endInsertRows()
+        
+        # A column stays right-aligned only while every chunk holds numbers, as after a concat
+        isnum = self._isnum & self._numeric_columns(df)
+        if not np.array_equal(isnum, self._isnum):
+            self._isnum = isnum
+            self._align = self._alignments(isnum)
+            self.dataChanged.emit(self.index(0, 0), self.index(last - 1, len(self._columns_str) - 1),
+                                  [Qt.ItemDataRole.TextAlignmentRole])
+        
+        # Rows streamed in after the user sorted would otherwise sit unsorted at the bottom
+        if self._sort_key is not None:
+            self.sort(*self._sort_key)
+
+    def display_frame(self):
+        """The results in the order they are shown, for export"""
+        if self._sort_key is None:
+            return self._frame()
+        return self._frame().iloc[self._row_perm]
 
     def rowCount(self, parent=QModelIndex()):
-        return len(self._data)
+        return self._rows
 
     def columnCount(self, parent=QModelIndex()):
-        return len(self._data.columns)
+        return len(self._columns_str)
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         if not index.isValid():
             return None
             
-        if role == Qt.ItemDataRole.DisplayRole:
-            value = self._data.iloc[index.row(), index.column()]
-            if pd.isna(value):
-                return "NULL"
-            elif isinstance(value, (float, int)):
-                return str(value)
-            else:
-                return str(value)
-                
-        elif role == Qt.ItemDataRole.TextAlignmentRole:
-            value = self._data.iloc[index.row(), index.column()]
-            if isinstance(value, (int, float)):
-                return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            return int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-                
+        role = int(role)
+        if role == self._ROLE_DISPLAY:
+            return self._str[self._row_perm[index.row()], index.column()]
+        if role == self._ROLE_ALIGN:
+            return self._align[index.column()]
         return None
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if role == Qt.ItemDataRole.DisplayRole:
             if orientation == Qt.Orientation.Horizontal:
-                return str(self._data.columns[section])
+                return self._columns_str[section]
             else:
                 return str(section + 1)
         return None
 
     def sort(self, column, order):
         self.layoutAboutToBeChanged.emit()
-        self._data = self._data.sort_values(
-            self._data.columns[column],
-            ascending=(order == Qt.SortOrder.AscendingOrder)
-        )
+        if column < 0:
+            # Qt asks for column -1 to clear the sort: back to the query's own row order
+            self._sort_key = None
+            self._row_perm = np.arange(len(self._str))
+        else:
+            self._sort_key = (column, order)
+            # Sort one column's row positions (stable, NULLs last) instead of copying the whole frame
+            values = self._frame().iloc[:, column].reset_index(drop=True)
+            self._row_perm = values.sort_values(
+                ascending=(order == Qt.SortOrder.AscendingOrder),
+                kind='stable'
+            ).index.to_numpy()
         self.layoutChanged.emit()
 
 # Enhanced query worker that supports both lazy and regular loading
 class EnhancedQueryWorker(QThread):
     # Signals for regular loading
-    finished = pyqtSignal(object, float)  # DataFrame, execution_time
+    chunk_ready = pyqtSignal(object)  # DataFrame of the next QUERY_CHUNK_SIZE rows
+    finished = pyqtSignal(object, float)  # total_rows, execution_time
     error = pyqtSignal(str)
     
     # Signals for lazy loading
@@ -845,7 +1126,7 @@ class EnhancedQueryWorker(QThread):
         
     def run(self):
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
             if self.use_lazy_loading:
                 # Check if we should use lazy loading by estimating row count
@@ -854,18 +1135,34 @@ class EnhancedQueryWorker(QThread):
                 if should_use_lazy:
                     # Create lazy loading model
                     lazy_model = LazyLoadTableModel(self.connection, self.query)
-                    execution_time = (datetime.now() - start_time).total_seconds()
+                    execution_time = time.perf_counter() - start_time
                     self.lazy_finished.emit(lazy_model, execution_time)
                     return
             
-            # Regular loading for smaller results
-            if isinstance(self.connection, sqlite3.Connection) or isinstance(self.connection, duckdb.DuckDBPyConnection):
-                df = pd.read_sql_query(self.query, self.connection)
+            # Regular loading for smaller results, streamed so the table fills while the rest is read
+            total_rows = 0
+            if isinstance(self.connection, duckdb.DuckDBPyConnection):
+                # DuckDB builds each chunk's DataFrame natively from its columnar result,
+                # skipping pandas' generic cursor path and its per-row tuples
+                result = self.connection.execute(self.query)
+                vectors_per_chunk = max(1, QUERY_CHUNK_SIZE // 2048)  # DuckDB vectors hold 2048 rows
+                while True:
+                    df_chunk = result.fetch_df_chunk(vectors_per_chunk)
+                    if df_chunk.empty and total_rows:
+                        break
+                    total_rows += len(df_chunk)
+                    self.chunk_ready.emit(df_chunk)
+                    if df_chunk.empty:
+                        break  # Empty result: the one empty chunk still carries the column names
+            elif isinstance(self.connection, sqlite3.Connection):
+                for df_chunk in pd.read_sql_query(self.query, self.connection, chunksize=QUERY_CHUNK_SIZE):
+                    total_rows += len(df_chunk)
+                    self.chunk_ready.emit(df_chunk)
             else:
                 raise ValueError("Unsupported database connection type")
                 
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self.finished.emit(df, execution_time)
+            execution_time = time.perf_counter() - start_time
+            self.finished.emit(total_rows, execution_time)
             
         except Exception as e:
             self.error.emit(str(e))
@@ -905,14 +1202,16 @@ class QueryWorker(QThread):
         
     def run(self):
         try:
-            start_time = datetime.now()
-            if isinstance(self.connection, sqlite3.Connection) or isinstance(self.connection, duckdb.DuckDBPyConnection):
+            start_time = time.perf_counter()
+            if isinstance(self.connection, duckdb.DuckDBPyConnection):
+                df = self.connection.execute(self.query).fetch_df()
+            elif isinstance(self.connection, sqlite3.Connection):
                 df = pd.read_sql_query(self.query, self.connection)
             else:
                 # Handle other database types if needed
                 raise ValueError("Unsupported database connection type")
                 
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             self.finished.emit(df, execution_time)
         except Exception as e:
             self.error.emit(str(e))
@@ -923,15 +1222,36 @@ class ImportWorker(QThread):
     finished = pyqtSignal(bool, str)  # success, message
     error = pyqtSignal(str)
     
+    # Minimum seconds between progress signals, so fast imports don't flood the UI thread's event queue
+    PROGRESS_INTERVAL = 0.05
+    # Counts inside a message; messages that differ only in these are updates of the same stage
+    _COUNT_RE = re.compile(r'\d[\d,.]*')
+    
     def __init__(self, main_app, import_info):
         super().__init__()
         self.main_app = main_app
         self.import_info = import_info
-        self.cancelled = False
+        self._cancel_requested = threading.Event()
+        self._last_emit = 0.0
+        self._last_stage = None
+    
+    def report_progress(self, percent, message):
+        """Emit progress at most every PROGRESS_INTERVAL seconds; new stages and 100% always get through"""
+        now = time.perf_counter()
+        stage = self._COUNT_RE.sub('#', message)
+        if percent >= 100 or stage != self._last_stage or now - self._last_emit >= self.PROGRESS_INTERVAL:
+            self._last_emit = now
+            self._last_stage = stage
+            self.progress.emit(percent, message)
+    
+    @property
+    def cancelled(self):
+        """True once cancellation has been requested"""
+        return self._cancel_requested.is_set()
     
     def cancel(self):
         """Cancel the import operation"""
-        self.cancelled = True
+        self._cancel_requested.set()
     
     def run(self):
         try:
@@ -947,9 +1267,405 @@ class ImportWorker(QThread):
                 self.finished.emit(False, "Import failed. Check console for details.")
                 
         except Exception as e:
-            if not self.cancelled:
+            if self.cancelled:
+                self.finished.emit(False, "Import was cancelled by user.")
+            else:
                 self.error.emit(f"Import error: {str(e)}")
 
+class ExportWorker(QThread):
+    """Worker thread that streams query results (or an in-memory frame) to disk batch by batch"""
+    progress = pyqtSignal(int, str)  # progress percentage, status message
+    finished = pyqtSignal(bool, str)  # success, message
+    error = pyqtSignal(str)
+
+    BATCH_SIZE = 65536
+
+    def __init__(self, connection, query, file_path, format_type, total_rows=0, frame=None):
+        super().__init__()
+        self.connection = connection
+        self.query = query
+        self.frame = frame  # Results already in memory; used instead of re-running the query
+        self.file_path = file_path
+        self.format_type = format_type
+        self.total_rows = total_rows
+        self.rows_written = 0
+        self._cancel_requested = threading.Event()
+
+    @property
+    def cancelled(self):
+        """True once cancellation has been requested"""
+        return self._cancel_requested.is_set()
+
+    def cancel(self):
+        """Cancel the export operation"""
+        self._cancel_requested.set()
+
+    def run(self):
+        try:
+            self.progress.emit(0, "Starting export...")
+
+            if self.format_type == 'parquet':
+                self._export_parquet()
+            elif self.format_type in ('csv', 'tsv'):
+                self._export_delimited('\t' if self.format_type == 'tsv' else ',')
+            else:
+                self._export_frame()
+
+            if self.cancelled:
+                self.finished.emit(False, "Export was cancelled by user.")
+            else:
+                self.progress.emit(100, "Export completed successfully!")
+                self.finished.emit(True, f"{self.rows_written:,} rows exported to {os.path.basename(self.file_path)}")
+
+        except Exception as e:
+            if not self.cancelled:
+                self.error.emit(f"Export error: {str(e)}")
+
+    def _report_batch(self, batch_rows):
+        """Emit progress after a batch has been written"""
+        self.rows_written += batch_rows
+        if self.total_rows:
+            percent = min(99, int(self.rows_written * 100 / self.total_rows))
+        else:
+            percent = 50
+        self.progress.emit(percent, f"Exported {self.rows_written:,} rows...")
+
+    def _iter_row_batches(self):
+        """Yield (columns, rows) batches from a DB-API cursor"""
+        if self.frame is not None:
+            columns = [str(col) for col in self.frame.columns]
+            for start in range(0, len(self.frame), 10000):
+                if self.cancelled:
+                    break
+                yield columns, list(self.frame.iloc[start:start + 10000].itertuples(index=False, name=None))
+            return
+        
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(self.query)
+            columns = [desc[0] for desc in cursor.description]
+            while not self.cancelled:
+                rows = cursor.fetchmany(10000)
+                if not rows:
+                    break
+                yield columns, rows
+        finally:
+            cursor.close()
+
+    def _frame_table(self):
+        """Convert the in-memory frame to Arrow, stringifying object columns whose mixed types Arrow rejects"""
+        try:
+            return pa.Table.from_pandas(self.frame, preserve_index=False, nthreads=os.cpu_count())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            columns = {}
+            for i, col in enumerate(self.frame.columns):
+                values = self.frame.iloc[:, i]
+                if values.dtype == object:
+                    values = values.where(values.isna(), values.astype(str))
+                columns[str(col)] = values
+            return pa.Table.from_pandas(pd.DataFrame(columns), preserve_index=False, nthreads=os.cpu_count())
+
+    def _record_batch_source(self):
+        """Return (schema, record batches), with the schema known before the first batch"""
+        if self.frame is not None:
+            table = self._frame_table()
+            return table.schema, self._iter_table_batches(table)
+        if isinstance(self.connection, duckdb.DuckDBPyConnection):
+            cursor = self.connection.cursor()
+            try:
+                reader = cursor.execute(self.query).fetch_record_batch(self.BATCH_SIZE)
+            except Exception:
+                cursor.close()
+                raise
+            return reader.schema, self._iter_table_batches(reader, cursor)
+        
+        # SQLite values are typed per row, so one chunk can't fix a column's type; export every column as text
+        cursor = self.connection.cursor()
+        cursor.execute(self.query)
+        schema = pa.schema([(desc[0], pa.string()) for desc in cursor.description])
+        return schema, self._iter_sqlite_batches(cursor, schema)
+
+    def _iter_table_batches(self, source, cursor=None):
+        """Yield the record batches of an Arrow table or batch reader until cancelled, then close its cursor"""
+        batches = source.to_batches(max_chunksize=self.BATCH_SIZE) if isinstance(source, pa.Table) else source
+        try:
+            for batch in batches:
+                if self.cancelled:
+                    break
+                yield batch
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+    def _iter_sqlite_batches(self, cursor, schema):
+        """Yield text record batches from an executed SQLite cursor"""
+        try:
+            while not self.cancelled:
+                rows = cursor.fetchmany(10000)
+                if not rows:
+                    break
+                arrays = [
+                    pa.array([None if value is None else str(value) for value in column], type=pa.string())
+                    for column in zip(*rows)
+                ]
+                yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+        finally:
+            cursor.close()
+
+    def _export_delimited(self, delimiter):
+        """Stream results into a CSV/TSV file"""
+        batches = None
+        if PYARROW_AVAILABLE:
+            try:
+                schema, batches = self._record_batch_source()
+            except (pa.ArrowInvalid, pa.ArrowTypeError, ValueError) as e:
+                # e.g. duplicate column names; the csv module below copes with anything
+                logger.info("Arrow conversion failed, exporting with the csv module: %s", e)
+
+        if batches is not None:
+            # Open the writer from the schema up front, so empty results still get a header
+            writer = pa_csv.CSVWriter(
+                self.file_path, schema,
+                write_options=pa_csv.WriteOptions(delimiter=delimiter)
+            )
+            try:
+                for batch in batches:
+                    writer.write_batch(batch)
+                    self._report_batch(batch.num_rows)
+            finally:
+                writer.close()
+            return
+
+        # Fallback: plain csv module writer fed from fetchmany()
+        with open(self.file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, delimiter=delimiter)
+            header_written = False
+            if self.frame is not None:
+                # The frame's columns are known up front, so the header is written even with no rows
+                writer.writerow([str(col) for col in self.frame.columns])
+                header_written = True
+            for columns, rows in self._iter_row_batches():
+                if not header_written:
+                    writer.writerow(columns)
+                    header_written = True
+                writer.writerows(rows)
+                self._report_batch(len(rows))
+
+    def _export_parquet(self):
+        """Stream results into a Parquet file"""
+        if not PYARROW_AVAILABLE:
+            raise ValueError("Parquet export requires the 'pyarrow' package.")
+
+        schema, batches = self._record_batch_source()
+        writer = pq.ParquetWriter(self.file_path, schema)
+        try:
+            for batch in batches:
+                writer.write_batch(batch)
+                self._report_batch(batch.num_rows)
+        finally:
+            writer.close()
+
+    def _export_frame(self):
+        """Write the in-memory frame in formats that are built whole (Excel, JSON, HTML, XML)"""
+        df = self.frame
+        
+        if self.format_type == 'excel':
+            from openpyxl.utils import get_column_letter
+            
+            # Size columns from the frame with vectorized string lengths, not by re-reading every written cell
+            widths = []
+            for i, col in enumerate(df.columns):
+                values = df.iloc[:, i]
+                max_length = int(values.astype(str).str.len().max()) if len(values) else 0
+                widths.append(min(max(max_length, len(str(col))) + 2, 50))
+            
+            with pd.ExcelWriter(self.file_path, engine='openpyxl') as writer:
+                df.to_excel(writer, sheet_name='Query Results', index=False)
+                
+                # Auto-adjust column widths
+                worksheet = writer.sheets['Query Results']
+                for i, width in enumerate(widths, start=1):
+                    worksheet.column_dimensions[get_column_letter(i)].width = width
+            
+        elif self.format_type == 'json':
+            df.to_json(self.file_path, orient='records', indent=2, date_format='iso')
+            
+        elif self.format_type == 'html':
+            html_header = f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Query Results</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; }}
+        table {{ border-collapse: collapse; width: 100%; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+        th {{ background-color: #f2f2f2; font-weight: bold; }}
+        tr:nth-child(even) {{ background-color: #f9f9f9; }}
+        .info {{ margin-bottom: 20px; color: #666; }}
+    </style>
+</head>
+<body>
+    <h1>Query Results</h1>
+    <div class="info">
+        <p>Exported on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <p>Rows: {len(df):,} | Columns: {len(df.columns)}</p>
+    </div>
+    """
+            html_footer = """
+</body>
+</html>
+                """
+            # Stream the table straight into a buffered file instead of building the whole page as one string
+            with open(self.file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(html_header)
+                df.to_html(buf=f, index=False, escape=False, classes='results-table')
+                f.write(html_footer)
+            
+        elif self.format_type == 'xml':
+            xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
+            xml_content += '<query_results>\n'
+            xml_content += f'  <metadata>\n'
+            xml_content += f'    <export_date>{pd.Timestamp.now().isoformat()}</export_date>\n'
+            xml_content += f'    <row_count>{len(df)}</row_count>\n'
+            xml_content += f'    <column_count>{len(df.columns)}</column_count>\n'
+            xml_content += f'  </metadata>\n'
+            xml_content += '  <data>\n'
+            
+            for _, row in df.iterrows():
+                xml_content += '    <row>\n'
+                for col in df.columns:
+                    # Clean column name for XML
+                    clean_col = str(col).replace(' ', '_').replace('-', '_')
+                    clean_col = ''.join(c for c in clean_col if c.isalnum() or c == '_')
+                    value = str(row[col]) if pd.notna(row[col]) else ''
+                    # Escape XML special characters
+                    value = value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+                    xml_content += f'      <{clean_col}>{value}</{clean_col}>\n'
+                xml_content += '    </row>\n'
+            
+            xml_content += '  </data>\n'
+            xml_content += '</query_results>'
+            
+            with open(self.file_path, 'w', encoding='utf-8') as f:
+                f.write(xml_content)
+        
+        self._report_batch(len(df))
+
+class FolderLoadWorker(QThread):
+    """Worker thread that parses folder-import files off the UI thread"""
+    progress = pyqtSignal(int, str)  # files completed, status message
+    file_loaded = pyqtSignal(int, str, object)  # file index, file path, DataFrame
+    file_failed = pyqtSignal(str, str)  # file path, error message
+    native_imported = pyqtSignal()  # DuckDB loaded every file itself
+    finished = pyqtSignal()
+    
+    def __init__(self, dialog, files, is_csv, is_single_table, read_options, native_import=None):
+        super().__init__()
+        self.dialog = dialog
+        self.files = files
+        self.is_csv = is_csv
+        self.is_single_table = is_single_table
+        # CSV and sheet options are read from the dialog's widgets on the UI thread, never from run()
+        self.read_options = read_options
+        self.native_import = native_import  # (table name, mode, main app) for a native DuckDB load
+    
+    def run(self):
+        files = self.files
+        
+        # DuckDB can load a whole CSV folder into one table natively, skipping pandas
+        if self.native_import is not None and files:
+            try:
+                self.progress.emit(0, f"Loading {len(files)} files natively with DuckDB...")
+                table_name, mode, main_app = self.native_import
+                if self.dialog.duckdb_native_folder_import(files, table_name, mode, main_app,
+                                                           self.read_options['encoding'], self.read_options['delimiter']):
+                    self.native_imported.emit()
+                    self.progress.emit(len(files), f"Loaded {len(files)} files natively with DuckDB")
+                    files = []
+            except Exception as native_error:
+                print(f"Native DuckDB folder import failed, using pandas: {native_error}")
+        
+        # Read a single-table CSV folder as one pyarrow dataset before falling back to per-file loads
+        if self.is_csv and self.is_single_table and files:
+            try:
+                self.progress.emit(0, f"Loading {len(files)} files with PyArrow...")
+                combined_df = self.dialog.arrow_dataset_folder_load(files, self.read_options['encoding'],
+                                                                    self.read_options['delimiter'])
+                if combined_df is not None:
+                    self.file_loaded.emit(0, files[0], combined_df)
+                    self.progress.emit(len(files), f"Loaded {len(files)} files with PyArrow")
+                    files = []
+            except Exception as dataset_error:
+                print(f"PyArrow dataset folder load failed, loading files one by one: {dataset_error}")
+        
+        # Parse files on a thread pool (pandas/pyarrow release the GIL while parsing)
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            futures = {executor.submit(self.dialog._load_one_file, file_path, self.is_csv, self.is_single_table,
+                                       self.read_options): (i, file_path)
+                       for i, file_path in enumerate(files)}
+            for completed, future in enumerate(as_completed(futures), start=1):
+                i, file_path = futures[future]
+                df, error = future.result()
+                if error:
+                    self.file_failed.emit(file_path, error)
+                else:
+                    self.file_loaded.emit(i, file_path, df)
+                self.progress.emit(completed, f"Loaded {os.path.basename(file_path)} - {completed}/{len(files)}")
+        
+        self.finished.emit()
+
+class TableListWorker(QThread):
+    """Worker thread that lists a DuckDB connection's tables off the UI thread"""
+    tables_loaded = pyqtSignal(object)  # list of table names
+    failed = pyqtSignal(str)  # error message
+    
+    def __init__(self, connection):
+        super().__init__()
+        self.connection = connection
+    
+    def run(self):
+        try:
+            # A cursor gives this thread its own handle on the shared database
+            cursor = self.connection.cursor()
+            try:
+                rows = cursor.execute("SHOW TABLES").fetchall()
+            finally:
+                cursor.close()
+            self.tables_loaded.emit([row[0] for row in rows])
+        except Exception as e:
+            self.failed.emit(str(e))
+
+class FileProbeWorker(QThread):
+    """Worker thread that reads an import file's size, sheets and delimiter off the UI thread"""
+    probed = pyqtSignal(str, object)  # file path, {'size', 'ext', 'sheets' or 'sheet_error', 'delimiter'}
+    failed = pyqtSignal(str, str)  # file path, error message
+    
+    def __init__(self, file_path, detect_delimiter=None):
+        super().__init__()
+        self.file_path = file_path
+        self.detect_delimiter = detect_delimiter
+    
+    def run(self):
+        file_path = self.file_path
+        try:
+            # One stat call; everything else is derived from the path string
+            st = os.stat(file_path)
+            info = {
+                'size': st.st_size / 1024 / 1024,  # Size in MB
+                'ext': os.path.splitext(file_path)[1].lower()
+            }
+            if info['ext'] in ['.xlsx', '.xls']:
+                try:
+                    info['sheets'] = excel_sheet_names(file_path)
+                except Exception as e:
+                    info['sheet_error'] = str(e)
+            elif info['ext'] in ['.csv', '.tsv', '.txt'] and self.detect_delimiter:
+                info['delimiter'] = self.detect_delimiter(file_path)
+            self.probed.emit(file_path, info)
+        except Exception as e:
+            self.failed.emit(file_path, str(e))
+
 class ProgressDialog(QDialog):
     """Progress dialog for long-running operations"""
     
@@ -994,6 +1710,36 @@ class ProgressDialog(QDialog):
         button_layout.addStretch()
         button_layout.addWidget(self.cancel_button)
         layout.addLayout(button_layout)
+        
+        # Coalesce bursts of worker progress signals into at most one repaint per interval
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._flush_progress)
+    
+    def queue_progress(self, value, message):
+        """Throttled variant of update_progress for high-frequency worker signals"""
+        self._pending_progress = (value, message)
+        if value >= 100:
+            self._progress_timer.stop()
+            self._flush_progress()
+        elif not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _flush_progress(self):
+        """Apply the most recent queued progress update"""
+        if self._pending_progress is not None:
+            value, message = self._pending_progress
+            self._pending_progress = None
+            self.update_progress(value, message)
+    
+    def reset(self):
+        """Return the dialog to its initial state so it can be reused"""
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self.progress_bar.setValue(0)
+        self.status_label.setText("Initializing...")
     
     def update_progress(self, value, message):
         """Update progress bar and status message"""
@@ -1002,7 +1748,12 @@ class ProgressDialog(QDialog):
         
         # Auto-close when complete
         if value >= 100:
-            QTimer.singleShot(1000, self.accept)  # Close after 1 second
+            QTimer.singleShot(1000, self._close_if_complete)  # Close after 1 second
+    
+    def _close_if_complete(self):
+        """Close the dialog unless it has been reused for a new operation meanwhile"""
+        if self.isVisible() and self.progress_bar.value() >= 100:
+            self.accept()
 
 # Connection dialog
 class ConnectionDialog(QDialog):
@@ -1056,7 +1807,9 @@ class ConnectionDialog(QDialog):
     def browse_file(self):
         db_type = self.db_type_combo.currentText()
         file_filter = "SQLite Database (*.db *.sqlite);;All Files (*)" if db_type == "SQLite" else "DuckDB Database (*.duckdb);;All Files (*)"
-        file_path, _ = QFileDialog.getOpenFileName(self, "Select Database File", "", file_filter)
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Select Database File", "", file_filter, options=_FILE_DIALOG_OPTIONS
+        )
         if file_path:
             self.file_path_edit.setText(file_path)
     
@@ -1069,7 +1822,7 @@ class ConnectionDialog(QDialog):
             return
         
         # Clean the name (remove invalid characters)
-        name = re.sub(r'[<>:"/\\|?*]', '', name.strip())
+        name = _INVALID_NAME_RE.sub('', name.strip())
         if not name:
             QMessageBox.warning(self, "Invalid Name", "Please enter a valid database name.")
             return
@@ -1103,17 +1856,27 @@ class ConnectionDialog(QDialog):
             if db_type == "SQLite":
                 # Create SQLite database
                 conn = sqlite3.connect(file_path)
-                conn.execute("CREATE TABLE IF NOT EXISTS _metadata (created_at TEXT)")
-                conn.execute("INSERT INTO _metadata (created_at) VALUES (?)", (datetime.now().isoformat(),))
-                conn.commit()
+                # Set the pragmas up front so creation costs a single fsync
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                # The engine stamps the creation time itself
+                conn.executescript(
+                    "BEGIN; "
+                    "CREATE TABLE IF NOT EXISTS _metadata (created_at TEXT); "
+                    "INSERT INTO _metadata (created_at) VALUES (strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')); "
+                    "COMMIT;"
+                )
                 conn.close()
             else:  # DuckDB
-                # Create DuckDB database
-                conn = duckdb.connect(file_path)
-                conn.execute("CREATE TABLE IF NOT EXISTS _metadata (created_at TEXT)")
-                conn.execute("INSERT INTO _metadata (created_at) VALUES (?)", (datetime.now().isoformat(),))
-                conn.commit()
-                conn.close()
+                # Create DuckDB database through the app's staging engine instead of starting a new one
+                stage = self.parent().duckdb_stage()
+                stage.execute("ATTACH '" + file_path.replace("'", "''") + "' AS newdb")
+                try:
+                    stage.execute("CREATE TABLE IF NOT EXISTS newdb._metadata (created_at TEXT)")
+                    stage.execute("INSERT INTO newdb._metadata (created_at) VALUES (strftime(now()::TIMESTAMP, '%Y-%m-%dT%H:%M:%S.%f'))")
+                finally:
+                    stage.execute("DETACH newdb")
             
             # Set the file path in the dialog
             self.file_path_edit.setText(file_path)
@@ -1197,7 +1960,7 @@ class CreateDatabaseDialog(QDialog):
             self.location_edit.setText(default_location)
     
     def browse_location(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Directory")
+        directory = QFileDialog.getExistingDirectory(self, "Select Directory", options=_DIR_DIALOG_OPTIONS)
         if directory:
             self.location_edit.setText(directory)
     
@@ -1215,7 +1978,7 @@ class CreateDatabaseDialog(QDialog):
             return
         
         # Clean the name (remove invalid characters)
-        name = re.sub(r'[<>:"/\\|?*]', '', name)
+        name = _INVALID_NAME_RE.sub('', name)
         if not name:
             QMessageBox.warning(self, "Invalid Name", "Please enter a valid database name.")
             return
@@ -1240,22 +2003,31 @@ class CreateDatabaseDialog(QDialog):
             # Create the database file
             if db_type == "SQLite":
                 conn = sqlite3.connect(file_path)
-                conn.execute("CREATE TABLE IF NOT EXISTS _metadata (created_at TEXT, created_by TEXT)")
-                conn.execute(
-                    "INSERT INTO _metadata (created_at, created_by) VALUES (?, ?)", 
-                    (datetime.now().isoformat(), "SQL Editor Application")
+                # Set the pragmas up front so creation costs a single fsync
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                # The engine stamps the creation time itself
+                conn.executescript(
+                    "BEGIN; "
+                    "CREATE TABLE IF NOT EXISTS _metadata (created_at TEXT, created_by TEXT); "
+                    "INSERT INTO _metadata (created_at, created_by) "
+                    "VALUES (strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'), 'SQL Editor Application'); "
+                    "COMMIT;"
                 )
-                conn.commit()
                 conn.close()
             else:  # DuckDB
-                conn = duckdb.connect(file_path)
-                conn.execute("CREATE TABLE IF NOT EXISTS _metadata (created_at TEXT, created_by TEXT)")
-                conn.execute(
-                    "INSERT INTO _metadata (created_at, created_by) VALUES (?, ?)", 
-                    (datetime.now().isoformat(), "SQL Editor Application")
-                )
-                conn.commit()
-                conn.close()
+                # Attach the new file to the app's staging engine, so no connection to it stays open or cached
+                stage = self.parent().duckdb_stage()
+                stage.execute("ATTACH '" + file_path.replace("'", "''") + "' AS newdb")
+                try:
+                    stage.execute("CREATE TABLE IF NOT EXISTS newdb._metadata (created_at TEXT, created_by TEXT)")
+                    stage.execute(
+                        "INSERT INTO newdb._metadata (created_at, created_by) VALUES (strftime(now()::TIMESTAMP, '%Y-%m-%dT%H:%M:%S.%f'), ?)", 
+                        ["SQL Editor Application"]
+                    )
+                finally:
+                    stage.execute("DETACH newdb")
             
             self.created_file_path = file_path
             
@@ -1448,6 +2220,7 @@ class FolderImportDialog(QDialog):
         self.setWindowTitle(window_title)
         self.setModal(True)
         self.resize(700, 650)  # Slightly taller for new options
+        self._load_worker = None
         self.init_ui()
         
     def init_ui(self):
@@ -1804,7 +2577,7 @@ class FolderImportDialog(QDialog):
         
     def browse_folder(self):
         """Browse for folder"""
-        folder = QFileDialog.getExistingDirectory(self, "Select Folder")
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder", options=_DIR_DIALOG_OPTIONS)
         if folder:
             self.folder_path.setText(folder)
             
@@ -1895,77 +2668,102 @@ class FolderImportDialog(QDialog):
                 "Replace Existing": "replace",
                 "Append to Existing": "append"
             }
-            mode = mode_map[self.import_mode.currentText()]
-            
-            successful_imports = 0
-            failed_imports = []
-            all_dataframes = []
             main_app = self.parent()
             
             # Validate database connection first
             if not main_app.current_connection:
                 QMessageBox.critical(self, "No Database", "No database connection available.")
+                self.finish_folder_import()
                 return
             
-            for i, file_path in enumerate(files):
-                try:
-                    # Update progress with file size info
-                    file_size = os.path.getsize(file_path)
-                    file_size_mb = file_size / (1024 * 1024)
-                    
-                    if file_size_mb < 1:
-                        size_str = f"{file_size / 1024:.1f} KB"
-                    else:
-                        size_str = f"{file_size_mb:.1f} MB"
-                    
-                    self.progress_bar.setValue(i)
-                    self.progress_bar.setFormat(f"Processing {os.path.basename(file_path)} ({size_str}) - {i+1}/{len(files)}")
-                    QApplication.processEvents()
-                    
-                    # Read file
-                    if is_csv:
-                        # CSV import with optimized processing (with chunking for large files)
-                        df = self.read_csv_optimized(file_path, f"Processing {os.path.basename(file_path)} ({size_str})")
-                    else:
-                        # Excel import using ultra-fast Polars when available
-                        df = self.read_excel_optimized(file_path)
-                    
-                    if df.empty:
-                        failed_imports.append(f"{os.path.basename(file_path)}: Empty file")
-                        continue
-                        
-                    # Clean column names
-                    df.columns = [self.clean_column_name(col) for col in df.columns]
-                    
-                    if is_single_table:
-                        # Add source file column
-                        df['_source_file'] = os.path.basename(file_path)
-                        all_dataframes.append(df)
-                    else:
-                        # Import each file to separate table
-                        base_name = os.path.splitext(os.path.basename(file_path))[0]
-                        table_prefix = self.table_prefix.text().strip()
-                        table_name = f"{table_prefix}{base_name}" if table_prefix else base_name
-                        table_name = self.clean_table_name(table_name)
-                        
-                        # Validate table name
-                        if not table_name or table_name.strip() == "":
-                            failed_imports.append(f"{os.path.basename(file_path)}: Invalid table name")
-                            continue
-                        
-                        # Import to database with better error handling
-                        try:
-                            success = self.safe_database_import(df, table_name, mode, main_app)
-                            if success:
-                                successful_imports += 1
-                            else:
-                                failed_imports.append(f"{os.path.basename(file_path)}: Database import failed")
-                        except Exception as import_error:
-                            failed_imports.append(f"{os.path.basename(file_path)}: {str(import_error)}")
-                            
-                except Exception as e:
-                    failed_imports.append(f"{os.path.basename(file_path)}: {str(e)}")
-                    
+            self._import_mode = mode_map[self.import_mode.currentText()]
+            self._import_files = files
+            self._import_is_csv = is_csv
+            self._import_is_single_table = is_single_table
+            self._successful_imports = 0
+            self._failed_imports = []
+            self._loaded_frames = {}
+            
+            # A single-table CSV folder on DuckDB is first tried as one native load on the worker
+            native_import = None
+            db_type = main_app.current_connection_info.get('type', '').lower()
+            if is_csv and is_single_table and db_type == 'duckdb':
+                native_import = (self.single_table_name.text().strip(), self._import_mode, main_app)
+            
+            # Parse the files on a worker thread; results come back to this thread as signals
+            read_options = {
+                'encoding': self.encoding_combo.currentText(),
+                'delimiter': self.delimiter_combo.currentText(),
+                'sheet_handling': self.sheet_handling.currentText(),
+                'sheet_name': self.specific_sheet_combo.currentText()
+            }
+            self._load_worker = FolderLoadWorker(self, files, is_csv, is_single_table, read_options, native_import)
+            self._load_worker.native_imported.connect(self.on_folder_native_imported)
+            self._load_worker.progress.connect(self.on_folder_load_progress)
+            self._load_worker.file_loaded.connect(self.on_folder_file_loaded)
+            self._load_worker.file_failed.connect(self.on_folder_file_failed)
+            self._load_worker.finished.connect(self.on_folder_load_finished)
+            self._load_worker.start()
+        
+        except Exception as e:
+            QMessageBox.critical(self, "Import Error", f"Critical error during import: {str(e)}")
+            self.finish_folder_import()
+    
+    def on_folder_load_progress(self, completed, message):
+        """Show folder-import loading progress"""
+        self.progress_bar.setValue(completed)
+        self.progress_bar.setFormat(message)
+    
+    def on_folder_native_imported(self):
+        """Record that DuckDB loaded the whole folder into the combined table"""
+        self._successful_imports = 1
+    
+    def on_folder_file_failed(self, file_path, error):
+        """Record a file that could not be loaded"""
+        self._failed_imports.append(f"{os.path.basename(file_path)}: {error}")
+    
+    def on_folder_file_loaded(self, index, file_path, df):
+        """Keep a loaded frame for the combined table, or import it into its own table"""
+        if self._import_is_single_table:
+            # Keep the original file order so the first file defines the base columns
+            self._loaded_frames[index] = df
+            return
+        
+        # Import each file to separate table
+        file_name = os.path.basename(file_path)
+        base_name = os.path.splitext(file_name)[0]
+        table_prefix = self.table_prefix.text().strip()
+        table_name = f"{table_prefix}{base_name}" if table_prefix else base_name
+        table_name = self.clean_table_name(table_name)
+        
+        # Validate table name
+        if not table_name or table_name.strip() == "":
+            self._failed_imports.append(f"{file_name}: Invalid table name")
+            return
+        
+        # Import to database with better error handling
+        try:
+            success = self.safe_database_import(df, table_name, self._import_mode, self.parent())
+            if success:
+                self._successful_imports += 1
+            else:
+                self._failed_imports.append(f"{file_name}: Database import failed")
+        except Exception as import_error:
+            self._failed_imports.append(f"{file_name}: {str(import_error)}")
+    
+    def on_folder_load_finished(self):
+        """Import the combined table (if any) and report the results"""
+        try:
+            files = self._import_files
+            is_csv = self._import_is_csv
+            is_single_table = self._import_is_single_table
+            successful_imports = self._successful_imports
+            failed_imports = self._failed_imports
+            main_app = self.parent()
+            
+            all_dataframes = [self._loaded_frames[i] for i in sorted(self._loaded_frames)]
+            self._loaded_frames = {}
+            
             # Handle single table import
             if is_single_table and all_dataframes:
                 try:
@@ -1979,7 +2777,7 @@ class FolderImportDialog(QDialog):
                     else:
                         # Import to database with better error handling
                         try:
-                            success = self.safe_database_import(combined_df, table_name, mode, main_app)
+                            success = self.safe_database_import(combined_df, table_name, self._import_mode, main_app)
                             if success:
                                 successful_imports = 1
                             else:
@@ -2048,9 +2846,165 @@ class FolderImportDialog(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "Import Error", f"Critical error during import: {str(e)}")
         finally:
-            self.progress_bar.hide()
-            self.import_btn.setEnabled(True)
+            self.finish_folder_import()
+    
+    def reject(self):
+        """Keep the dialog open while files are still being parsed"""
+        if self._load_worker is not None and self._load_worker.isRunning():
+            return
+        super().reject()
+    
+    def finish_folder_import(self):
+        """Reset the dialog once a folder import has ended"""
+        if self._load_worker is not None:
+            self._load_worker.wait()
+            self._load_worker = None
+        self.progress_bar.hide()
+        self.import_btn.setEnabled(True)
+            
+    def _load_one_file(self, file_path, is_csv, is_single_table, read_options):
+        """Read and prepare a single folder-import file; returns (df, None) or (None, error)"""
+        file_name = os.path.basename(file_path)
+        try:
+            # Read file
+            if is_csv:
+                # CSV import with optimized processing (with chunking for large files)
+                df = self.read_csv_optimized(file_path, read_options['encoding'], read_options['delimiter'],
+                                             f"Processing {file_name}")
+            else:
+                # Excel import using ultra-fast Polars when available
+                df = self.read_excel_optimized(file_path, read_options['sheet_handling'], read_options['sheet_name'])
+            
+            if df.empty:
+                return None, "Empty file"
+            
+            # Clean column names
+            df.columns = self.clean_column_names(df.columns)
+            
+            if is_single_table:
+                # Add source file column, dictionary-encoded so the name is stored once
+                df['_source_file'] = pd.Categorical.from_codes(
+                    np.zeros(len(df), dtype=np.int32), categories=[file_name]
+                )
+            return df, None
             
+        except Exception as e:
+            return None, str(e)
+    
+    def _set_progress_format(self, text):
+        """Update the progress bar text; ignored when called from a loader thread"""
+        if threading.current_thread() is threading.main_thread():
+            self.progress_bar.setFormat(text)
+    
+    def duckdb_native_folder_import(self, files, table_name, mode, main_app, encoding, delimiter):
+        """Load all CSV files into one DuckDB table with read_csv_auto(union_by_name)"""
+        # DuckDB's reader only handles UTF-8 here; other encodings use the pandas path
+        if encoding.lower() != 'utf-8':
+            return False
+        
+        table_name = self.clean_table_name(table_name)
+        file_list = ", ".join("'" + f.replace("'", "''") + "'" for f in files)
+        # No ignore_errors: a malformed row fails the native load, and the pandas path reports it instead
+        csv_options = "union_by_name=true, filename=true"
+        if delimiter != 'Auto-detect':
+            csv_options += ", delim='" + delimiter.replace("'", "''") + "'"
+        source_sql = f"read_csv_auto([{file_list}], {csv_options})"
+        
+        # This runs on the folder-load worker, so use a cursor of its own rather than the UI thread's connection
+        cursor = main_app.current_connection.cursor()
+        try:
+            table_exists = cursor.execute(
+                "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ? AND table_schema = 'main'",
+                [table_name]
+            ).fetchone()[0] > 0
+            if mode == 'create_new' and table_exists:
+                raise ValueError(f"Table '{table_name}' already exists. Use 'Replace' or 'Append' mode instead.")
+            
+            # Rename columns with clean_column_names, like the pandas path, rather than normalize_names (which lowercases)
+            columns = [row[0] for row in cursor.execute(f"DESCRIBE SELECT * FROM {source_sql}").fetchall()
+                       if row[0] != 'filename']
+            select_list = ", ".join('"' + column.replace('"', '""') + '" AS "' + cleaned + '"'
+                                    for column, cleaned in zip(columns, self.clean_column_names(columns)))
+            
+            select_sql = f"""
+                SELECT {select_list}, regexp_extract(filename, '[^/\\\\]+$') AS _source_file
+                FROM {source_sql}
+            """
+            
+            # Drop and reload in one transaction, so a failed load leaves a replaced table untouched
+            cursor.execute("BEGIN TRANSACTION")
+            try:
+                if mode == 'append' and table_exists:
+                    cursor.execute(f'INSERT INTO "{table_name}" BY NAME {select_sql}')
+                else:
+                    if mode == 'replace':
+                        cursor.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+                    cursor.execute(f'CREATE TABLE "{table_name}" AS {select_sql}')
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+        finally:
+            cursor.close()
+        return True
+        
+    def arrow_dataset_folder_load(self, files, encoding, delimiter):
+        """Scan all CSV files as pyarrow datasets in parallel, with columns cleaned per file and unified by name"""
+        # Arrow's CSV reader only handles UTF-8 here; other encodings use the per-file path
+        if not PYARROW_AVAILABLE or encoding.lower() != 'utf-8':
+            return None
+        
+        if delimiter == '\\t':
+            delimiter = '\t'
+        
+        def scan_file(file_path):
+            # No invalid_row_handler: a malformed row fails this path, and the per-file loader reports it
+            parse_options = pa_csv.ParseOptions(
+                delimiter=self.detect_csv_delimiter_fast(file_path) if delimiter == 'Auto-detect' else delimiter
+            )
+            with pa_csv.open_csv(file_path, parse_options=parse_options) as reader:
+                raw_names = reader.schema.names
+            # Every column as text, like read_delimited_arrow, and renamed as _load_one_file cleans them
+            csv_format = pa_ds.CsvFileFormat(
+                parse_options=parse_options,
+                convert_options=pa_csv.ConvertOptions(
+                    strings_can_be_null=True,
+                    column_types={name: pa.string() for name in raw_names}
+                )
+            )
+            columns = {cleaned: pa_ds.field(raw) for raw, cleaned in zip(raw_names, self.clean_column_names(raw_names))}
+            return pa_ds.dataset(file_path, format=csv_format).to_table(columns=columns, use_threads=True)
+        
+        # Scan the files concurrently (Arrow releases the GIL), skipping empty ones as _load_one_file does
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            scanned = list(executor.map(scan_file, files))
+        tables, source_files = [], []
+        for file_path, table in zip(files, scanned):
+            if table.num_rows:
+                tables.append(table)
+                source_files.append(os.path.basename(file_path))
+        if not tables:
+            return None
+        
+        # Columns a file lacks are filled with nulls; new columns follow the first file's, as in combine_dataframes_safely
+        base_columns = tables[0].column_names
+        new_columns = sorted(set().union(*(table.column_names for table in tables[1:])).difference(base_columns))
+        all_columns = base_columns + new_columns
+        table = pa.concat_tables([
+            pa.table({name: table.column(name) if name in table.column_names else pa.nulls(table.num_rows, pa.string())
+                      for name in all_columns})
+            for table in tables
+        ])
+        
+        # Dictionary-encode the source file so each name is stored once
+        source_names = list(dict.fromkeys(source_files))
+        codes = np.concatenate([np.full(t.num_rows, source_names.index(name), dtype=np.int32)
+                                for t, name in zip(tables, source_files)])
+        
+        df = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+        df.insert(len(base_columns), '_source_file', pd.Categorical.from_codes(codes, categories=source_names))
+        return df
+        
     def combine_dataframes_safely(self, dataframes):
         """Safely combine dataframes with proper column alignment - new columns go to the end"""
         if not dataframes:
@@ -2069,25 +3023,18 @@ class FolderImportDialog(QDialog):
                 all_columns_set.update(df.columns)
             
             # Create final column order: base columns first, then new columns at the end
-            new_columns = [col for col in all_columns_set if col not in base_columns]
+            new_columns = all_columns_set.difference(base_columns)
             all_columns = base_columns + sorted(new_columns)  # Sort only the new columns
             
-            # Align all dataframes to have the same columns in the correct order
-            aligned_dfs = []
-            for df in dataframes:
-                aligned_df = df.copy()
-                
-                # Add missing columns with NaN at the end
-                for col in all_columns:
-                    if col not in aligned_df.columns:
-                        aligned_df[col] = pd.NA
-                        
-                # Reorder columns: existing columns first, new columns at the end
-                aligned_df = aligned_df.reindex(columns=all_columns)
-                aligned_dfs.append(aligned_df)
-                
-            # Combine all dataframes
-            return pd.concat(aligned_dfs, ignore_index=True)
+            # Give every _source_file column the same categories so concat keeps it categorical
+            source_columns = [df['_source_file'] for df in dataframes if '_source_file' in df.columns]
+            if len(source_columns) == len(dataframes) and all(isinstance(col.dtype, pd.CategoricalDtype) for col in source_columns):
+                source_names = list(dict.fromkeys(name for col in source_columns for name in col.cat.categories))
+                for df in dataframes:
+                    df['_source_file'] = df['_source_file'].cat.set_categories(source_names)
+            
+            # concat already aligns on the union of columns; one reindex fixes the order
+            return pd.concat(dataframes, ignore_index=True, sort=False, copy=False).reindex(columns=all_columns)
             
         except Exception as e:
             # Fallback to simple concatenation without sorting columns
@@ -2149,10 +3096,10 @@ class FolderImportDialog(QDialog):
             db_type = main_app.current_connection_info.get('type', '').lower()
             
             if db_type == 'duckdb':
-                result = main_app.current_connection.execute(f"""
-                    SELECT COUNT(*) FROM information_schema.tables 
-                    WHERE table_name = '{table_name}' AND table_schema = 'main'
-                """).fetchone()
+                result = main_app.current_connection.execute(
+                    "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ? AND table_schema = 'main'",
+                    [table_name]
+                ).fetchone()
                 return result[0] > 0
             elif db_type == 'sqlite':
                 cursor = main_app.current_connection.cursor()
@@ -2184,12 +3131,19 @@ class FolderImportDialog(QDialog):
             # Register the DataFrame with DuckDB
             main_app.current_connection.register('temp_import_df', df)
             
+            # Categorical columns would become ENUMs; store them as plain text
+            categorical_cols = [col for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)]
+            select_sql = "SELECT * FROM temp_import_df"
+            if categorical_cols:
+                replacements = ", ".join(f'"{col}"::VARCHAR AS "{col}"' for col in categorical_cols)
+                select_sql = f"SELECT * REPLACE ({replacements}) FROM temp_import_df"
+            
             if mode == 'append' and self.table_exists(table_name, main_app):
                 # Append to existing table
-                main_app.current_connection.execute(f'INSERT INTO "{table_name}" SELECT * FROM temp_import_df')
+                main_app.current_connection.execute(f'INSERT INTO "{table_name}" {select_sql}')
             else:
                 # Create new table
-                main_app.current_connection.execute(f'CREATE TABLE "{table_name}" AS SELECT * FROM temp_import_df')
+                main_app.current_connection.execute(f'CREATE TABLE "{table_name}" AS {select_sql}')
             
             # Unregister the temporary DataFrame
             main_app.current_connection.unregister('temp_import_df')
@@ -2221,35 +3175,40 @@ class FolderImportDialog(QDialog):
             
     def clean_column_name(self, name):
         """Clean column name for SQL compatibility"""
-        import re
-        name = str(name).strip()
-        name = re.sub(r'[^\w\s]', '_', name)
-        name = re.sub(r'\s+', '_', name)  
-        name = re.sub(r'_+', '_', name)
-        name = name.strip('_')
-        
-        if name and name[0].isdigit():
-            name = f"col_{name}"
-            
-        return name or "unnamed_column"
+        return self.clean_column_names([name])[0]
+        
+    def clean_column_names(self, columns):
+        """Clean a whole list of column names for SQL compatibility and make them unique"""
+        cleaned = [_COLUMN_JUNK_RE.sub('_', str(col).strip()).strip('_') for col in columns]
+        cleaned = [f"col_{name}" if name[:1].isdigit() else (name or "unnamed_column") for name in cleaned]
+        
+        # Suffix repeated names (case-insensitively) with _1, _2, ... in a single pass
+        counts = Counter(name.lower() for name in cleaned)
+        if len(counts) == len(cleaned):
+            return cleaned
+        seen = Counter()
+        unique = []
+        for name in cleaned:
+            key = name.lower()
+            if counts[key] > 1:
+                suffix = seen[key]
+                seen[key] += 1
+                if suffix:
+                    name = f"{name}_{suffix}"
+            unique.append(name)
+        return unique
         
     def clean_table_name(self, name):
         """Clean table name for SQL compatibility"""
-        import re
-        name = str(name).strip()
-        name = re.sub(r'[^\w]', '_', name)
-        name = re.sub(r'_+', '_', name)
-        name = name.strip('_')
+        name = _COLUMN_JUNK_RE.sub('_', str(name).strip()).strip('_')
         
         if name and name[0].isdigit():
             name = f"table_{name}"
             
         return name or "imported_table"
         
-    def read_excel_optimized(self, file_path):
+    def read_excel_optimized(self, file_path, sheet_handling, sheet_name):
         """Read Excel file using ultra-fast Polars or fallback to pandas"""
-        sheet_handling = self.sheet_handling.currentText()
-        
         try:
             if POLARS_AVAILABLE:
                 # Use Polars for maximum speed
@@ -2277,7 +3236,6 @@ class FolderImportDialog(QDialog):
                             
                     elif sheet_handling == 'Specific Sheet':
                         # Read specific sheet
-                        sheet_name = self.specific_sheet_combo.currentText()
                         if sheet_name:
                             try:
                                 df_pl = pl.read_excel(file_path, sheet_name=sheet_name)
@@ -2296,27 +3254,26 @@ class FolderImportDialog(QDialog):
                         
                 except Exception as polars_error:
                     # Fallback to pandas if Polars fails
-                    df = self._read_excel_pandas_fallback(file_path, sheet_handling)
+                    df = self._read_excel_pandas_fallback(file_path, sheet_handling, sheet_name)
                     
             else:
                 # Use pandas directly
-                df = self._read_excel_pandas_fallback(file_path, sheet_handling)
+                df = self._read_excel_pandas_fallback(file_path, sheet_handling, sheet_name)
                 
-            # Clean column names for SQL compatibility
-            df.columns = [self.clean_column_name(col) for col in df.columns]
+            # Column names are cleaned by the caller
             return df
             
         except Exception as e:
             raise Exception(f"Failed to read Excel file {os.path.basename(file_path)}: {str(e)}")
             
-    def _read_excel_pandas_fallback(self, file_path, sheet_handling):
+    def _read_excel_pandas_fallback(self, file_path, sheet_handling, sheet_name):
         """Fallback Excel reading using pandas"""
         if sheet_handling == 'All Sheets':
             # Read all sheets and combine
-            excel_file = pd.ExcelFile(file_path)
+            excel_file = pd.ExcelFile(file_path, engine=EXCEL_ENGINE)
             sheet_dfs = []
             for sheet_name in excel_file.sheet_names:
-                sheet_df = pd.read_excel(file_path, sheet_name=sheet_name)
+                sheet_df = pd.read_excel(file_path, sheet_name=sheet_name, engine=EXCEL_ENGINE)
                 sheet_df['_sheet_name'] = sheet_name
                 sheet_dfs.append(sheet_df)
             
@@ -2327,23 +3284,18 @@ class FolderImportDialog(QDialog):
                 
         elif sheet_handling == 'Specific Sheet':
             # Read specific sheet
-            sheet_name = self.specific_sheet_combo.currentText()
             if sheet_name:
-                return pd.read_excel(file_path, sheet_name=sheet_name)
+                return pd.read_excel(file_path, sheet_name=sheet_name, engine=EXCEL_ENGINE)
             else:
                 # No sheet selected, use first sheet
-                return pd.read_excel(file_path)
+                return pd.read_excel(file_path, engine=EXCEL_ENGINE)
         else:
             # First sheet only
-            return pd.read_excel(file_path)
+            return pd.read_excel(file_path, engine=EXCEL_ENGINE)
             
-    def read_csv_optimized(self, file_path, status_message="Processing CSV"):
+    def read_csv_optimized(self, file_path, encoding, delimiter, status_message="Processing CSV"):
         """Read CSV file with optimized chunking and memory management like automation"""
         try:
-            # Get CSV options
-            encoding = self.encoding_combo.currentText()
-            delimiter = self.delimiter_combo.currentText()
-            
             if delimiter == 'Auto-detect':
                 delimiter = self.detect_csv_delimiter_fast(file_path)
             elif delimiter == '\\t':
@@ -2458,8 +3410,7 @@ class FolderImportDialog(QDialog):
                     
                     # Update progress every 10 chunks
                     if chunk_count % 10 == 0:
-                        self.progress_bar.setFormat(f"{status_message} - {total_rows:,} rows processed")
-                        QApplication.processEvents()
+                        self._set_progress_format(f"{status_message} - {total_rows:,} rows processed")
                         
                 except Exception as chunk_error:
                     print(f"Error processing chunk {chunk_count}: {str(chunk_error)}")
@@ -2571,7 +3522,7 @@ class FolderImportDialog(QDialog):
             combined = self.optimize_dataframe_dtypes(combined)
             
             # Reset progress bar format
-            self.progress_bar.setFormat("")
+            self._set_progress_format("")
             
             return combined
             
@@ -2580,19 +3531,118 @@ class FolderImportDialog(QDialog):
             return pd.concat(chunks, ignore_index=True)
 
 
+def excel_sheet_names(file_path):
+    """List a workbook's sheet names from its metadata, without parsing any cells"""
+    if file_path.lower().endswith('.xls'):
+        try:
+            import xlrd
+            workbook = xlrd.open_workbook(file_path, on_demand=True)
+            try:
+                return workbook.sheet_names()
+            finally:
+                workbook.release_resources()
+        except ImportError:
+            pass
+    elif openpyxl is not None:
+        workbook = openpyxl.load_workbook(file_path, read_only=True, keep_links=False, data_only=True)
+        try:
+            return workbook.sheetnames
+        finally:
+            workbook.close()
+    
+    # No metadata reader installed, let pandas open the workbook
+    return pd.ExcelFile(file_path).sheet_names
+
+
+class LabeledListModel(QAbstractListModel):
+    """Read-only list model showing a label per row, with the row's raw value under UserRole"""
+    
+    def __init__(self, labels, values, parent=None):
+        super().__init__(parent)
+        self._labels = labels
+        self._values = values
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._labels)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._labels[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._values[index.row()]
+        return None
+
+
+class LazyComboBox(QComboBox):
+    """Combo box that shows only its first item until the popup is opened"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending_items = None  # (labels, values), filled in on the first showPopup
+    
+    def clear(self):
+        """Drop any pending list and return to an editable item model"""
+        self._pending_items = None
+        if not isinstance(self.model(), QStandardItemModel):
+            self.setModel(QStandardItemModel(self))
+        super().clear()
+    
+    def set_lazy_items(self, labels, values):
+        """Select the first item now and defer building the rest of the list"""
+        self.clear()
+        if labels:
+            self.addItem(labels[0], values[0])
+        self._pending_items = (labels, values) if len(labels) > 1 else None
+    
+    def showPopup(self):
+        if self._pending_items is not None:
+            labels, values = self._pending_items
+            self._pending_items = None
+            # One model with every item, instead of an addItem (and view relayout) per item
+            self.blockSignals(True)
+            self.setModel(LabeledListModel(labels, values, self))
+            self.setCurrentIndex(0)
+            self.blockSignals(False)
+        super().showPopup()
+
+
 class DataImportDialog(QDialog):
     """Dialog for importing data from various file formats"""
     
+    # Delimiter dropdown text -> delimiter, and back
+    _DELIM_MAP = {
+        "Comma (,)": ",",
+        "Semicolon (;)": ";",
+        "Tab (\\t)": "\t",
+        "Pipe (|)": "|",
+        "Space ( )": " "
+    }
+    _REVERSE_DELIM_MAP = {v: k for k, v in _DELIM_MAP.items()}
+    
     def __init__(self, parent=None, connection=None, connection_info=None):
         super().__init__(parent)
         self.connection = connection
         self.connection_info = connection_info
+        self._workers = set()  # Running background probes, kept alive until they finish
+        self._probe_path = None  # File the latest analyze_file probe is for
+        self._probe_exists = None  # Whether that file exists, once the probe has answered
+        self._last_enabled_state = None  # Import button state last set by update_ui
+        self._main_app = self._find_main_app()  # Ancestor that provides detect_csv_delimiter
         self.setWindowTitle("Import Data")
         self.setModal(True)
         self.resize(850, 750)  # Made larger and resizable
         self.setMinimumSize(700, 600)  # Set minimum size
         self.init_ui()
     
+    def _find_main_app(self):
+        """Walk up the parent chain once to the window that can detect CSV delimiters"""
+        main_app = self.parent()
+        while main_app and not hasattr(main_app, 'detect_csv_delimiter'):
+            main_app = main_app.parent()
+        return main_app
+    
     def init_ui(self):
         # Create main layout
         main_layout = QVBoxLayout(self)
@@ -2687,7 +3737,7 @@ class DataImportDialog(QDialog):
         table_select_layout = QHBoxLayout(self.table_select_widget)
         table_select_layout.setContentsMargins(0, 5, 0, 0)
         table_select_layout.addWidget(QLabel("Select Table:"))
-        self.table_select_combo = QComboBox()
+        self.table_select_combo = LazyComboBox()
         self.table_select_combo.setStyleSheet("""
             QComboBox {
                 background-color: #f8f9fa;
@@ -2761,6 +3811,7 @@ class DataImportDialog(QDialog):
         self.auto_detect_button.setMaximumWidth(60)
         self.auto_detect_button.setToolTip("Auto-detect delimiter from file")
         self.auto_detect_button.clicked.connect(self.auto_detect_delimiter)
+        self.auto_detect_button.setEnabled(self._main_app is not None)
         self.auto_detect_button.setStyleSheet("""
             QPushButton {
                 background-color: #17a2b8;
@@ -2832,6 +3883,13 @@ class DataImportDialog(QDialog):
         
         # Connect signals
         self.file_path_edit.textChanged.connect(self.update_ui)
+        
+        # Analyze the selected file once the path settles, however it was set
+        self._analyze_timer = QTimer(self)
+        self._analyze_timer.setSingleShot(True)
+        self._analyze_timer.setInterval(150)
+        self._analyze_timer.timeout.connect(self._analyze_current_file)
+        self.file_path_edit.textChanged.connect(lambda: self._analyze_timer.start())
         self.table_name_edit.textChanged.connect(self.update_ui)
         self.table_select_combo.currentTextChanged.connect(self.update_ui)
         
@@ -2860,15 +3918,7 @@ class DataImportDialog(QDialog):
             self.delimiter_edit.hide()
             
             # Map display text to actual delimiter
-            delimiter_map = {
-                "Comma (,)": ",",
-                "Semicolon (;)": ";",
-                "Tab (\\t)": "\t",
-                "Pipe (|)": "|",
-                "Space ( )": " "
-            }
-            
-            actual_delimiter = delimiter_map.get(selected, ",")
+            actual_delimiter = self._DELIM_MAP.get(selected, ",")
             self.delimiter_edit.setText(actual_delimiter)
     
     def get_current_delimiter(self):
@@ -2876,19 +3926,12 @@ class DataImportDialog(QDialog):
         if self.delimiter_combo.currentText() == "Custom...":
             return self.delimiter_edit.text()
         else:
-            delimiter_map = {
-                "Comma (,)": ",",
-                "Semicolon (;)": ";",
-                "Tab (\\t)": "\t",
-                "Pipe (|)": "|",
-                "Space ( )": " "
-            }
-            return delimiter_map.get(self.delimiter_combo.currentText(), ",")
+            return self._DELIM_MAP.get(self.delimiter_combo.currentText(), ",")
     
     def auto_detect_delimiter(self):
         """Auto-detect delimiter for the selected file"""
         file_path = self.file_path_edit.text()
-        if not file_path or not os.path.exists(file_path):
+        if not file_path or not self._file_exists(file_path):
             QMessageBox.warning(self, "No File", "Please select a file first.")
             return
         
@@ -2897,24 +3940,14 @@ class DataImportDialog(QDialog):
             QMessageBox.information(self, "Not Applicable", "Auto-detection only works for CSV, TSV, and TXT files.")
             return
         
-        # Get the main app instance to use its detect_csv_delimiter method
-        main_app = self.parent()
-        while main_app and not hasattr(main_app, 'detect_csv_delimiter'):
-            main_app = main_app.parent()
+        # Use the main app's detect_csv_delimiter method
+        main_app = self._main_app
         
-        if main_app and hasattr(main_app, 'detect_csv_delimiter'):
+        if main_app:
             detected_delimiter = main_app.detect_csv_delimiter(file_path)
             
             # Map detected delimiter to dropdown option
-            delimiter_to_combo = {
-                ',': "Comma (,)",
-                ';': "Semicolon (;)",
-                '\t': "Tab (\\t)",
-                '|': "Pipe (|)",
-                ' ': "Space ( )"
-            }
-            
-            combo_option = delimiter_to_combo.get(detected_delimiter)
+            combo_option = self._REVERSE_DELIM_MAP.get(detected_delimiter)
             
             if combo_option:
                 # Set the dropdown to the detected delimiter
@@ -2952,81 +3985,119 @@ class DataImportDialog(QDialog):
             "JSON Files (*.json);;"
             "TSV Files (*.tsv);;"
             "Text Files (*.txt);;"
-            "All Files (*)"
+            "All Files (*)",
+            options=_FILE_DIALOG_OPTIONS
         )
         
         if file_path:
             self.file_path_edit.setText(file_path)
+    
+    def _analyze_current_file(self):
+        """Analyze the file in the path field, if any"""
+        file_path = self.file_path_edit.text().strip()
+        if file_path:
             self.analyze_file(file_path)
     
     def analyze_file(self, file_path):
         try:
-            file_size = os.path.getsize(file_path) / 1024 / 1024  # Size in MB
-            file_ext = os.path.splitext(file_path)[1].lower()
-            
-            # Update file info
-            self.file_info_label.setText(f"File: {os.path.basename(file_path)} | Size: {file_size:.2f} MB | Type: {file_ext}")
+            base, _ = os.path.splitext(file_path)
+            self.file_info_label.setText(f"File: {os.path.basename(file_path)} | Analyzing...")
             
             # Auto-suggest table name only if field is empty
             if not self.table_name_edit.text().strip():
-                base_name = os.path.splitext(os.path.basename(file_path))[0]
+                base_name = os.path.basename(base)
                 # Clean table name (remove special characters, replace with underscores)
-                clean_name = re.sub(r'[^a-zA-Z0-9_]', '_', base_name).lower()
+                clean_name = _NON_IDENT_RE.sub('_', base_name).lower()
                 self.table_name_edit.setText(clean_name)
             
-            # Handle Excel files - show sheet selection
-            if file_ext in ['.xlsx', '.xls']:
-                self.load_excel_sheets(file_path)
-                self.sheet_group.show()
-                self.csv_options_widget.hide()
-            else:
-                self.sheet_group.hide()
-                if file_ext in ['.csv', '.tsv', '.txt']:
-                    self.csv_options_widget.show()
-                    
-                    # Auto-detect delimiter for CSV/TSV/TXT files
-                    main_app = self.parent()
-                    while main_app and not hasattr(main_app, 'detect_csv_delimiter'):
-                        main_app = main_app.parent()
-                    
-                    if main_app and hasattr(main_app, 'detect_csv_delimiter'):
-                        detected_delimiter = main_app.detect_csv_delimiter(file_path)
-                        
-                        # Map detected delimiter to dropdown option
-                        delimiter_to_combo = {
-                            ',': "Comma (,)",
-                            ';': "Semicolon (;)",
-                            '\t': "Tab (\\t)",
-                            '|': "Pipe (|)",
-                            ' ': "Space ( )"
-                        }
-                        
-                        combo_option = delimiter_to_combo.get(detected_delimiter)
-                        
-                        if combo_option:
-                            self.delimiter_combo.setCurrentText(combo_option)
-                            self.delimiter_edit.hide()
-                        else:
-                            self.delimiter_combo.setCurrentText("Custom...")
-                            self.delimiter_edit.setText(detected_delimiter)
-                            self.delimiter_edit.show()
-                    elif file_ext == '.tsv':
-                        self.delimiter_combo.setCurrentText("Tab (\\t)")
-                        self.delimiter_edit.hide()
-                else:
-                    self.csv_options_widget.hide()
+            main_app = self._main_app
+            detect_delimiter = main_app.detect_csv_delimiter if main_app else None
+            
+            # Stat the file and probe sheets/delimiter on a worker so the dialog stays responsive
+            self._probe_path = file_path
+            self._probe_exists = None
+            worker = FileProbeWorker(file_path, detect_delimiter)
+            worker.probed.connect(self.on_file_probed)
+            worker.failed.connect(self.on_file_probe_failed)
+            self._start_worker(worker)
             
         except Exception as e:
             self.file_info_label.setText(f"Error analyzing file: {str(e)}")
     
-    def load_excel_sheets(self, file_path):
-        try:
-            # Read Excel file to get sheet names
-            excel_file = pd.ExcelFile(file_path)
-            self.sheet_combo.clear()
-            self.sheet_combo.addItems(excel_file.sheet_names)
-        except Exception as e:
-            QMessageBox.warning(self, "Excel Error", f"Could not read Excel sheets: {str(e)}")
+    def on_file_probed(self, file_path, info):
+        """Show the results of the latest file probe"""
+        if file_path != self._probe_path:
+            return
+        
+        self._probe_exists = True
+        file_ext = info['ext']
+        
+        # Update file info
+        self.file_info_label.setText(f"File: {os.path.basename(file_path)} | Size: {info['size']:.2f} MB | Type: {file_ext}")
+        
+        # Handle Excel files - show sheet selection
+        if file_ext in ['.xlsx', '.xls']:
+            self.load_excel_sheets(info)
+            self.sheet_group.show()
+            self.csv_options_widget.hide()
+        else:
+            self.sheet_group.hide()
+            if file_ext in ['.csv', '.tsv', '.txt']:
+                self.csv_options_widget.show()
+                
+                detected_delimiter = info.get('delimiter')
+                if detected_delimiter is not None:
+                    # Map detected delimiter to dropdown option
+                    combo_option = self._REVERSE_DELIM_MAP.get(detected_delimiter)
+                    
+                    if combo_option:
+                        self.delimiter_combo.setCurrentText(combo_option)
+                        self.delimiter_edit.hide()
+                    else:
+                        self.delimiter_combo.setCurrentText("Custom...")
+                        self.delimiter_edit.setText(detected_delimiter)
+                        self.delimiter_edit.show()
+                elif file_ext == '.tsv':
+                    self.delimiter_combo.setCurrentText("Tab (\\t)")
+                    self.delimiter_edit.hide()
+            else:
+                self.csv_options_widget.hide()
+    
+    def on_file_probe_failed(self, file_path, error):
+        """Report a file that could not be analyzed"""
+        if file_path == self._probe_path:
+            self._probe_exists = os.path.exists(file_path)
+            self.file_info_label.setText(f"Error analyzing file: {error}")
+    
+    def load_excel_sheets(self, info):
+        """Fill the sheet dropdown from a file probe"""
+        if 'sheet_error' in info:
+            QMessageBox.warning(self, "Excel Error", f"Could not read Excel sheets: {info['sheet_error']}")
+            return
+        self.sheet_combo.clear()
+        self.sheet_combo.addItems(info['sheets'])
+    
+    def _file_exists(self, file_path):
+        """Whether file_path exists, reusing the last probe's stat when it was for this path"""
+        if file_path == self._probe_path and self._probe_exists is not None:
+            return self._probe_exists
+        return os.path.exists(file_path)
+    
+    def _start_worker(self, worker):
+        """Run a background probe, holding a reference until its thread has finished"""
+        self._workers.add(worker)
+        worker.finished.connect(self._on_worker_finished)
+        worker.start()
+    
+    def _on_worker_finished(self):
+        """Drop a finished probe (runs on the UI thread, after the worker's thread has ended)"""
+        self._workers.discard(self.sender())
+    
+    def done(self, result):
+        """Wait for background probes before the dialog is torn down"""
+        for worker in list(self._workers):
+            worker.wait()
+        super().done(result)
     
     def load_existing_tables(self):
         """Load existing tables from the database into the dropdown"""
@@ -3036,28 +4107,55 @@ class DataImportDialog(QDialog):
             return
             
         try:
-            if self.connection_info['type'].lower() == 'duckdb':
-                tables_df = self.connection.execute("SHOW TABLES").fetchdf()
-                existing_tables = tables_df['name'].tolist() if not tables_df.empty else []
-            else:  # SQLite
+            # Reuse the main window's table list until the schema changes
+            table_cache = getattr(self.parent(), '_table_cache', None)
+            existing_tables = table_cache.get(id(self.connection)) if table_cache is not None else None
+            
+            if existing_tables is not None:
+                self.on_tables_loaded(existing_tables)
+            elif self.connection_info['type'].lower() == 'duckdb':
+                # DuckDB catalogs can be slow (remote files), so list them on a worker
+                self.table_select_combo.addItem("Loading tables...")
+                self.table_select_combo.setEnabled(False)
+                worker = TableListWorker(self.connection)
+                worker.tables_loaded.connect(self.on_tables_loaded)
+                worker.failed.connect(self.on_tables_failed)
+                self._start_worker(worker)
+            else:  # SQLite connections are bound to this thread; the local catalog read is cheap
                 cursor = self.connection.cursor()
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-                existing_tables = [row[0] for row in cursor.fetchall()]
-            
-            if existing_tables:
-                # Add tables with icons
-                for table in existing_tables:
-                    self.table_select_combo.addItem(f"📊 {table}")
-            else:
-                self.table_select_combo.addItem("(No tables found)")
-                self.table_select_combo.setEnabled(False)
+                self.on_tables_loaded([row[0] for row in cursor.fetchall()])
                 
         except Exception as e:
-            self.table_select_combo.addItem(f"Error loading tables: {str(e)}")
+            self.on_tables_failed(str(e))
+    
+    def on_tables_loaded(self, existing_tables):
+        """Fill the table dropdown and remember the list on the main window"""
+        table_cache = getattr(self.parent(), '_table_cache', None)
+        if table_cache is not None:
+            table_cache[id(self.connection)] = existing_tables
+        
+        self.table_select_combo.clear()
+        if existing_tables:
+            # Add tables with icons; the full list is built when the dropdown is first opened
+            self.table_select_combo.setEnabled(True)
+            self.table_select_combo.set_lazy_items([f"📊 {table}" for table in existing_tables], existing_tables)
+        else:
+            self.table_select_combo.addItem("(No tables found)")
             self.table_select_combo.setEnabled(False)
     
-    def update_table_selection_ui(self):
+    def on_tables_failed(self, error):
+        """Show why the table list could not be loaded"""
+        self.table_select_combo.clear()
+        self.table_select_combo.addItem(f"Error loading tables: {error}")
+        self.table_select_combo.setEnabled(False)
+    
+    def update_table_selection_ui(self, checked=True):
         """Update the table selection UI based on the selected import mode"""
+        # Each click toggles two radios; only the one being checked needs to update the UI
+        if not checked:
+            return
+        
         if self.create_new_radio.isChecked():
             self.table_name_widget.show()
             self.table_select_widget.hide()
@@ -3100,7 +4198,11 @@ class DataImportDialog(QDialog):
                             not current_text.startswith("Error") and
                             (current_text.startswith("📊 ") or current_text not in ["(No tables found)"]))
         
-        self.import_button.setEnabled(has_file and has_table_info)
+        # Skip setEnabled (and the stylesheet repolish it triggers) when nothing changed
+        enabled = bool(has_file and has_table_info)
+        if enabled != self._last_enabled_state:
+            self._last_enabled_state = enabled
+            self.import_button.setEnabled(enabled)
     
     def get_import_info(self):
         file_path = self.file_path_edit.text()
@@ -3110,10 +4212,8 @@ class DataImportDialog(QDialog):
         if self.create_new_radio.isChecked():
             table_name = self.table_name_edit.text().strip()
         else:  # append or replace mode
-            table_name = self.table_select_combo.currentText()
-            # Remove icon prefix if present
-            if table_name.startswith("📊 "):
-                table_name = table_name[2:]  # Remove "📊 " prefix
+            # The raw table name is stored with each item, without the icon prefix
+            table_name = self.table_select_combo.currentData() or self.table_select_combo.currentText()
         
         import_info = {
             'file_path': file_path,
@@ -3137,11 +4237,19 @@ class DataImportDialog(QDialog):
 class QueryTab(QWidget):
     schema_changed = pyqtSignal()  # Signal to notify when schema might have changed
     
+    # Statements that may change the schema, found in one case-insensitive pass over the query text
+    _DDL_RE = re.compile(r'\b(?:CREATE|DROP|ALTER)\s+(?:TABLE|VIEW|INDEX)\b', re.IGNORECASE)
+    
+    # Whitespace and comments in front of the first keyword of a query (selections use U+2029 for newlines)
+    _LEADING_NOISE_RE = re.compile(r'(?:\s+|--[^\n\u2029]*|/\*.*?\*/)*', re.DOTALL)
+    
     def __init__(self, parent=None, connection=None, connection_info=None):
         super().__init__(parent)
         self.connection = connection
         self.connection_info = connection_info
         self.query_worker = None
+        self._retired_workers = []  # Replaced query workers, kept alive until their thread stops
+        self._last_query_text = ''  # Text of the query most recently sent to the worker
         self.table_names = []
         self.column_names = []
         
@@ -3405,13 +4513,17 @@ class QueryTab(QWidget):
             
         if not query:
             return
+        
+        # Keep the executed text for the schema-change check, rather than copying the editor again
+        self._last_query_text = query
             
         # Show what's being executed
         query_preview = query[:100] + "..." if len(query) > 100 else query
         self.results_info.setText(f"Executing {execution_type}: {query_preview}")
         
-        # Disable editor during execution
+        # Disable editor during execution, and export until every row has arrived
         self.editor.setReadOnly(True)
+        self.export_button.setEnabled(False)
         
         # Execute query in a separate thread with enhanced worker
         # Check user preference for lazy loading
@@ -3419,12 +4531,26 @@ class QueryTab(QWidget):
         lazy_enabled = settings.value('enable_lazy_loading', True, type=bool)
         lazy_threshold = settings.value('lazy_loading_threshold', 100000, type=int)
         
+        # A re-run replaces the previous worker; its late chunks and results must not reach the new model
+        if self.query_worker is not None:
+            for signal in (self.query_worker.chunk_ready, self.query_worker.finished,
+                           self.query_worker.lazy_finished, self.query_worker.error):
+                try:
+                    signal.disconnect()
+                except TypeError:
+                    pass  # Nothing connected
+            self._retired_workers = [worker for worker in self._retired_workers if worker.isRunning()]
+            if self.query_worker.isRunning():
+                self._retired_workers.append(self.query_worker)
+        
         self.query_worker = EnhancedQueryWorker(
             self.connection, 
             query, 
             use_lazy_loading=lazy_enabled,
             row_limit=lazy_threshold
         )
+        self._streamed_model = None
+        self.query_worker.chunk_ready.connect(self.handle_query_chunk)
         self.query_worker.finished.connect(self.handle_query_results)
         self.query_worker.lazy_finished.connect(self.handle_lazy_query_results)
         self.query_worker.error.connect(self.handle_query_error)
@@ -3438,27 +4564,34 @@ class QueryTab(QWidget):
         else:
             QMessageBox.information(self, "No Selection", "Please select some text in the query editor first.")
     
-    def handle_query_results(self, df, execution_time):
-        """Handle regular query results (smaller datasets)"""
+    def handle_query_chunk(self, df):
+        """Show the first chunk of a regular result at once, then append the rest as it arrives"""
+        if self._streamed_model is not None:
+            self._streamed_model.append_rows(df)
+            return
+        
         # Update table model with results
-        self.model = PandasTableModel(df)
+        self.model = self._streamed_model = PandasTableModel(df)
         self.results_table.setModel(self.model)
         
         # Auto-resize columns for better visibility
         for i in range(self.model.columnCount()):
             self.results_table.setColumnWidth(i, 200)
+    
+    def handle_query_results(self, row_count, execution_time):
+        """Handle regular query results (smaller datasets) once every chunk has arrived"""
+        if self._streamed_model is None:
+            self.handle_query_chunk(pd.DataFrame())
+        self._streamed_model = None
         
         # Update results info
-        row_count = len(df)
         self.results_info.setText(f"{row_count:,} {'row' if row_count == 1 else 'rows'} returned in {execution_time:.3f} seconds")
         
         # Enable export button if we have results
         self.export_button.setEnabled(row_count > 0)
         
         # Check if this was a DDL statement that might have changed the schema
-        query = self.editor.toPlainText().strip().upper()
-        ddl_keywords = ['CREATE TABLE', 'DROP TABLE', 'ALTER TABLE', 'CREATE VIEW', 'DROP VIEW', 'CREATE INDEX', 'DROP INDEX']
-        if any(keyword in query for keyword in ddl_keywords):
+        if self._may_change_schema(self._last_query_text):
             self.schema_changed.emit()
         
         # Re-enable editor
@@ -3492,14 +4625,23 @@ class QueryTab(QWidget):
         self.export_button.setEnabled(row_count > 0)
         
         # Check if this was a DDL statement that might have changed the schema
-        query = self.editor.toPlainText().strip().upper()
-        ddl_keywords = ['CREATE TABLE', 'DROP TABLE', 'ALTER TABLE', 'CREATE VIEW', 'DROP VIEW', 'CREATE INDEX', 'DROP INDEX']
-        if any(keyword in query for keyword in ddl_keywords):
+        if self._may_change_schema(self._last_query_text):
             self.schema_changed.emit()
         
         # Re-enable editor
         self.editor.setReadOnly(False)
     
+    def _may_change_schema(self, query):
+        """Whether a successful query could have changed the schema"""
+        query = query.rstrip().rstrip(';')
+        query = query[self._LEADING_NOISE_RE.match(query).end():]
+        # A single plain statement can only be DDL if its first keyword is one of these;
+        # scripts and WITH/parenthesised prefixes get the full search
+        head = query[:6].upper()
+        if ';' not in query and not head.startswith(('WITH', '(')):
+            return head.startswith(('CREATE', 'DROP', 'ALTER')) and self._DDL_RE.match(query) is not None
+        return self._DDL_RE.search(query) is not None
+    
     def handle_query_error(self, error_message):
         self.results_info.setText(f"Error: {error_message}")
         self.export_button.setEnabled(False)  # Disable export on error
@@ -3706,11 +4848,9 @@ class QueryTab(QWidget):
                 QMessageBox.information(self, "No Data", "No results to export.")
                 return
             
-            # Get the dataframe from the model
-            df = self.model._data.copy()
-            
             if format_type == 'clipboard':
                 # Copy to clipboard
+                df = self.model.display_frame().copy()
                 df.to_clipboard(index=False, sep='\t')
                 QMessageBox.information(self, "Export Successful", 
                                       f"Results copied to clipboard!\n\n"
@@ -3749,115 +4889,89 @@ class QueryTab(QWidget):
             
             if not file_path:
                 return  # User cancelled
+
+            # Lazily loaded results are streamed from the database in batches
+            if isinstance(self.model, LazyLoadTableModel) and format_type in ('csv', 'tsv', 'parquet'):
+                self.start_export_worker(file_path, format_type)
+                return
             
-            # Export based on format
-            if format_type == 'csv':
-                df.to_csv(file_path, index=False, encoding='utf-8')
-                
-            elif format_type == 'excel':
-                if openpyxl is None:
-                    QMessageBox.warning(self, "Excel Export Unavailable", 
-                                      "Excel export requires the 'openpyxl' package.\n"
-                                      "Please install it with: pip install openpyxl")
-                    return
-                
-                with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                    df.to_excel(writer, sheet_name='Query Results', index=False)
-                    
-                    # Auto-adjust column widths
-                    worksheet = writer.sheets['Query Results']
-                    for column in worksheet.columns:
-                        max_length = 0
-                        column_letter = column[0].column_letter
-                        for cell in column:
-                            try:
-                                if len(str(cell.value)) > max_length:
-                                    max_length = len(str(cell.value))
-                            except:
-                                pass
-                        adjusted_width = min(max_length + 2, 50)
-                        worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-            elif format_type == 'json':
-                df.to_json(file_path, orient='records', indent=2, date_format='iso')
-                
-            elif format_type == 'parquet':
-                df.to_parquet(file_path, index=False)
-                
-            elif format_type == 'tsv':
-                df.to_csv(file_path, index=False, sep='\t', encoding='utf-8')
-                
-            elif format_type == 'html':
-                html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Query Results</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; font-weight: bold; }}
-        tr:nth-child(even) {{ background-color: #f9f9f9; }}
-        .info {{ margin-bottom: 20px; color: #666; }}
-    </style>
-</head>
-<body>
-    <h1>Query Results</h1>
-    <div class="info">
-        <p>Exported on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        <p>Rows: {len(df):,} | Columns: {len(df.columns)}</p>
-    </div>
-    {df.to_html(index=False, escape=False, classes='results-table')}
-</body>
-</html>
-                """
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                
-            elif format_type == 'xml':
-                xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-                xml_content += '<query_results>\n'
-                xml_content += f'  <metadata>\n'
-                xml_content += f'    <export_date>{pd.Timestamp.now().isoformat()}</export_date>\n'
-                xml_content += f'    <row_count>{len(df)}</row_count>\n'
-                xml_content += f'    <column_count>{len(df.columns)}</column_count>\n'
-                xml_content += f'  </metadata>\n'
-                xml_content += '  <data>\n'
-                
-                for _, row in df.iterrows():
-                    xml_content += '    <row>\n'
-                    for col in df.columns:
-                        # Clean column name for XML
-                        clean_col = str(col).replace(' ', '_').replace('-', '_')
-                        clean_col = ''.join(c for c in clean_col if c.isalnum() or c == '_')
-                        value = str(row[col]) if pd.notna(row[col]) else ''
-                        # Escape XML special characters
-                        value = value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                        xml_content += f'      <{clean_col}>{value}</{clean_col}>\n'
-                    xml_content += '    </row>\n'
-                
-                xml_content += '  </data>\n'
-                xml_content += '</query_results>'
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(xml_content)
+            if format_type == 'excel' and openpyxl is None:
+                QMessageBox.warning(self, "Excel Export Unavailable", 
+                                  "Excel export requires the 'openpyxl' package.\n"
+                                  "Please install it with: pip install openpyxl")
+                return
             
-            # Show success message
-            file_size = os.path.getsize(file_path) / 1024  # Size in KB
-            size_text = f"{file_size:.1f} KB" if file_size < 1024 else f"{file_size/1024:.1f} MB"
+            # In-memory results are written on a worker thread, straight from the model's frame without a copy
+            self.start_export_worker(file_path, format_type, frame=self.model.display_frame())
             
-            QMessageBox.information(self, "Export Successful", 
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error",
+                               f"Failed to export results:\n\n{str(e)}")
+            print(f"Export error: {e}")
+
+    def start_export_worker(self, file_path, format_type, frame=None):
+        """Start the streaming export worker thread with progress dialog"""
+        # Create and show progress dialog
+        self.export_progress_dialog = ProgressDialog(self, "Exporting Results...")
+
+        # Create and start worker thread
+        if frame is None:
+            self.export_worker = ExportWorker(
+                self.model.connection,
+                self.model.query,
+                file_path,
+                format_type,
+                total_rows=self.model.total_rows
+            )
+        else:
+            self.export_worker = ExportWorker(
+                None,
+                None,
+                file_path,
+                format_type,
+                total_rows=len(frame),
+                frame=frame
+            )
+
+        # Connect worker signals
+        self.export_worker.progress.connect(self.export_progress_dialog.queue_progress)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.error.connect(self.on_export_error)
+
+        # Connect progress dialog cancel to worker cancellation
+        self.export_progress_dialog.rejected.connect(self.export_worker.cancel)
+
+        # Start the worker and show progress dialog
+        self.export_worker.start()
+        self.export_progress_dialog.exec()
+
+    def on_export_finished(self, success, message):
+        """Handle streaming export completion"""
+        self.export_progress_dialog.accept()
+
+        if success:
+            file_path = self.export_worker.file_path
+            try:
+                file_size = os.path.getsize(file_path) / 1024  # Size in KB
+            except OSError:
+                file_size = 0
+            size_text = f"{file_size:.1f} KB" if file_size < 1024 else f"{file_size/1024:.1f} MB"
+
+            QMessageBox.information(self, "Export Successful",
                                   f"Results exported successfully!\n\n"
                                   f"📁 File: {os.path.basename(file_path)}\n"
-                                  f"📊 Data: {len(df):,} rows × {len(df.columns)} columns\n"
+                                  f"📊 Data: {self.export_worker.rows_written:,} rows × {self.model.columnCount()} columns\n"
                                   f"💾 Size: {size_text}\n"
                                   f"📍 Location: {file_path}")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", 
-                               f"Failed to export results:\n\n{str(e)}")
-            print(f"Export error: {e}")
+        else:
+            QMessageBox.warning(self, "Export Cancelled", message)
+
+    def on_export_error(self, error_message):
+        """Handle streaming export error"""
+        self.export_progress_dialog.reject()
+
+        QMessageBox.critical(self, "Export Error", f"Failed to export results:\n\n{error_message}")
+        print(f"Export error: {error_message}")
 
 # Database schema browser
 class SchemaBrowser(QTreeWidget):
@@ -4108,19 +5222,18 @@ class SchemaBrowser(QTreeWidget):
         db_item.setIcon(0, qta.icon('fa5s.database', color=ColorScheme.ACCENT))
         
         # Get list of tables
-        tables_df = connection.execute("SHOW TABLES").fetchdf()
+        table_rows = connection.execute("SHOW TABLES").fetchall()
         
         # Tables group
         tables_item = QTreeWidgetItem(db_item, ["Tables"])
         tables_item.setIcon(0, qta.icon('fa5s.folder', color=ColorScheme.ACCENT))
         
-        if tables_df.empty:
+        if not table_rows:
             # Show "No tables" message when database is empty
             no_tables_item = QTreeWidgetItem(tables_item, ["(No tables)"])
             no_tables_item.setIcon(0, qta.icon('fa5s.info-circle', color=ColorScheme.COMMENT))
         else:
-            for _, row in tables_df.iterrows():
-                table_name = row['name']
+            for (table_name,) in table_rows:
                 self.table_names.append(table_name)  # Collect table name for auto-completion
                 
                 table_item = QTreeWidgetItem(tables_item, [table_name])
@@ -4533,15 +5646,63 @@ class SchemaBrowser(QTreeWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Unexpected error while deleting column '{column_name}' from table '{table_name}':\n{str(e)}")
 
+# Shared icon cache so identical toolbar/menu icons are only rendered once
+_ICON_CACHE = {}
+
+def _icon(name, color=None):
+    """Return a cached qtawesome icon"""
+    key = (name, color.name() if isinstance(color, QColor) else color)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = qta.icon(name, color=color) if color is not None else qta.icon(name)
+        _ICON_CACHE[key] = icon
+    return icon
+
+# Status bar message shown after a successful single-file import
+_IMPORT_SUCCESS_TEMPLATE = "✅ {message} Table '{table}' loaded from {file}"
+
+# Main window actions: (attribute, icon, icon color, text, shortcut, slot, status tip)
+_ACTIONS = (
+    # File actions
+    ('new_action', 'fa5s.file', ColorScheme.TEXT, "&New Query", QKeySequence.StandardKey.New, 'add_tab', None),
+    ('open_action', 'fa5s.folder-open', ColorScheme.TEXT, "&Open Query...", QKeySequence.StandardKey.Open, 'open_query', None),
+    ('save_action', 'fa5s.save', ColorScheme.TEXT, "&Save Query", QKeySequence.StandardKey.Save, 'save_query', None),
+    ('save_as_action', None, None, "Save Query &As...", QKeySequence.StandardKey.SaveAs, 'save_query_as', None),
+    ('exit_action', None, None, "E&xit", QKeySequence.StandardKey.Quit, 'close', None),
+    # Database actions
+    ('connect_action', 'fa5s.plug', ColorScheme.TEXT, "&Connect to Database...", None, 'show_connection_dialog', None),
+    ('disconnect_action', 'fa5s.power-off', ColorScheme.ERROR, "&Disconnect", None, 'disconnect_database', None),
+    ('reconnect_main_action', 'fa5s.home', ColorScheme.ACCENT, "Reconnect to &Main Database", "Ctrl+M", 'auto_connect_main_database', None),
+    ('import_data_action', 'fa5s.file-import', ColorScheme.SUCCESS, "&Import Data...", "Ctrl+I", 'show_import_dialog', None),
+    ('folder_import_action', 'fa5s.folder-plus', ColorScheme.WARNING, "Folder &Import...", "Ctrl+Shift+F", 'show_folder_import_dialog',
+     "Import entire folders of CSV or Excel files"),
+    ('csv_automation_action', 'fa5s.cogs', ColorScheme.ACCENT, "CSV Automation...", "Ctrl+Alt+A", 'show_csv_automation_dialog',
+     "Automate processing of multiple CSV folder sources with SQL"),
+    # Query actions
+    ('execute_action', 'fa5s.play', ColorScheme.SUCCESS, "&Execute Query", "F5", 'execute_current_query', None),
+    ('execute_selection_action', 'fa5s.play-circle', ColorScheme.ACCENT, "Execute &Selection", "Ctrl+E", 'execute_selected_query', None),
+    ('export_results_action', 'fa5s.download', '#2196F3', "Export &Results", "Ctrl+Shift+E", 'export_current_results', None),
+    # Tools actions
+    ('settings_action', 'fa5s.cog', None, "&Settings", None, 'show_settings_dialog',
+     "Configure lazy loading and performance settings"),
+)
+
 # Main application window
 class SQLEditorApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("SQL Editor")
         self.resize(1200, 800)
-        self.connections = {}
+        self.connections = {}  # {(db_type, normalized_path): connection}
         self.current_connection = None
         self.current_connection_info = None
+        self._tabs = []  # Open QueryTab widgets, in creation order
+        self._insert_stmts = {}  # {(table_name, columns): parameterized INSERT}
+        self._table_name_cache = None  # Lower-cased table names on the current connection
+        self._schema_cache = {}  # {table_name: set of column names}
+        self._table_cache = {}  # {id(connection): table names in display order}
+        self._duckdb_stage = None  # In-memory DuckDB engine, started on first use
+        self._sqlite_bulk_depth = 0  # Open _sqlite_fast_bulk scopes
         
         # Set application style
         self.setup_style()
@@ -4591,6 +5752,13 @@ class SQLEditorApp(QMainWindow):
         # Create menus
         self.create_menus()
         
+        # Connection-dependent actions stay disabled until a database is connected
+        self._update_connection_dependent_actions(False)
+        
+        # Create the import progress dialog once and reuse it for every import
+        self._progress_dialog = ProgressDialog(self, "Importing File...")
+        self._progress_dialog.rejected.connect(self.cancel_import)
+        
         # Add initial tab
         self.add_tab()
         
@@ -4610,11 +5778,8 @@ class SQLEditorApp(QMainWindow):
             current_dir = os.path.dirname(os.path.abspath(__file__))
             db_path = os.path.join(current_dir, "main.duckdb")
             
-            # Create the database if it doesn't exist
+            # Connecting creates the database if it doesn't exist, so no separate connection is opened for it
             if not os.path.exists(db_path):
-                # Create an empty DuckDB database
-                temp_conn = duckdb.connect(db_path)
-                temp_conn.close()
                 self.status_bar.showMessage(f"Created new database: {db_path}")
             
             # Connection info for the main database
@@ -4636,8 +5801,24 @@ class SQLEditorApp(QMainWindow):
             self.status_bar.showMessage(f"Failed to auto-connect: {str(e)}")
             print(f"Auto-connect error: {e}")
     
+    def duckdb_stage(self):
+        """Return the app's in-memory DuckDB connection, used to create new database files"""
+        if self._duckdb_stage is None:
+            # It only writes small metadata tables, so keep its thread pool and memory budget small
+            self._duckdb_stage = duckdb.connect()
+            self._duckdb_stage.execute("PRAGMA threads=1")
+            self._duckdb_stage.execute("PRAGMA memory_limit='256MB'")
+        return self._duckdb_stage
+    
+    def _invalidate_schema_cache(self):
+        """Forget cached table names and columns after a connection or schema change"""
+        self._table_name_cache = None
+        self._schema_cache.clear()
+        self._table_cache.clear()
+    
     def refresh_schema_browser(self):
         """Refresh the schema browser with comprehensive connection validation and recovery"""
+        self._invalidate_schema_cache()
         if not self.current_connection_info:
             print("No connection info available for schema refresh")
             return
@@ -4681,6 +5862,25 @@ class SQLEditorApp(QMainWindow):
         # Show a user-friendly message
         self.status_bar.showMessage("Connection lost - please reconnect to database", 5000)
     
+    @staticmethod
+    def _connection_key(db_type, file_path):
+        """Build the connection cache key so different spellings of a path share one entry"""
+        return (db_type.lower(), os.path.normcase(os.path.abspath(file_path)))
+    
+    def open_connection(self, db_type, file_path):
+        """Return the cached connection to a database file, opening it on first use"""
+        connection_key = self._connection_key(db_type, file_path)
+        connection = self.connections.get(connection_key)
+        if connection is None:
+            if db_type.lower() in ["sqlite", "sqlite3"]:
+                connection = sqlite3.connect(file_path)
+            elif db_type.lower() == "duckdb":
+                connection = duckdb.connect(file_path)
+            else:
+                raise ValueError(f"Unsupported database type: {db_type}")
+            self.connections[connection_key] = connection
+        return connection
+    
     def reconnect_current_database(self):
         """Reconnect to the current database with enhanced error handling and reference updates"""
         if not self.current_connection_info:
@@ -4701,13 +5901,12 @@ class SQLEditorApp(QMainWindow):
             db_type = self.current_connection_info["type"]
             file_path = self.current_connection_info.get("file_path") or self.current_connection_info.get("path")
             
+            # Failures below raise, so every one of them disables the connection-dependent actions
             if not file_path:
-                print("No database file path available for reconnection")
-                return False
+                raise ValueError("No database file path available for reconnection")
             
             if not os.path.exists(file_path):
-                print(f"Database file does not exist: {file_path}")
-                return False
+                raise FileNotFoundError(f"Database file does not exist: {file_path}")
             
             # Create new connection based on database type
             print(f"Reconnecting to {db_type} database: {file_path}")
@@ -4717,21 +5916,20 @@ class SQLEditorApp(QMainWindow):
             elif db_type.lower() == "duckdb":
                 self.current_connection = duckdb.connect(file_path)
             else:
-                print(f"Unsupported database type: {db_type}")
-                return False
+                raise ValueError(f"Unsupported database type: {db_type}")
             
             # Test the new connection
             test_result = self.current_connection.execute("SELECT 1 AS test").fetchone()
             if not test_result:
                 raise Exception("New connection test failed")
+            self._invalidate_schema_cache()
             
             # Update connection cache
-            connection_key = f"{db_type}:{file_path}"
+            connection_key = self._connection_key(db_type, file_path)
             self.connections[connection_key] = self.current_connection
             
             # Update all tabs with the new connection
-            for i in range(self.tab_widget.count()):
-                tab = self.tab_widget.widget(i)
+            for tab in self._tabs:
                 if hasattr(tab, 'connection'):
                     tab.connection = self.current_connection
                 if hasattr(tab, 'connection_info'):
@@ -4742,6 +5940,7 @@ class SQLEditorApp(QMainWindow):
             
             # Update status
             self.status_bar.showMessage(f"Successfully reconnected to {os.path.basename(file_path)}", 3000)
+            self._update_connection_dependent_actions(True)
             
             print(f"Successfully reconnected to {file_path}")
             return True
@@ -4749,15 +5948,14 @@ class SQLEditorApp(QMainWindow):
         except Exception as e:
             print(f"Failed to reconnect to database: {e}")
             self.current_connection = None
+            self._update_connection_dependent_actions(False)
             self.status_bar.showMessage(f"Reconnection failed: {str(e)}", 5000)
             return False
             
     def update_all_tabs_completions(self, table_names, column_names):
         """Update auto-completion for all query tabs when schema changes"""
-        for i in range(self.tab_widget.count()):
-            tab = self.tab_widget.widget(i)
-            if isinstance(tab, QueryTab):
-                tab.update_schema_completions(table_names, column_names)
+        for tab in self._tabs:
+            tab.update_schema_completions(table_names, column_names)
     
     def check_schema_changes(self):
         """Check for schema changes and refresh if needed"""
@@ -4817,7 +6015,7 @@ class SQLEditorApp(QMainWindow):
         
         # Create Database button
         self.create_db_button = QToolButton()
-        self.create_db_button.setIcon(qta.icon('fa5s.plus-circle', color=ColorScheme.SUCCESS))
+        self.create_db_button.setIcon(_icon('fa5s.plus-circle', color=ColorScheme.SUCCESS))
         self.create_db_button.setText("Create DB")
         self.create_db_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.create_db_button.clicked.connect(self.show_create_database_dialog)
@@ -4825,7 +6023,7 @@ class SQLEditorApp(QMainWindow):
         
         # Connect button
         self.connect_button = QToolButton()
-        self.connect_button.setIcon(qta.icon('fa5s.plug', color=ColorScheme.TEXT))
+        self.connect_button.setIcon(_icon('fa5s.plug', color=ColorScheme.TEXT))
         self.connect_button.setText("Connect")
         self.connect_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.connect_button.clicked.connect(self.show_connection_dialog)
@@ -4833,7 +6031,7 @@ class SQLEditorApp(QMainWindow):
         
         # Reconnect to Main DB button
         self.reconnect_main_button = QToolButton()
-        self.reconnect_main_button.setIcon(qta.icon('fa5s.home', color=ColorScheme.ACCENT))
+        self.reconnect_main_button.setIcon(_icon('fa5s.home', color=ColorScheme.ACCENT))
         self.reconnect_main_button.setText("Main DB")
         self.reconnect_main_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.reconnect_main_button.setToolTip("Reconnect to main.duckdb")
@@ -4844,7 +6042,7 @@ class SQLEditorApp(QMainWindow):
         
         # Execute button
         self.execute_button = QToolButton()
-        self.execute_button.setIcon(qta.icon('fa5s.play', color=ColorScheme.SUCCESS))
+        self.execute_button.setIcon(_icon('fa5s.play', color=ColorScheme.SUCCESS))
         self.execute_button.setText("Execute")
         self.execute_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.execute_button.setToolTip("Execute entire query (F5)")
@@ -4853,7 +6051,7 @@ class SQLEditorApp(QMainWindow):
         
         # Execute Selection button
         self.execute_selection_button = QToolButton()
-        self.execute_selection_button.setIcon(qta.icon('fa5s.play-circle', color=ColorScheme.ACCENT))
+        self.execute_selection_button.setIcon(_icon('fa5s.play-circle', color=ColorScheme.ACCENT))
         self.execute_selection_button.setText("Execute Selection")
         self.execute_selection_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.execute_selection_button.setToolTip("Execute selected text only (Ctrl+E)")
@@ -4862,7 +6060,7 @@ class SQLEditorApp(QMainWindow):
         
         # Export Results button
         self.export_results_button = QToolButton()
-        self.export_results_button.setIcon(qta.icon('fa5s.download', color='#2196F3'))
+        self.export_results_button.setIcon(_icon('fa5s.download', color='#2196F3'))
         self.export_results_button.setText("Export Results")
         self.export_results_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.export_results_button.setToolTip("Export query results (Ctrl+Shift+E)")
@@ -4871,7 +6069,7 @@ class SQLEditorApp(QMainWindow):
         
         # New tab button
         self.new_tab_button = QToolButton()
-        self.new_tab_button.setIcon(qta.icon('fa5s.plus', color=ColorScheme.TEXT))
+        self.new_tab_button.setIcon(_icon('fa5s.plus', color=ColorScheme.TEXT))
         self.new_tab_button.setText("New Tab")
         self.new_tab_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.new_tab_button.clicked.connect(self.add_tab)
@@ -4881,7 +6079,7 @@ class SQLEditorApp(QMainWindow):
         
         # Save button
         self.save_button = QToolButton()
-        self.save_button.setIcon(qta.icon('fa5s.save', color=ColorScheme.TEXT))
+        self.save_button.setIcon(_icon('fa5s.save', color=ColorScheme.TEXT))
         self.save_button.setText("Save")
         self.save_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.save_button.clicked.connect(self.save_query)
@@ -4889,7 +6087,7 @@ class SQLEditorApp(QMainWindow):
         
         # Open button
         self.open_button = QToolButton()
-        self.open_button.setIcon(qta.icon('fa5s.folder-open', color=ColorScheme.TEXT))
+        self.open_button.setIcon(_icon('fa5s.folder-open', color=ColorScheme.TEXT))
         self.open_button.setText("Open")
         self.open_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.open_button.clicked.connect(self.open_query)
@@ -4899,7 +6097,7 @@ class SQLEditorApp(QMainWindow):
         
         # Import Data button
         self.import_data_button = QToolButton()
-        self.import_data_button.setIcon(qta.icon('fa5s.file-import', color=ColorScheme.SUCCESS))
+        self.import_data_button.setIcon(_icon('fa5s.file-import', color=ColorScheme.SUCCESS))
         self.import_data_button.setText("Import Data")
         self.import_data_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.import_data_button.setToolTip("Import data from CSV, Excel, Parquet, JSON files")
@@ -4908,7 +6106,7 @@ class SQLEditorApp(QMainWindow):
         
         # Folder Import button
         self.folder_import_button = QToolButton()
-        self.folder_import_button.setIcon(qta.icon('fa5s.folder-plus', color=ColorScheme.WARNING))
+        self.folder_import_button.setIcon(_icon('fa5s.folder-plus', color=ColorScheme.WARNING))
         self.folder_import_button.setText("Folder Import")
         self.folder_import_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.folder_import_button.setToolTip("Import entire folders of CSV or Excel files (Ctrl+Shift+F)")
@@ -4919,7 +6117,7 @@ class SQLEditorApp(QMainWindow):
         
         # CSV Automation button
         self.csv_automation_button = QToolButton()
-        self.csv_automation_button.setIcon(qta.icon('fa5s.cogs', color=ColorScheme.ACCENT))
+        self.csv_automation_button.setIcon(_icon('fa5s.cogs', color=ColorScheme.ACCENT))
         self.csv_automation_button.setText("CSV Automation")
         self.csv_automation_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.csv_automation_button.setToolTip("Automate processing of multiple CSV folders with SQL (Ctrl+Alt+A)")
@@ -4927,99 +6125,66 @@ class SQLEditorApp(QMainWindow):
         self.toolbar.addWidget(self.csv_automation_button)
     
     def create_actions(self):
-        # File actions
-        self.new_action = QAction(qta.icon('fa5s.file', color=ColorScheme.TEXT), "&New Query", self)
-        self.new_action.setShortcut(QKeySequence.StandardKey.New)
-        self.new_action.triggered.connect(self.add_tab)
-        
-        self.open_action = QAction(qta.icon('fa5s.folder-open', color=ColorScheme.TEXT), "&Open Query...", self)
-        self.open_action.setShortcut(QKeySequence.StandardKey.Open)
-        self.open_action.triggered.connect(self.open_query)
-        
-        self.save_action = QAction(qta.icon('fa5s.save', color=ColorScheme.TEXT), "&Save Query", self)
-        self.save_action.setShortcut(QKeySequence.StandardKey.Save)
-        self.save_action.triggered.connect(self.save_query)
-        
-        self.save_as_action = QAction("Save Query &As...", self)
-        self.save_as_action.setShortcut(QKeySequence.StandardKey.SaveAs)
-        self.save_as_action.triggered.connect(self.save_query_as)
-        
-        self.exit_action = QAction("E&xit", self)
-        self.exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        self.exit_action.triggered.connect(self.close)
-        
-        # Database actions
-        self.connect_action = QAction(qta.icon('fa5s.plug', color=ColorScheme.TEXT), "&Connect to Database...", self)
-        self.connect_action.triggered.connect(self.show_connection_dialog)
-        
-        self.disconnect_action = QAction(qta.icon('fa5s.power-off', color=ColorScheme.ERROR), "&Disconnect", self)
-        self.disconnect_action.triggered.connect(self.disconnect_database)
-        self.disconnect_action.setEnabled(False)
-        
-        self.reconnect_main_action = QAction(qta.icon('fa5s.home', color=ColorScheme.ACCENT), "Reconnect to &Main Database", self)
-        self.reconnect_main_action.setShortcut("Ctrl+M")
-        self.reconnect_main_action.triggered.connect(self.auto_connect_main_database)
-        
-        self.import_data_action = QAction(qta.icon('fa5s.file-import', color=ColorScheme.SUCCESS), "&Import Data...", self)
-        self.import_data_action.setShortcut("Ctrl+I")
-        self.import_data_action.triggered.connect(self.show_import_dialog)
-        
-        # Folder Import action
-        self.folder_import_action = QAction(qta.icon('fa5s.folder-plus', color=ColorScheme.WARNING), "Folder &Import...", self)
-        self.folder_import_action.setShortcut("Ctrl+Shift+F")
-        self.folder_import_action.setStatusTip("Import entire folders of CSV or Excel files")
-        self.folder_import_action.triggered.connect(self.show_folder_import_dialog)
-        
-
-        
-        # CSV Automation action
-        self.csv_automation_action = QAction(qta.icon('fa5s.cogs', color=ColorScheme.ACCENT), "CSV Automation...", self)
-        self.csv_automation_action.setShortcut("Ctrl+Alt+A")
-        self.csv_automation_action.setStatusTip("Automate processing of multiple CSV folder sources with SQL")
-        self.csv_automation_action.triggered.connect(self.show_csv_automation_dialog)
-        
-        # Query actions
-        self.execute_action = QAction(qta.icon('fa5s.play', color=ColorScheme.SUCCESS), "&Execute Query", self)
-        self.execute_action.setShortcut("F5")
-        self.execute_action.triggered.connect(self.execute_current_query)
-        
-        self.execute_selection_action = QAction(qta.icon('fa5s.play-circle', color=ColorScheme.ACCENT), "Execute &Selection", self)
-        self.execute_selection_action.setShortcut("Ctrl+E")
-        self.execute_selection_action.triggered.connect(self.execute_selected_query)
-        
-        # Export results action
-        self.export_results_action = QAction(qta.icon('fa5s.download', color='#2196F3'), "Export &Results", self)
-        self.export_results_action.setShortcut("Ctrl+Shift+E")
-        self.export_results_action.triggered.connect(self.export_current_results)
-        
-        # Settings action
-        self.settings_action = QAction(qta.icon('fa5s.cog'), "&Settings", self)
-        self.settings_action.setStatusTip("Configure lazy loading and performance settings")
-        self.settings_action.triggered.connect(self.show_settings_dialog)
+        # Build the main window actions from the _ACTIONS table
+        for attr, icon_name, color, text, shortcut, slot, status_tip in _ACTIONS:
+            if icon_name:
+                action = QAction(_icon(icon_name, color), text, self)
+            else:
+                action = QAction(text, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+            if status_tip:
+                action.setStatusTip(status_tip)
+            action.triggered.connect(getattr(self, slot))
+            setattr(self, attr, action)
         
         # Create keyboard shortcut for executing query with Ctrl+Enter
         self.execute_shortcut = QShortcut(QKeySequence("Ctrl+Return"), self)
         self.execute_shortcut.activated.connect(self.execute_current_query)
     
     def create_menus(self):
-        # File menu
+        # Create the menus empty; their actions are added the first time each one is shown
         self.file_menu = self.menuBar().addMenu("&File")
-        self.file_menu.addAction(self.new_action)
-        self.file_menu.addAction(self.open_action)
-        self.file_menu.addSeparator()
-        self.file_menu.addAction(self.save_action)
-        self.file_menu.addAction(self.save_as_action)
-        self.file_menu.addSeparator()
-        self.file_menu.addAction(self.exit_action)
+        self.file_menu.aboutToShow.connect(self._populate_file_menu)
         
         # Database menu
         self.db_menu = self.menuBar().addMenu("&Database")
+        self.db_menu.aboutToShow.connect(self._populate_db_menu)
         
         # Create new database action
-        self.create_db_action = QAction(qta.icon('fa5s.plus-circle'), "&Create New Database", self)
+        self.create_db_action = QAction(_icon('fa5s.plus-circle'), "&Create New Database", self)
         self.create_db_action.setShortcut(QKeySequence("Ctrl+N"))
         self.create_db_action.triggered.connect(self.show_create_database_dialog)
         
+        # Query menu
+        self.query_menu = self.menuBar().addMenu("&Query")
+        self.query_menu.aboutToShow.connect(self._populate_query_menu)
+        
+        # Tools menu
+        self.tools_menu = self.menuBar().addMenu("&Tools")
+        self.tools_menu.addAction(self.settings_action)
+        
+        # Register shortcut-bearing actions on the window so they work before any menu is opened
+        for action in (self.new_action, self.open_action, self.save_action, self.save_as_action,
+                       self.exit_action, self.create_db_action, self.reconnect_main_action,
+                       self.import_data_action, self.folder_import_action, self.csv_automation_action,
+                       self.execute_action, self.execute_selection_action, self.export_results_action):
+            self.addAction(action)
+    
+    def _populate_file_menu(self):
+        """Fill the File menu on first show"""
+        self.file_menu.aboutToShow.disconnect(self._populate_file_menu)
+        self.file_menu.addAction(self.new_action)
+        self.file_menu.addAction(self.open_action)
+        self.file_menu.addSeparator()
+        self.file_menu.addAction(self.save_action)
+        self.file_menu.addAction(self.save_as_action)
+        self.file_menu.addSeparator()
+        self.file_menu.addAction(self.exit_action)
+    
+    def _populate_db_menu(self):
+        """Fill the Database menu on first show"""
+        self.db_menu.aboutToShow.disconnect(self._populate_db_menu)
         self.db_menu.addAction(self.create_db_action)
         self.db_menu.addSeparator()
         self.db_menu.addAction(self.connect_action)
@@ -5029,30 +6194,31 @@ class SQLEditorApp(QMainWindow):
         self.db_menu.addAction(self.import_data_action)
         self.db_menu.addAction(self.folder_import_action)
         self.db_menu.addAction(self.csv_automation_action)
-        
-        # Query menu
-        self.query_menu = self.menuBar().addMenu("&Query")
+    
+    def _populate_query_menu(self):
+        """Fill the Query menu on first show"""
+        self.query_menu.aboutToShow.disconnect(self._populate_query_menu)
         self.query_menu.addAction(self.execute_action)
         self.query_menu.addAction(self.execute_selection_action)
         self.query_menu.addSeparator()
         self.query_menu.addAction(self.export_results_action)
-        
-        # Tools menu
-        self.tools_menu = self.menuBar().addMenu("&Tools")
-        self.tools_menu.addAction(self.settings_action)
     
     def add_tab(self):
         # Create new query tab
         tab = QueryTab(connection=self.current_connection, connection_info=self.current_connection_info)
         # Connect schema change signal
         tab.schema_changed.connect(self.refresh_schema_browser)
+        self._tabs.append(tab)
         tab_index = self.tab_widget.addTab(tab, f"Query {self.tab_widget.count() + 1}")
         self.tab_widget.setCurrentIndex(tab_index)
         tab.editor.setFocus()
     
     def close_tab(self, index):
         if self.tab_widget.count() > 1:
+            tab = self.tab_widget.widget(index)
             self.tab_widget.removeTab(index)
+            if tab in self._tabs:
+                self._tabs.remove(tab)
         else:
             # If it's the last tab, clear it instead of closing
             tab = self.tab_widget.widget(0)
@@ -5071,11 +6237,17 @@ class SQLEditorApp(QMainWindow):
             if connection_info and connection_info.get('file_path'):
                 self.connect_to_database(connection_info)
     
+    def _update_connection_dependent_actions(self, enabled):
+        """Enable or disable the actions and buttons that need a database connection"""
+        for widget in (self.disconnect_action, self.import_data_action, self.folder_import_action,
+                       self.import_data_button, self.folder_import_button,
+                       self.execute_action, self.execute_selection_action, self.export_results_action,
+                       self.execute_shortcut):
+            widget.setEnabled(enabled)
+    
     def show_import_dialog(self):
         if not self.current_connection:
-            QMessageBox.warning(self, "No Connection", "Please connect to a database first.")
-            return
-        
+            return  # The import actions are disabled without a connection; guard direct calls too
         dialog = DataImportDialog(self, self.current_connection, self.current_connection_info)
         if dialog.exec():
             import_info = dialog.get_import_info()
@@ -5095,9 +6267,7 @@ class SQLEditorApp(QMainWindow):
     def show_folder_import_dialog(self):
         """Show the folder import dialog"""
         if not self.current_connection:
-            QMessageBox.warning(self, "No Connection", "Please connect to a database first.")
-            return
-            
+            return  # The import actions are disabled without a connection; guard direct calls too
         try:
             dialog = FolderImportDialog(self, self.current_connection, self.current_connection_info)
             dialog.exec()
@@ -5211,50 +6381,88 @@ class SQLEditorApp(QMainWindow):
 
     def start_import_worker(self, import_info):
         """Start the import worker thread with progress dialog"""
-        # Create and show progress dialog
-        self.progress_dialog = ProgressDialog(self, "Importing File...")
+        # Reset the shared progress dialog for this import
+        self._progress_dialog.setWindowTitle("Importing File...")
+        self._progress_dialog.reset()
         
         # Create and start worker thread
         self.import_worker = ImportWorker(self, import_info)
         
         # Connect worker signals
-        self.import_worker.progress.connect(self.progress_dialog.update_progress)
+        self.import_worker.progress.connect(self._progress_dialog.queue_progress)
         self.import_worker.finished.connect(self.on_import_finished)
         self.import_worker.error.connect(self.on_import_error)
         
-        # Connect progress dialog cancel to worker termination
-        self.progress_dialog.rejected.connect(self.cancel_import)
-        
         # Start the worker and show progress dialog
         self.import_worker.start()
-        self.progress_dialog.exec()
+        self._progress_dialog.show()
     
     def on_import_finished(self, success, message):
         """Handle import completion"""
-        if hasattr(self, 'progress_dialog'):
-            self.progress_dialog.accept()
+        self._progress_dialog.hide()
         
         if success:
-            QMessageBox.information(self, "Import Successful", message)
+            import_info = self.import_worker.import_info
+            self.statusBar().showMessage(_IMPORT_SUCCESS_TEMPLATE.format(
+                message=message,
+                table=import_info.get('table_name', ''),
+                file=os.path.basename(import_info.get('file_path', ''))
+            ), 8000)
             self.refresh_schema_browser()
             self.check_schema_changes()
+        elif self.import_worker.cancelled:
+            self.statusBar().showMessage("Import cancelled", 3000)
+            QMessageBox.information(self, "Import Cancelled", "Import operation was cancelled.")
         else:
             QMessageBox.warning(self, "Import Failed", message)
     
     def on_import_error(self, error_message):
         """Handle import error"""
-        if hasattr(self, 'progress_dialog'):
-            self.progress_dialog.reject()
+        self._progress_dialog.hide()
         
         QMessageBox.critical(self, "Import Error", f"An error occurred during import:\n{error_message}")
     
     def cancel_import(self):
-        """Cancel the running import"""
+        """Ask the running import to stop; on_import_finished reports it once the worker has rolled back"""
         if hasattr(self, 'import_worker') and self.import_worker and self.import_worker.isRunning():
-            self.import_worker.cancel()  # Signal the worker to cancel gracefully
-            self.import_worker.terminate()  # Force terminate if needed
-            self.import_worker.wait()
-            QMessageBox.information(self, "Import Cancelled", "Import operation was cancelled.")
+            self.import_worker.cancel()  # The worker stops at the next chunk and then emits finished
+            self.statusBar().showMessage("Cancelling import...")
+    
+    def rollback_cancelled_import(self):
+        """Discard uncommitted SQLite rows written by an import that was cancelled"""
+        # DuckDB chunk loops run inside _duckdb_import_transaction, which rolls back on cancel
+        if self.current_connection_info['type'].lower() == 'duckdb':
+            return
+        try:
+            self.current_connection.rollback()
+        except Exception as e:
+            print(f"Nothing to roll back after cancelled import: {e}")
+    
+    @contextmanager
+    def _duckdb_import_transaction(self, worker=None):
+        """Run a chunked DuckDB import in one transaction, rolled back if it fails or is cancelled"""
+        if self.current_connection_info['type'].lower() != 'duckdb':
+            yield
+            return
+        conn = self.current_connection
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            yield
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if worker is not None and worker.cancelled:
+            conn.execute("ROLLBACK")
+            return
+        try:
+            conn.execute("COMMIT")
+        except duckdb.Error as e:
+            # A failed chunk aborted the transaction, so nothing of it is kept
+            print(f"Import transaction was not committed: {e}")
+            try:
+                conn.execute("ROLLBACK")
+            except duckdb.Error:
+                pass  # The failed COMMIT already ended the transaction
     
     def show_table_name_dialog(self, suggested_name, file_path, mode='create'):
         """Show a custom dialog for table name input with better visibility"""
@@ -5395,7 +6603,7 @@ class SQLEditorApp(QMainWindow):
         """Suggest a table name based on the file path"""
         base_name = os.path.splitext(os.path.basename(file_path))[0]
         # Clean table name (remove special characters, replace with underscores)
-        clean_name = re.sub(r'[^a-zA-Z0-9_]', '_', base_name).lower()
+        clean_name = _NON_IDENT_RE.sub('_', base_name).lower()
         # Remove consecutive underscores
         clean_name = re.sub(r'_+', '_', clean_name)
         # Remove leading/trailing underscores
@@ -5418,23 +6626,10 @@ class SQLEditorApp(QMainWindow):
                 QMessageBox.warning(self, "Connection Error", "Please specify a database file.")
                 return
             
-            # Check if we already have this connection
-            connection_key = f"{db_type}:{file_path}"
-            if connection_key in self.connections:
-                self.current_connection = self.connections[connection_key]
-                self.current_connection_info = connection_info
-            else:
-                # Create new connection
-                if db_type.lower() in ["sqlite", "sqlite3"]:
-                    connection = sqlite3.connect(file_path)
-                elif db_type.lower() == "duckdb":
-                    connection = duckdb.connect(file_path)
-                else:
-                    raise ValueError(f"Unsupported database type: {db_type}")
-                
-                self.connections[connection_key] = connection
-                self.current_connection = connection
-                self.current_connection_info = connection_info
+            # Reuse the connection if we already have one to this file
+            self.current_connection = self.open_connection(db_type, file_path)
+            self.current_connection_info = connection_info
+            self._invalidate_schema_cache()
             
             # Update UI - show special indicator for main database
             db_name = connection_info.get("name", os.path.basename(file_path))
@@ -5443,21 +6638,20 @@ class SQLEditorApp(QMainWindow):
             else:
                 self.connection_label.setText(f"Connected to {db_name} ({db_type})")
             
-            self.disconnect_action.setEnabled(True)
+            self._update_connection_dependent_actions(True)
             
             # Update schema browser
             self.schema_browser.load_schema(self.current_connection, self.current_connection_info)
             
             # Update all tabs with the new connection
-            for i in range(self.tab_widget.count()):
-                tab = self.tab_widget.widget(i)
+            for tab in self._tabs:
                 tab.connection = self.current_connection
                 tab.connection_info = self.current_connection_info
                 # Connect schema change signal if not already connected
                 try:
-                    tab.schema_changed.connect(self.refresh_schema_browser)
-                except:
-                    pass  # Signal might already be connected
+                    tab.schema_changed.connect(self.refresh_schema_browser, Qt.ConnectionType.UniqueConnection)
+                except TypeError:
+                    pass  # Signal is already connected
             
             self.statusBar().showMessage(f"Connected to {file_path}", 3000)
             
@@ -5468,24 +6662,24 @@ class SQLEditorApp(QMainWindow):
         if self.current_connection:
             # Close the connection
             file_path = self.current_connection_info.get("file_path") or self.current_connection_info.get("path")
-            connection_key = f"{self.current_connection_info['type']}:{file_path}"
-            if connection_key in self.connections:
+            connection_key = self._connection_key(self.current_connection_info['type'], file_path)
+            connection = self.connections.pop(connection_key, None)
+            if connection is not None:
                 try:
-                    self.connections[connection_key].close()
-                    del self.connections[connection_key]
-                except:
-                    pass
+                    connection.close()  # close() is idempotent in both drivers
+                except (sqlite3.Error, duckdb.Error) as e:
+                    logger.debug("Error closing connection %s: %s", file_path, e)
             
             # Update UI
             self.current_connection = None
             self.current_connection_info = None
+            self._invalidate_schema_cache()
             self.connection_label.setText("Not connected")
-            self.disconnect_action.setEnabled(False)
+            self._update_connection_dependent_actions(False)
             self.schema_browser.clear()
             
             # Update all tabs
-            for i in range(self.tab_widget.count()):
-                tab = self.tab_widget.widget(i)
+            for tab in self._tabs:
                 tab.connection = None
                 tab.connection_info = None
             
@@ -5506,9 +6700,13 @@ class SQLEditorApp(QMainWindow):
             file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
             
             if worker:
-                worker.progress.emit(5, f"Starting import: {os.path.basename(file_path)} ({file_size_mb:.1f} MB)")
+                worker.report_progress(5, f"Starting import: {os.path.basename(file_path)} ({file_size_mb:.1f} MB)")
             
-            # Use ultra-fast native import for maximum speed
+            # Use ultra-fast native import for maximum speed, relaxing SQLite durability once for the
+            # whole import rather than once per chunk
+            if self.current_connection_info['type'].lower() != 'duckdb':
+                with self._sqlite_fast_bulk():
+                    return self.ultra_fast_native_import(import_info, worker)
             return self.ultra_fast_native_import(import_info, worker)
             
         except Exception as e:
@@ -5537,7 +6735,7 @@ class SQLEditorApp(QMainWindow):
             print(f"Safe table name: {safe_table_name}")
             
             if worker:
-                worker.progress.emit(5, "Initializing ultra-fast native import...")
+                worker.report_progress(5, "Initializing ultra-fast native import...")
             
             # Check database type
             db_type = self.current_connection_info.get('type', '').lower()
@@ -5564,7 +6762,7 @@ class SQLEditorApp(QMainWindow):
         """DuckDB native import - extremely fast for CSV/TSV/Parquet"""
         try:
             if worker:
-                worker.progress.emit(10, "Using DuckDB native import for maximum speed...")
+                worker.report_progress(10, "Using DuckDB native import for maximum speed...")
             
             # Drop table if create or replace mode
             if mode in ['create', 'replace']:
@@ -5581,7 +6779,7 @@ class SQLEditorApp(QMainWindow):
                 has_header = import_info.get('header', True)
                 
                 if worker:
-                    worker.progress.emit(20, "Executing DuckDB native CSV import...")
+                    worker.report_progress(20, "Executing DuckDB native CSV import...")
                 
                 # DuckDB native CSV import with optional filename column
                 if add_filename_column and source_filename:
@@ -5614,7 +6812,7 @@ class SQLEditorApp(QMainWindow):
                 has_header = import_info.get('header', True)
                 
                 if worker:
-                    worker.progress.emit(20, "Executing DuckDB native TSV import...")
+                    worker.report_progress(20, "Executing DuckDB native TSV import...")
                 
                 # TSV import with optional filename column
                 if add_filename_column and source_filename:
@@ -5645,7 +6843,7 @@ class SQLEditorApp(QMainWindow):
                     
             elif file_type == '.parquet':
                 if worker:
-                    worker.progress.emit(20, "Executing DuckDB native Parquet import...")
+                    worker.report_progress(20, "Executing DuckDB native Parquet import...")
                 
                 # Enhanced parquet import with optional filename column
                 if add_filename_column and source_filename:
@@ -5667,7 +6865,7 @@ class SQLEditorApp(QMainWindow):
                     
             elif file_type == '.json':
                 if worker:
-                    worker.progress.emit(20, "Executing DuckDB native JSON import...")
+                    worker.report_progress(20, "Executing DuckDB native JSON import...")
                 
                 # Enhanced JSON import with optional filename column
                 if add_filename_column and source_filename:
@@ -5688,7 +6886,7 @@ class SQLEditorApp(QMainWindow):
                     """
             elif file_type in ['.xlsx', '.xls']:
                 if worker:
-                    worker.progress.emit(20, "Using streamlined Excel import...")
+                    worker.report_progress(20, "Using streamlined Excel import...")
                 
                 # Use the streamlined import approach like other files
                 return self.excel_streamlined_import(file_path, table_name, mode, import_info, worker)
@@ -5697,18 +6895,18 @@ class SQLEditorApp(QMainWindow):
                 return self.streaming_import_with_progress({'file_path': file_path, 'table_name': table_name, 'file_type': file_type, 'mode': mode}, worker)
             
             if worker:
-                worker.progress.emit(30, f"Executing ultra-fast {file_type.upper()} import...")
-                worker.progress.emit(35, "Processing file structure...")
+                worker.report_progress(30, f"Executing ultra-fast {file_type.upper()} import...")
+                worker.report_progress(35, "Processing file structure...")
             
             # Execute the native import with enhanced error handling
             start_time = time.time()
             try:
                 self.current_connection.execute(sql)
                 if worker:
-                    worker.progress.emit(70, "Import execution completed successfully...")
+                    worker.report_progress(70, "Import execution completed successfully...")
             except Exception as sql_error:
                 if worker:
-                    worker.progress.emit(40, f"Native import failed, trying alternative method...")
+                    worker.report_progress(40, f"Native import failed, trying alternative method...")
                 print(f"Native SQL failed: {sql_error}")
                 # Try alternative reading approaches for different file types
                 if file_type == '.parquet':
@@ -5722,7 +6920,7 @@ class SQLEditorApp(QMainWindow):
             end_time = time.time()
             
             if worker:
-                worker.progress.emit(80, "Counting imported rows...")
+                worker.report_progress(80, "Counting imported rows...")
             
             # Get row count
             result = self.current_connection.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()
@@ -5732,7 +6930,7 @@ class SQLEditorApp(QMainWindow):
             speed = row_count / max(import_time, 0.001)
             
             if worker:
-                worker.progress.emit(90, f"Import completed: {row_count:,} rows in {import_time:.2f}s ({speed:,.0f} rows/sec)")
+                worker.report_progress(90, f"Import completed: {row_count:,} rows in {import_time:.2f}s ({speed:,.0f} rows/sec)")
             
             # Refresh schema browser with error handling
             try:
@@ -5750,6 +6948,32 @@ class SQLEditorApp(QMainWindow):
                 worker.error.emit(f"DuckDB native import failed: {str(e)}")
             return False
     
+    def excel_rows_to_arrow(self, excel_data):
+        """Arrow table from sheet rows (header row first), or None when the sheet has no typed columns to map"""
+        header, rows = excel_data[0], excel_data[1:]
+        names = [str(name) for name in header]
+        if not rows or len(set(names)) != len(names) or any(len(row) != len(names) for row in rows):
+            return None
+        try:
+            return pa.table([pa.array(column) for column in zip(*rows)], names=names)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed value types in a column; the DataFrame path handles those
+            return None
+    
+    def arrow_duckdb_insert(self, arrow_table, table_name, mode):
+        """Create, replace or append to a DuckDB table straight from a registered Arrow table"""
+        self.current_connection.register('__arrow_import', arrow_table)
+        try:
+            if mode == 'replace':
+                self.current_connection.execute(f"DROP TABLE IF EXISTS {table_name}")
+            if mode == 'append' and self.table_exists(table_name):
+                self.current_connection.execute(f"INSERT INTO {table_name} SELECT * FROM __arrow_import")
+            else:
+                self.current_connection.execute(f"CREATE TABLE {table_name} AS SELECT * FROM __arrow_import")
+        finally:
+            self.current_connection.unregister('__arrow_import')
+        return True
+    
     def drop_table_if_exists(self, table_name):
         """Helper to drop table if exists"""
         try:
@@ -5761,7 +6985,14 @@ class SQLEditorApp(QMainWindow):
         """SQLite native import fallback - uses CSV import for CSV files"""
         try:
             if worker:
-                worker.progress.emit(10, "Using SQLite optimized import...")
+                worker.report_progress(10, "Using SQLite optimized import...")
+            
+            # Delimited text streams chunk by chunk into a single transaction
+            if file_type in ['.csv', '.txt', '.tsv']:
+                try:
+                    return self.sqlite_streaming_csv_import(file_path, file_type, table_name, mode, import_info, worker)
+                except Exception as stream_error:
+                    print(f"SQLite streaming CSV import failed, using standard import: {stream_error}")
             
             # For SQLite, we'll use the streaming import as it doesn't have native CSV readers like DuckDB
             return self.streaming_import_with_progress(import_info, worker)
@@ -5772,11 +7003,79 @@ class SQLEditorApp(QMainWindow):
                 worker.error.emit(f"SQLite import failed: {str(e)}")
             return False
     
+    def sqlite_streaming_csv_import(self, file_path, file_type, table_name, mode, import_info, worker=None):
+        """Stream a delimited file into SQLite with executemany per chunk, all in one relaxed-durability transaction"""
+        table_name = self.ensure_unique_table_name(table_name, mode)
+        delimiter = '\t' if file_type == '.tsv' else import_info.get('delimiter', ',')
+        file_size = max(os.path.getsize(file_path), 1)
+        conn = self.current_connection
+        insert_sql = None
+        total_rows = 0
+        
+        if worker:
+            worker.report_progress(15, f"Streaming rows into '{table_name}'...")
+        
+        start_time = time.time()
+        with open(file_path, 'rb') as handle, self._sqlite_fast_bulk():
+            # Table changes and every insert commit together, or not at all
+            conn.execute("BEGIN")
+            if mode == 'replace':
+                conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+            
+            chunk_reader = pd.read_csv(
+                handle,
+                delimiter=delimiter,
+                encoding=import_info.get('encoding', 'utf-8'),
+                header=0 if import_info.get('header', True) else None,
+                on_bad_lines='skip',
+                dtype=str,
+                engine='c',
+                na_filter=False,
+                chunksize=100_000
+            )
+            
+            for chunk_df in chunk_reader:
+                if worker and worker.cancelled:
+                    conn.rollback()
+                    return False
+                
+                chunk_df = self.quick_process_dataframe(chunk_df)
+                if insert_sql is None:
+                    columns_sql = ", ".join(f'"{col}" TEXT' for col in chunk_df.columns)
+                    conn.execute(f'CREATE TABLE IF NOT EXISTS "{table_name}" ({columns_sql})')
+                    insert_sql = self.get_insert_statement(table_name, chunk_df.columns)
+                
+                conn.executemany(insert_sql, chunk_df.itertuples(index=False, name=None))
+                total_rows += len(chunk_df)
+                
+                if worker:
+                    # Progress follows the bytes the parser has consumed
+                    progress = 15 + int(75 * min(handle.tell() / file_size, 1.0))
+                    worker.report_progress(progress, f"Imported {total_rows:,} rows...")
+            
+            if not total_rows:
+                conn.rollback()
+                if worker:
+                    worker.error.emit("No data found in the file.")
+                return False
+        
+        import_time = time.time() - start_time
+        if worker:
+            worker.report_progress(95, f"Import completed: {total_rows:,} rows in {import_time:.2f}s")
+        
+        try:
+            self.refresh_schema_browser()
+        except Exception as refresh_error:
+            print(f"Schema refresh warning: {refresh_error}")
+        
+        print(f"SQLite streaming import completed: {total_rows:,} rows in {import_time:.2f}s")
+        return True
+    
     def streaming_import_with_progress(self, import_info, worker=None):
         """Streaming import with progress for fallback cases"""
         try:
             if worker:
-                worker.progress.emit(10, "Using streaming import fallback...")
+                worker.report_progress(10, "Using streaming import fallback...")
             
             # Use the existing optimized import functions
             return self.import_small_file_fast(import_info, worker)
@@ -5791,7 +7090,7 @@ class SQLEditorApp(QMainWindow):
         """Excel fallback import method with optimized chunked reading"""
         try:
             if worker:
-                worker.progress.emit(10, "Analyzing Excel file...")
+                worker.report_progress(10, "Analyzing Excel file...")
             
             # Get file size to determine if we need chunked reading
             file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
@@ -5814,7 +7113,7 @@ class SQLEditorApp(QMainWindow):
         """Direct Excel import for smaller files"""
         try:
             if worker:
-                worker.progress.emit(20, "Loading Excel file...")
+                worker.report_progress(20, "Loading Excel file...")
             
             # Use optimized Excel reading
             sheet_name = import_info.get('sheet_name', 0)
@@ -5832,13 +7131,13 @@ class SQLEditorApp(QMainWindow):
                 return False
             
             if worker:
-                worker.progress.emit(50, f"Processing {len(df):,} rows from Excel...")
+                worker.report_progress(50, f"Processing {len(df):,} rows from Excel...")
             
             # Process and import
             df = self.quick_process_dataframe(df)
             
             if worker:
-                worker.progress.emit(70, f"Inserting {len(df):,} rows into database...")
+                worker.report_progress(70, f"Inserting {len(df):,} rows into database...")
             
             return self.fast_database_insert(df, table_name, mode, worker)
             
@@ -5852,7 +7151,7 @@ class SQLEditorApp(QMainWindow):
         """Chunked Excel import for large files"""
         try:
             if worker:
-                worker.progress.emit(15, "Reading Excel file in chunks...")
+                worker.report_progress(15, "Reading Excel file in chunks...")
             
             sheet_name = import_info.get('sheet_name', 0)
             
@@ -5866,99 +7165,103 @@ class SQLEditorApp(QMainWindow):
                 actual_sheet = sheet_name if sheet_name in excel_file.sheet_names else excel_file.sheet_names[0]
             
             if worker:
-                worker.progress.emit(25, f"Processing Excel sheet: {actual_sheet}")
+                worker.report_progress(25, f"Processing Excel sheet: {actual_sheet}")
             
             # Read in chunks using pandas chunking
             chunk_size = 10000  # Read 10k rows at a time
             table_created = False
             total_rows = 0
             
-            # Use chunksize parameter if available (pandas 1.4+)
-            try:
-                chunk_reader = pd.read_excel(
-                    file_path,
-                    sheet_name=actual_sheet,
-                    chunksize=chunk_size,
-                    dtype=str,
-                    na_filter=False,
-                    engine='openpyxl'
-                )
-                
-                for chunk_num, chunk_df in enumerate(chunk_reader):
-                    if worker and worker.cancelled:
-                        return False
+            # On DuckDB all chunks share one transaction, so a cancelled or failed import keeps none of them
+            with self._duckdb_import_transaction(worker):
+                # Use chunksize parameter if available (pandas 1.4+)
+                try:
+                    chunk_reader = pd.read_excel(
+                        file_path,
+                        sheet_name=actual_sheet,
+                        chunksize=chunk_size,
+                        dtype=str,
+                        na_filter=False,
+                        engine='openpyxl'
+                    )
                     
+                    for chunk_num, chunk_df in enumerate(chunk_reader):
+                        if worker and worker.cancelled:
+                            self.rollback_cancelled_import()
+                            return False
+                        
+                        if worker:
+                            progress = 30 + int((chunk_num * 50) / 100)  # Estimate progress
+                            worker.report_progress(progress, f"Processing chunk {chunk_num + 1}: {len(chunk_df):,} rows")
+                        
+                        # Process chunk
+                        chunk_df = self.quick_process_dataframe(chunk_df)
+                        
+                        # Insert chunk
+                        if not table_created:
+                            success = self.fast_database_insert(chunk_df, table_name, mode, worker)
+                            table_created = True
+                        else:
+                            success = self.fast_database_insert(chunk_df, table_name, 'append', worker)
+                        
+                        if not success:
+                            if worker:
+                                worker.error.emit(f"Failed to insert chunk {chunk_num + 1}")
+                            return False
+                        
+                        total_rows += len(chunk_df)
+                        
+                except TypeError:
+                    # Fallback for older pandas versions without chunksize support for Excel
                     if worker:
-                        progress = 30 + int((chunk_num * 50) / 100)  # Estimate progress
-                        worker.progress.emit(progress, f"Processing chunk {chunk_num + 1}: {len(chunk_df):,} rows")
-                    
-                    # Process chunk
-                    chunk_df = self.quick_process_dataframe(chunk_df)
+                        worker.report_progress(30, "Reading entire Excel file (chunked reading not supported)...")
                     
-                    # Insert chunk
-                    if not table_created:
-                        success = self.fast_database_insert(chunk_df, table_name, mode, worker)
-                        table_created = True
-                    else:
-                        success = self.fast_database_insert(chunk_df, table_name, 'append', worker)
+                    df = pd.read_excel(
+                        file_path,
+                        sheet_name=actual_sheet,
+                        dtype=str,
+                        na_filter=False,
+                        engine='openpyxl'
+                    )
                     
-                    if not success:
+                    if df is None or df.empty:
                         if worker:
-                            worker.error.emit(f"Failed to insert chunk {chunk_num + 1}")
-                        return False
-                    
-                    total_rows += len(chunk_df)
-                    
-            except TypeError:
-                # Fallback for older pandas versions without chunksize support for Excel
-                if worker:
-                    worker.progress.emit(30, "Reading entire Excel file (chunked reading not supported)...")
-                
-                df = pd.read_excel(
-                    file_path,
-                    sheet_name=actual_sheet,
-                    dtype=str,
-                    na_filter=False,
-                    engine='openpyxl'
-                )
-                
-                if df is None or df.empty:
-                    if worker:
-                        worker.error.emit("No data found in Excel file")
-                    return False
-                
-                # Process in memory chunks
-                chunk_size = 50000
-                total_rows = len(df)
-                
-                for i in range(0, total_rows, chunk_size):
-                    if worker and worker.cancelled:
+                            worker.error.emit("No data found in Excel file")
                         return False
                     
-                    chunk_df = df.iloc[i:i+chunk_size].copy()
-                    chunk_num = i // chunk_size
-                    
-                    if worker:
-                        progress = 40 + int((i / total_rows) * 50)
-                        worker.progress.emit(progress, f"Processing chunk {chunk_num + 1}: {len(chunk_df):,} rows")
-                    
-                    # Process chunk
-                    chunk_df = self.quick_process_dataframe(chunk_df)
-                    
-                    # Insert chunk
-                    if not table_created:
-                        success = self.fast_database_insert(chunk_df, table_name, mode, worker)
-                        table_created = True
-                    else:
-                        success = self.fast_database_insert(chunk_df, table_name, 'append', worker)
+                    # Process in memory chunks
+                    chunk_size = 50000
+                    total_rows = len(df)
                     
-                    if not success:
+                    for i in range(0, total_rows, chunk_size):
+                        if worker and worker.cancelled:
+                            self.rollback_cancelled_import()
+                            return False
+                        
+                        chunk_df = df.iloc[i:i+chunk_size].copy()
+                        chunk_num = i // chunk_size
+                        
                         if worker:
-                            worker.error.emit(f"Failed to insert chunk {chunk_num + 1}")
-                        return False
-            
+                            progress = 40 + int((i / total_rows) * 50)
+                            worker.report_progress(progress, f"Processing chunk {chunk_num + 1}: {len(chunk_df):,} rows")
+                        
+                        # Process chunk
+                        chunk_df = self.quick_process_dataframe(chunk_df)
+                        
+                        # Insert chunk
+                        if not table_created:
+                            success = self.fast_database_insert(chunk_df, table_name, mode, worker)
+                            table_created = True
+                        else:
+                            success = self.fast_database_insert(chunk_df, table_name, 'append', worker)
+                        
+                        if not success:
+                            if worker:
+                                worker.error.emit(f"Failed to insert chunk {chunk_num + 1}")
+                            return False
+                
             if worker:
-                worker.progress.emit(90, f"Excel import completed: {total_rows:,} rows")
+                worker.report_progress(90, f"Excel import completed: {total_rows:,} rows")
             
             # Refresh schema browser
             self.refresh_schema_browser()
@@ -5976,7 +7279,7 @@ class SQLEditorApp(QMainWindow):
         """BLAZING-FAST Excel import - multi-engine optimization for maximum speed"""
         try:
             if worker:
-                worker.progress.emit(2, "Selecting fastest Excel engine...")
+                worker.report_progress(2, "Selecting fastest Excel engine...")
             
             # Get sheet information
             sheet_name = import_info.get('sheet_name', 0)
@@ -5992,7 +7295,7 @@ class SQLEditorApp(QMainWindow):
             try:
                 import python_calamine
                 if worker:
-                    worker.progress.emit(8, "Using BLAZING-FAST Rust engine (calamine)...")
+                    worker.report_progress(8, "Using BLAZING-FAST Rust engine (calamine)...")
                 excel_data, engine_used = self._read_excel_calamine(file_path, sheet_name)
             except ImportError:
                 pass
@@ -6004,7 +7307,7 @@ class SQLEditorApp(QMainWindow):
                 try:
                     import polars as pl
                     if worker:
-                        worker.progress.emit(8, "Using ULTRA-FAST Polars engine...")
+                        worker.report_progress(8, "Using ULTRA-FAST Polars engine...")
                     excel_data, engine_used = self._read_excel_polars(file_path, sheet_name)
                 except ImportError:
                     pass
@@ -6016,7 +7319,7 @@ class SQLEditorApp(QMainWindow):
                 try:
                     import xlrd
                     if worker:
-                        worker.progress.emit(8, "Using optimized XLS engine...")
+                        worker.report_progress(8, "Using optimized XLS engine...")
                     excel_data, engine_used = self._read_excel_xlrd(file_path, sheet_name)
                 except ImportError:
                     pass
@@ -6026,7 +7329,7 @@ class SQLEditorApp(QMainWindow):
             # Engine 4: Fallback to optimized openpyxl
             if excel_data is None:
                 if worker:
-                    worker.progress.emit(8, "Using optimized OpenPyXL engine...")
+                    worker.report_progress(8, "Using optimized OpenPyXL engine...")
                 excel_data, engine_used = self._read_excel_openpyxl(file_path, sheet_name)
             
             if excel_data is None:
@@ -6038,7 +7341,7 @@ class SQLEditorApp(QMainWindow):
             rows_count = len(excel_data)
             
             if worker:
-                worker.progress.emit(35, f"✨ {engine_used} read {rows_count:,} rows in {read_time:.2f}s")
+                worker.report_progress(35, f"✨ {engine_used} read {rows_count:,} rows in {read_time:.2f}s")
             
             if rows_count == 0:
                 if worker:
@@ -6047,26 +7350,37 @@ class SQLEditorApp(QMainWindow):
             
             # Convert to DataFrame for fast database insertion
             if worker:
-                worker.progress.emit(45, "Converting to optimized format...")
+                worker.report_progress(45, "Converting to optimized format...")
             
-            df = pd.DataFrame(excel_data[1:], columns=excel_data[0])  # First row as headers
+            # DuckDB scans Arrow columns directly, so skip pandas when the sheet has clean typed columns
+            arrow_table = None
+            if PYARROW_AVAILABLE and self.current_connection_info.get('type', '').lower() == 'duckdb':
+                arrow_table = self.excel_rows_to_arrow(excel_data)
             
             # Drop table if create mode
             if mode == 'create':
                 self.drop_table_if_exists(table_name)
             
             if worker:
-                worker.progress.emit(60, "Executing BLAZING database insert...")
+                worker.report_progress(60, "Executing BLAZING database insert...")
             
             # Use the fastest database insertion method
             import_start = time.time()
-            success = self.fast_database_insert(df, table_name, mode, worker)
+            success = False
+            if arrow_table is not None:
+                try:
+                    success = self.arrow_duckdb_insert(arrow_table, table_name, mode)
+                except Exception as arrow_error:
+                    print(f"Arrow insert failed, using DataFrame insert: {arrow_error}")
+            if not success:
+                df = pd.DataFrame(excel_data[1:], columns=excel_data[0])  # First row as headers
+                success = self.fast_database_insert(df, table_name, mode, worker)
             
             if not success:
                 return False
             
             if worker:
-                worker.progress.emit(85, "Verifying import...")
+                worker.report_progress(85, "Verifying import...")
             
             # Get row count
             result = self.current_connection.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()
@@ -6077,7 +7391,7 @@ class SQLEditorApp(QMainWindow):
             speed = actual_rows / max(total_time, 0.001)
             
             if worker:
-                worker.progress.emit(95, f"🚀 BLAZING import: {actual_rows:,} rows in {total_time:.2f}s ({speed:,.0f} rows/sec)")
+                worker.report_progress(95, f"🚀 BLAZING import: {actual_rows:,} rows in {total_time:.2f}s ({speed:,.0f} rows/sec)")
             
                             # Refresh schema browser with error handling
                 try:
@@ -6174,7 +7488,7 @@ class SQLEditorApp(QMainWindow):
         """Parquet fallback import method"""
         try:
             if worker:
-                worker.progress.emit(20, "Loading Parquet file with pandas...")
+                worker.report_progress(20, "Loading Parquet file with pandas...")
             
             # Load with pandas
             df = pd.read_parquet(file_path)
@@ -6185,7 +7499,7 @@ class SQLEditorApp(QMainWindow):
                 return False
             
             if worker:
-                worker.progress.emit(50, f"Processing {len(df):,} rows from Parquet...")
+                worker.report_progress(50, f"Processing {len(df):,} rows from Parquet...")
             
             # Process and import
             df = self.quick_process_dataframe(df)
@@ -6203,7 +7517,7 @@ class SQLEditorApp(QMainWindow):
         """JSON fallback import method with improved error handling and chunking"""
         try:
             if worker:
-                worker.progress.emit(10, "Analyzing JSON file...")
+                worker.report_progress(10, "Analyzing JSON file...")
             
             # Get file size to determine approach
             file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
@@ -6226,7 +7540,7 @@ class SQLEditorApp(QMainWindow):
         """Direct JSON import for smaller files"""
         try:
             if worker:
-                worker.progress.emit(20, "Loading JSON file...")
+                worker.report_progress(20, "Loading JSON file...")
             
             # Try multiple approaches for loading JSON
             df = None
@@ -6237,7 +7551,7 @@ class SQLEditorApp(QMainWindow):
             except ValueError:
                 # Second try: manual JSON parsing (more flexible)
                 if worker:
-                    worker.progress.emit(30, "Trying alternative JSON parsing...")
+                    worker.report_progress(30, "Trying alternative JSON parsing...")
                 
                 with open(file_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
@@ -6257,13 +7571,13 @@ class SQLEditorApp(QMainWindow):
                 return False
             
             if worker:
-                worker.progress.emit(50, f"Processing {len(df):,} rows from JSON...")
+                worker.report_progress(50, f"Processing {len(df):,} rows from JSON...")
             
             # Process and import
             df = self.quick_process_dataframe(df)
             
             if worker:
-                worker.progress.emit(70, f"Inserting {len(df):,} rows into database...")
+                worker.report_progress(70, f"Inserting {len(df):,} rows into database...")
             
             return self.fast_database_insert(df, table_name, mode, worker)
             
@@ -6277,7 +7591,7 @@ class SQLEditorApp(QMainWindow):
         """Chunked JSON import for large files"""
         try:
             if worker:
-                worker.progress.emit(15, "Reading large JSON file in chunks...")
+                worker.report_progress(15, "Reading large JSON file in chunks...")
             
             # For very large JSON files, read and process in chunks
             try:
@@ -6290,47 +7604,50 @@ class SQLEditorApp(QMainWindow):
                 
                 total_records = len(data)
                 if worker:
-                    worker.progress.emit(25, f"Found {total_records:,} records in JSON file")
+                    worker.report_progress(25, f"Found {total_records:,} records in JSON file")
                 
                 # Process in chunks
                 chunk_size = 50000  # Process 50k records at a time
                 table_created = False
                 
-                for i in range(0, total_records, chunk_size):
-                    if worker and worker.cancelled:
-                        return False
-                    
-                    chunk_data = data[i:i+chunk_size]
-                    chunk_num = i // chunk_size + 1
-                    total_chunks = (total_records - 1) // chunk_size + 1
-                    
-                    if worker:
-                        progress = 30 + int((i / total_records) * 60)
-                        worker.progress.emit(progress, f"Processing chunk {chunk_num}/{total_chunks}: {len(chunk_data):,} records")
-                    
-                    # Convert chunk to DataFrame
-                    chunk_df = pd.DataFrame(chunk_data)
-                    
-                    if chunk_df.empty:
-                        continue
-                    
-                    # Process chunk
-                    chunk_df = self.quick_process_dataframe(chunk_df)
-                    
-                    # Insert chunk
-                    if not table_created:
-                        success = self.fast_database_insert(chunk_df, table_name, mode, worker)
-                        table_created = True
-                    else:
-                        success = self.fast_database_insert(chunk_df, table_name, 'append', worker)
-                    
-                    if not success:
+                # On DuckDB all chunks share one transaction, so a cancelled or failed import keeps none of them
+                with self._duckdb_import_transaction(worker):
+                    for i in range(0, total_records, chunk_size):
+                        if worker and worker.cancelled:
+                            self.rollback_cancelled_import()
+                            return False
+                        
+                        chunk_data = data[i:i+chunk_size]
+                        chunk_num = i // chunk_size + 1
+                        total_chunks = (total_records - 1) // chunk_size + 1
+                        
                         if worker:
-                            worker.error.emit(f"Failed to insert JSON chunk {chunk_num}")
-                        return False
-                
+                            progress = 30 + int((i / total_records) * 60)
+                            worker.report_progress(progress, f"Processing chunk {chunk_num}/{total_chunks}: {len(chunk_data):,} records")
+                        
+                        # Convert chunk to DataFrame
+                        chunk_df = pd.DataFrame(chunk_data)
+                        
+                        if chunk_df.empty:
+                            continue
+                        
+                        # Process chunk
+                        chunk_df = self.quick_process_dataframe(chunk_df)
+                        
+                        # Insert chunk
+                        if not table_created:
+                            success = self.fast_database_insert(chunk_df, table_name, mode, worker)
+                            table_created = True
+                        else:
+                            success = self.fast_database_insert(chunk_df, table_name, 'append', worker)
+                        
+                        if not success:
+                            if worker:
+                                worker.error.emit(f"Failed to insert JSON chunk {chunk_num}")
+                            return False
+                    
                 if worker:
-                    worker.progress.emit(90, f"JSON import completed: {total_records:,} records")
+                    worker.report_progress(90, f"JSON import completed: {total_records:,} records")
                 
                 # Refresh schema browser with error handling
                 try:
@@ -6366,7 +7683,7 @@ class SQLEditorApp(QMainWindow):
             mode = import_info['mode']
             
             if worker:
-                worker.progress.emit(20, "Loading file into memory...")
+                worker.report_progress(20, "Loading file into memory...")
             
             # Load data with optimized settings
             df = self.safe_load_data_optimized(file_path, file_type, import_info)
@@ -6377,26 +7694,26 @@ class SQLEditorApp(QMainWindow):
                 return False
             
             if worker:
-                worker.progress.emit(40, f"Processing {len(df):,} rows...")
+                worker.report_progress(40, f"Processing {len(df):,} rows...")
             
             # Quick data processing
             df = self.quick_process_dataframe(df)
             
             if worker:
-                worker.progress.emit(60, "Preparing database insert...")
+                worker.report_progress(60, "Preparing database insert...")
             
             # Ensure unique table name
             safe_table_name = self.ensure_unique_table_name(table_name, mode)
             
             if worker:
-                worker.progress.emit(80, f"Inserting data into '{safe_table_name}'...")
+                worker.report_progress(80, f"Inserting data into '{safe_table_name}'...")
             
             # Fast database insert
             success = self.fast_database_insert(df, safe_table_name, mode, worker)
             
             if success:
                 if worker:
-                    worker.progress.emit(95, "Finalizing import...")
+                    worker.report_progress(95, "Finalizing import...")
                 
                 # Update schema browser
                 self.refresh_schema_browser()
@@ -6430,60 +7747,56 @@ class SQLEditorApp(QMainWindow):
                 chunk_size = 200000  # 200K rows for medium files
             
             if worker:
-                worker.progress.emit(15, f"Processing large file in chunks of {chunk_size:,} rows...")
+                worker.report_progress(15, f"Processing large file in chunks of {chunk_size:,} rows...")
             
             # Ensure unique table name
             safe_table_name = self.ensure_unique_table_name(table_name, mode)
             
-            # Handle table creation/replacement
-            if mode == 'replace':
-                try:
-                    if self.current_connection_info['type'].lower() == 'duckdb':
-                        self.current_connection.execute(f"DROP TABLE IF EXISTS {safe_table_name}")
-                    else:  # SQLite
-                        self.current_connection.execute(f"DROP TABLE IF EXISTS {safe_table_name}")
-                        self.current_connection.commit()
-                except:
-                    pass
-            
-            total_rows = 0
-            chunk_num = 0
-            table_created = False
-            
-            # Process file in chunks
-            for chunk_df in self.read_file_chunks(file_path, file_type, import_info, chunk_size):
-                if worker and worker.cancelled:
-                    return False
-                
-                chunk_num += 1
-                chunk_rows = len(chunk_df)
-                total_rows += chunk_rows
-                
-                if worker:
-                    progress = min(90, 15 + (chunk_num * 5))  # Gradual progress
-                    worker.progress.emit(progress, f"Processing chunk {chunk_num}: {chunk_rows:,} rows (Total: {total_rows:,})")
-                
-                # Quick process chunk
-                chunk_df = self.quick_process_dataframe(chunk_df)
+            # On DuckDB the drop and all chunks share one transaction, so a cancelled or failed import keeps none of them
+            with self._duckdb_import_transaction(worker):
+                # Handle table creation/replacement
+                if mode == 'replace':
+                    self.drop_table_if_exists(safe_table_name)
                 
-                # Insert chunk
-                if not table_created:
-                    # First chunk creates the table
-                    success = self.fast_database_insert(chunk_df, safe_table_name, mode, worker)
-                    table_created = True
-                else:
-                    # Subsequent chunks append
-                    success = self.fast_database_insert(chunk_df, safe_table_name, 'append', worker)
+                total_rows = 0
+                chunk_num = 0
+                table_created = False
                 
-                if not success:
-                    print(f"Failed to insert chunk {chunk_num}")
-                    return False
+                # Process file in chunks
+                for chunk_df in self.read_file_chunks(file_path, file_type, import_info, chunk_size):
+                    if worker and worker.cancelled:
+                        self.rollback_cancelled_import()
+                        return False
+                    
+                    chunk_num += 1
+                    chunk_rows = len(chunk_df)
+                    total_rows += chunk_rows
+                    
+                    if worker:
+                        progress = min(90, 15 + (chunk_num * 5))  # Gradual progress
+                        worker.report_progress(progress, f"Processing chunk {chunk_num}: {chunk_rows:,} rows (Total: {total_rows:,})")
+                    
+                    # Quick process chunk
+                    chunk_df = self.quick_process_dataframe(chunk_df)
+                    
+                    # Insert chunk
+                    if not table_created:
+                        # First chunk creates the table
+                        success = self.fast_database_insert(chunk_df, safe_table_name, mode, worker)
+                        table_created = True
+                    else:
+                        # Subsequent chunks append
+                        success = self.fast_database_insert(chunk_df, safe_table_name, 'append', worker)
+                    
+                    if not success:
+                        print(f"Failed to insert chunk {chunk_num}")
+                        return False
+                    
+                    # Clear memory
+                    del chunk_df
                 
-                # Clear memory
-                del chunk_df
-            
             if worker:
-                worker.progress.emit(95, "Finalizing large file import...")
+                worker.report_progress(95, "Finalizing large file import...")
             
             # Update schema browser
             self.refresh_schema_browser()
@@ -6504,12 +7817,12 @@ class SQLEditorApp(QMainWindow):
     def load_excel_all_sheets(self, file_path):
         """Load all sheets from an Excel file and combine them"""
         try:
-            excel_file = pd.ExcelFile(file_path)
+            excel_file = pd.ExcelFile(file_path, engine=EXCEL_ENGINE)
             all_sheets = []
             
             for sheet_name in excel_file.sheet_names:
                 try:
-                    sheet_df = pd.read_excel(file_path, sheet_name=sheet_name, dtype=str)
+                    sheet_df = pd.read_excel(file_path, sheet_name=sheet_name, dtype=str, engine=EXCEL_ENGINE)
                     if not sheet_df.empty:
                         # Add sheet name column
                         sheet_df['_sheet_name'] = sheet_name
@@ -6532,12 +7845,12 @@ class SQLEditorApp(QMainWindow):
     def load_excel_with_dialog(self, file_path):
         """Load Excel file with user sheet selection"""
         try:
-            excel_file = pd.ExcelFile(file_path)
+            excel_file = pd.ExcelFile(file_path, engine=EXCEL_ENGINE)
             sheet_names = excel_file.sheet_names
             
             if len(sheet_names) == 1:
                 # Only one sheet, just load it
-                return pd.read_excel(file_path, sheet_name=0, dtype=str)
+                return pd.read_excel(file_path, sheet_name=0, dtype=str, engine=EXCEL_ENGINE)
             
             # Multiple sheets - ask user to select
             sheet_name, ok = QInputDialog.getItem(
@@ -6550,7 +7863,7 @@ class SQLEditorApp(QMainWindow):
             )
             
             if ok and sheet_name:
-                return pd.read_excel(file_path, sheet_name=sheet_name, dtype=str)
+                return pd.read_excel(file_path, sheet_name=sheet_name, dtype=str, engine=EXCEL_ENGINE)
             else:
                 # User cancelled - skip this file
                 return None
@@ -6563,6 +7876,19 @@ class SQLEditorApp(QMainWindow):
         """Safely load data from any file type with robust error handling"""
         df = None
         
+        # Delimited text goes through the PyArrow reader first; pandas is the fallback
+        if file_type in ['.csv', '.tsv', '.txt'] and PYARROW_AVAILABLE:
+            default_delimiter = '\t' if file_type == '.tsv' else ','
+            try:
+                return self.read_delimited_arrow(
+                    file_path,
+                    import_info.get('delimiter', default_delimiter),
+                    import_info.get('encoding', 'utf-8'),
+                    import_info.get('header', True)
+                )
+            except Exception as e:
+                logger.info("PyArrow CSV read failed, falling back to pandas: %s", e)
+        
         try:
             if file_type == '.csv':
                 # Try multiple encoding strategies for CSV
@@ -6622,20 +7948,19 @@ class SQLEditorApp(QMainWindow):
             elif file_type in ['.xlsx', '.xls']:
                 try:
                     sheet_name = import_info.get('sheet_name', 0)
-                    df = pd.read_excel(file_path, sheet_name=sheet_name, dtype=str)
+                    df = pd.read_excel(file_path, sheet_name=sheet_name, dtype=str, engine=EXCEL_ENGINE)
                 except Exception as e:
                     print(f"Excel load failed: {e}")
                     # Try reading first sheet as fallback
                     try:
-                        df = pd.read_excel(file_path, sheet_name=0, dtype=str)
+                        df = pd.read_excel(file_path, sheet_name=0, dtype=str, engine=EXCEL_ENGINE)
                     except:
                         pass
             
             elif file_type == '.parquet':
                 try:
-                    df = pd.read_parquet(file_path)
-                    # Convert to string to avoid type issues
-                    df = df.astype(str)
+                    # Keep Parquet's own types; both databases accept Arrow-backed columns
+                    df = self.read_parquet_arrow(file_path)
                 except Exception as e:
                     print(f"Parquet load failed: {e}")
             
@@ -6648,13 +7973,8 @@ class SQLEditorApp(QMainWindow):
                     print(f"JSON load failed: {e}")
                     # Try alternative JSON loading
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            import json
-                            data = json.load(f)
-                            if isinstance(data, list):
-                                df = pd.DataFrame(data)
-                            elif isinstance(data, dict):
-                                df = pd.DataFrame([data])
+                        df = self.read_json_fallback(file_path)
+                        if df is not None:
                             df = df.astype(str)
                     except:
                         pass
@@ -6664,6 +7984,59 @@ class SQLEditorApp(QMainWindow):
             
         return df
     
+    def read_delimited_arrow(self, file_path, delimiter=',', encoding='utf-8', has_header=True):
+        """Read a delimited text file with PyArrow into an Arrow-backed DataFrame"""
+        read_options = pa_csv.ReadOptions(
+            block_size=4 << 20,
+            use_threads=True,
+            encoding=encoding,
+            autogenerate_column_names=not has_header
+        )
+        parse_options = pa_csv.ParseOptions(
+            delimiter=delimiter,
+            invalid_row_handler=lambda row: 'skip'  # Skip bad lines instead of failing
+        )
+        # Read every column as text, like the pandas fallback's dtype=str, so leading zeros and long
+        # IDs keep their exact values; the streaming reader only parses the first block to get the names
+        with pa_csv.open_csv(file_path, read_options=read_options, parse_options=parse_options) as reader:
+            column_names = reader.schema.names
+        convert_options = pa_csv.ConvertOptions(
+            strings_can_be_null=True,
+            column_types={name: pa.string() for name in column_names}
+        )
+        
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options
+        )
+        return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+    
+    def read_parquet_arrow(self, file_path):
+        """Read a Parquet file keeping its column types as Arrow-backed dtypes"""
+        if not PYARROW_AVAILABLE:
+            return pd.read_parquet(file_path)
+        table = pq.read_table(file_path)
+        return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+    
+    def read_json_fallback(self, file_path):
+        """Read JSON that pandas rejected: stream it as JSON Lines, else parse the whole document"""
+        try:
+            with pd.read_json(file_path, lines=True, dtype=False, chunksize=100_000) as reader:
+                return pd.concat(reader, ignore_index=True)
+        except ValueError:
+            pass
+        
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        if isinstance(data, list):
+            return pd.DataFrame(data)
+        if isinstance(data, dict):
+            return pd.DataFrame([data])
+        return None
+    
     def safe_load_data_optimized(self, file_path, file_type, import_info):
         """Optimized data loading with performance enhancements"""
         try:
@@ -6746,8 +8119,7 @@ class SQLEditorApp(QMainWindow):
             elif file_type == '.parquet':
                 # Parquet loading
                 try:
-                    df = pd.read_parquet(file_path)
-                    df = df.astype(str)
+                    df = self.read_parquet_arrow(file_path)
                     print(f"Successfully loaded Parquet file {os.path.basename(file_path)} with {len(df)} rows")
                     return df
                 except Exception as e:
@@ -6769,19 +8141,13 @@ class SQLEditorApp(QMainWindow):
                     print(f"Pandas JSON load failed, trying manual parsing: {e}")
                     # Fallback to manual JSON parsing
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            import json
-                            data = json.load(f)
-                            if isinstance(data, list):
-                                df = pd.DataFrame(data)
-                            elif isinstance(data, dict):
-                                df = pd.DataFrame([data])
-                            else:
-                                print(f"Unsupported JSON structure in {file_path}")
-                                return None
-                            df = df.astype(str)
-                            print(f"Successfully loaded JSON file {os.path.basename(file_path)} (manual) with {len(df)} rows")
-                            return df
+                        df = self.read_json_fallback(file_path)
+                        if df is None:
+                            print(f"Unsupported JSON structure in {file_path}")
+                            return None
+                        df = df.astype(str)
+                        print(f"Successfully loaded JSON file {os.path.basename(file_path)} (manual) with {len(df)} rows")
+                        return df
                     except Exception as e2:
                         print(f"Failed to load JSON file {file_path}: {e2}")
                         return None
@@ -6914,12 +8280,11 @@ class SQLEditorApp(QMainWindow):
                 self.current_connection.execute(f"CREATE TABLE {table_name} AS SELECT * FROM df")
             
             elif mode == 'append':
-                # Check if table exists
-                try:
-                    result = self.current_connection.execute(f"SELECT 1 FROM {table_name} LIMIT 1").fetchone()
-                    table_exists = True
-                except:
-                    table_exists = False
+                # Check if table exists without a failing query, which would abort an import transaction
+                table_exists = self.current_connection.execute(
+                    "SELECT COUNT(*) FROM information_schema.tables WHERE lower(table_name) = lower(?)",
+                    [table_name]
+                ).fetchone()[0] > 0
                 
                 if not table_exists:
                     # Create table
@@ -6942,17 +8307,15 @@ class SQLEditorApp(QMainWindow):
     def fast_sqlite_insert(self, df, table_name, mode):
         """Optimized SQLite insertion using bulk operations"""
         try:
-            if mode == 'replace':
-                # Use pandas to_sql with replace
-                df.to_sql(table_name, self.current_connection, if_exists='replace', index=False, method='multi')
-            elif mode == 'append':
-                # Use pandas to_sql with append
-                df.to_sql(table_name, self.current_connection, if_exists='append', index=False, method='multi')
-            else:  # create mode
-                # Use pandas to_sql with fail (will create new table)
-                df.to_sql(table_name, self.current_connection, if_exists='fail', index=False, method='multi')
-            
-            self.current_connection.commit()
+            # Let pandas create (or replace) the table from the column layout only
+            if_exists = {'replace': 'replace', 'append': 'append'}.get(mode, 'fail')
+            df.head(0).to_sql(table_name, self.current_connection, if_exists=if_exists, index=False)
+            
+            # Insert all rows with one cached statement inside a single transaction
+            insert_sql = self.get_insert_statement(table_name, df.columns)
+            rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+            with self.current_connection:  # Commits on success, rolls back on error
+                self.current_connection.executemany(insert_sql, rows)
             return True
             
         except Exception as e:
@@ -6960,6 +8323,47 @@ class SQLEditorApp(QMainWindow):
             # Fallback to regular method
             return self.safe_import_to_database(df, table_name, mode)
     
+    @contextmanager
+    def _sqlite_fast_bulk(self):
+        """Relax SQLite durability for a bulk load, restoring the connection's pragmas afterwards.
+        
+        The journal lives in memory and nothing is fsynced while this is active, so a crash or
+        power loss mid-import can corrupt the database file - only wrap import writes in it.
+        """
+        conn = self.current_connection
+        saved = {}
+        # Nested uses (a streaming step inside a whole import) keep the pragmas the outermost one set
+        if not self._sqlite_bulk_depth:
+            conn.commit()  # journal_mode cannot change inside a transaction
+            saved = {name: conn.execute(f"PRAGMA {name}").fetchone()[0]
+                     for name in ('journal_mode', 'synchronous', 'temp_store', 'cache_size')}
+            conn.execute("PRAGMA journal_mode=MEMORY")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-262144")  # 256 MB page cache
+        self._sqlite_bulk_depth += 1
+        try:
+            yield
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._sqlite_bulk_depth -= 1
+            for name, value in saved.items():
+                conn.execute(f"PRAGMA {name}={value}")
+    
+    def get_insert_statement(self, table_name, columns):
+        """Return the cached parameterized INSERT for a table and column list"""
+        key = (table_name, tuple(columns))
+        insert_sql = self._insert_stmts.get(key)
+        if insert_sql is None:
+            column_list = ", ".join(f'"{col}"' for col in columns)
+            placeholders = ", ".join("?" * len(columns))
+            insert_sql = f'INSERT INTO "{table_name}" ({column_list}) VALUES ({placeholders})'
+            self._insert_stmts[key] = insert_sql
+        return insert_sql
+    
     def combine_dataframes_with_alignment(self, dataframes):
         """Combine multiple dataframes with proper column alignment - new columns go to the end"""
         if not dataframes:
@@ -6978,7 +8382,7 @@ class SQLEditorApp(QMainWindow):
                 all_columns_set.update(df.columns)
             
             # Create final column order: base columns first, then new columns at the end
-            new_columns = [col for col in all_columns_set if col not in base_columns]
+            new_columns = all_columns_set.difference(base_columns)
             all_columns = base_columns + sorted(new_columns)  # Sort only the new columns
             
             print(f"Found {len(all_columns)} unique columns across all files")
@@ -6986,28 +8390,8 @@ class SQLEditorApp(QMainWindow):
             if new_columns:
                 print(f"New columns added at end ({len(new_columns)}): {sorted(new_columns)}")
             
-            # Align all dataframes to have the same columns
-            aligned_dataframes = []
-            for i, df in enumerate(dataframes):
-                # Create a new dataframe with all columns in correct order
-                aligned_df = pd.DataFrame(index=df.index)
-                
-                # Copy existing columns in their original order
-                for col in df.columns:
-                    aligned_df[col] = df[col]
-                
-                # Add missing columns with None values at the end
-                for col in all_columns:
-                    if col not in aligned_df.columns:
-                        aligned_df[col] = None
-                
-                # Reorder columns: existing first, new at the end
-                aligned_df = aligned_df[all_columns]
-                aligned_dataframes.append(aligned_df)
-                print(f"Aligned dataframe {i+1}: {len(aligned_df)} rows, {len(aligned_df.columns)} columns")
-            
-            # Combine all aligned dataframes
-            combined_df = pd.concat(aligned_dataframes, ignore_index=True, sort=False)
+            # concat already aligns on the union of columns; one reindex fixes the order
+            combined_df = pd.concat(dataframes, ignore_index=True, sort=False, copy=False).reindex(columns=all_columns)
             
             # Convert all data to strings for database compatibility
             for col in combined_df.columns:
@@ -7033,64 +8417,67 @@ class SQLEditorApp(QMainWindow):
                 print(f"Fallback concatenation also failed: {e2}")
                 raise e
     
-    def sanitize_dataframe(self, df):
+    def sanitize_dataframe(self, df, inplace=False):
         """Sanitize dataframe to prevent any import errors by converting problematic data to text"""
         try:
-            print(f"Sanitizing dataframe with {len(df)} rows and {len(df.columns)} columns")
+            if not inplace:
+                # Columns are replaced rather than written into, so a shallow copy keeps the caller's frame intact
+                df = df.copy(deep=False)
             
-            # Create a copy to avoid modifying the original
-            df_clean = df.copy()
+            print(f"Sanitizing dataframe with {len(df)} rows and {len(df.columns)} columns")
             
             # Handle column names - ensure they're clean
-            df_clean.columns = [str(col).strip() if col is not None else f"col_{i}" for i, col in enumerate(df_clean.columns)]
+            df.columns = [str(col).strip() if col is not None else f"col_{i}" for i, col in enumerate(df.columns)]
             
             # Process each column
-            for col in df_clean.columns:
+            for col in df.columns:
                 try:
                     # Convert the entire column to string initially
-                    df_clean[col] = df_clean[col].astype(str)
+                    arr = df[col].astype(str).to_numpy(dtype=object, copy=True)
+                    null_mask = np.isin(arr, _NULL_STRS)
                     
                     # Handle specific problematic values
-                    df_clean[col] = df_clean[col].replace({
-                        'nan': None,
-                        'NaN': None,
-                        'None': None,
-                        'null': None,
-                        'NULL': None,
-                        '': None,
-                        'inf': 'infinity',
-                        '-inf': '-infinity',
-                        'Infinity': 'infinity',
-                        '-Infinity': '-infinity'
-                    })
+                    for spelling, replacement in _INFINITY_REPLACEMENTS.items():
+                        arr[arr == spelling] = replacement
+                    values = pd.Series(arr, index=df.index)
+                    
+                    # Remove null bytes and normalize line endings in one vectorized pass each
+                    values = values.str.replace('\x00', '', regex=False)
+                    values = values.str.replace(r'\r\n?', '\n', regex=True)
                     
-                    # Remove any remaining problematic characters
-                    df_clean[col] = df_clean[col].apply(lambda x: self.safe_string_convert(x) if x is not None else None)
+                    # Limit string length to prevent database issues
+                    long_mask = values.str.len() > 10000
+                    if long_mask.any():
+                        values = values.where(~long_mask, values.str.slice(0, 10000) + "...[truncated]")
+                    
+                    values[null_mask] = None
+                    df[col] = values
                     
                 except Exception as e:
                     print(f"Error processing column {col}: {e}")
                     # If anything fails, convert entire column to safe strings
-                    df_clean[col] = df_clean[col].apply(lambda x: str(x) if x is not None else None)
+                    df[col] = df[col].apply(lambda x: str(x) if x is not None else None)
             
             # Remove completely empty rows
-            df_clean = df_clean.dropna(how='all')
+            df.dropna(how='all', inplace=True)
             
-            # Ensure no column names are duplicated
-            cols = df_clean.columns.tolist()
-            seen = set()
+            # Ensure no column names are duplicated - one counter probe per column
+            counts = Counter()
+            used = set()
             unique_cols = []
-            for col in cols:
-                original_col = col
-                counter = 1
-                while col in seen:
-                    col = f"{original_col}_{counter}"
-                    counter += 1
-                seen.add(col)
-                unique_cols.append(col)
-            df_clean.columns = unique_cols
+            for col in df.columns:
+                n = counts[col]
+                new_col = col if n == 0 else f"{col}_{n}"
+                while new_col in used:
+                    n += 1
+                    new_col = f"{col}_{n}"
+                counts[col] = n + 1
+                used.add(new_col)
+                unique_cols.append(new_col)
+            df.columns = unique_cols
             
-            print(f"Sanitization complete: {len(df_clean)} rows × {len(df_clean.columns)} columns")
-            return df_clean
+            print(f"Sanitization complete: {len(df)} rows × {len(df.columns)} columns")
+            return df
             
         except Exception as e:
             print(f"Sanitization failed: {e}")
@@ -7105,32 +8492,32 @@ class SQLEditorApp(QMainWindow):
                 # Ultimate fallback: return empty dataframe with at least one column
                 return pd.DataFrame({'data': ['No data could be imported']})
     
-    def detect_csv_delimiter(self, file_path, sample_size=1024):
+    def detect_csv_delimiter(self, file_path, sample_size=65536):
         """Automatically detect the delimiter used in a CSV file"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
-                sample = file.read(sample_size)
-                
-            # Use csv.Sniffer to detect delimiter
-            if csv:
-                sniffer = csv.Sniffer()
-                try:
-                    dialect = sniffer.sniff(sample, delimiters=',;\t|')
-                    detected_delimiter = dialect.delimiter
-                    print(f"Auto-detected delimiter: '{detected_delimiter}' for file: {os.path.basename(file_path)}")
-                    return detected_delimiter
-                except:
-                    pass
+            # Memory-map the file and take a raw byte sample - no decoding needed
+            with open(file_path, 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return ','
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    sample = mm[:sample_size]
+            
+            # Restrict the scan to the first 10 lines
+            end = -1
+            for _ in range(10):
+                end = sample.find(b'\n', end + 1)
+                if end == -1:
+                    break
+            if end != -1:
+                sample = sample[:end]
             
-            # Fallback: count common delimiters and choose the most frequent
-            delimiters = {',': 0, ';': 0, '\t': 0, '|': 0}
-            for delimiter in delimiters:
-                delimiters[delimiter] = sample.count(delimiter)
+            # Count each candidate delimiter (bytes.count is a C-level scan)
+            delimiters = {d: sample.count(d.encode()) for d in (',', ';', '\t', '|')}
             
             # Choose the delimiter with the highest count (but at least 1)
             best_delimiter = max(delimiters, key=delimiters.get)
             if delimiters[best_delimiter] > 0:
-                print(f"Fallback delimiter detection: '{best_delimiter}' for file: {os.path.basename(file_path)}")
+                print(f"Auto-detected delimiter: '{best_delimiter}' for file: {os.path.basename(file_path)}")
                 return best_delimiter
             
             # Default to comma if no delimiter found
@@ -7170,11 +8557,43 @@ class SQLEditorApp(QMainWindow):
         except Exception:
             return "conversion_error"
     
+    def _stringify_column(self, values):
+        """Convert one column to str/None; only text columns need the character cleanup"""
+        if values.dtype.kind in 'biufc':
+            # Numbers convert in C; infinities become NULL like NaN
+            text = values.replace([np.inf, -np.inf], np.nan).astype('string')
+        elif pd.api.types.is_datetime64_any_dtype(values):
+            # pandas' own formatting keeps fractional seconds and the UTC offset, as str() did
+            text = values.astype('string')
+        else:
+            text = values.astype('string')
+            text = text.str.replace('\x00', '', regex=False)
+            text = text.str.replace(r'\r\n?', '\n', regex=True)
+            
+            # Limit string length to prevent database issues
+            long_mask = text.str.len() > 10000
+            if long_mask.any():
+                text = text.where(~long_mask, text.str.slice(0, 10000) + "...[truncated]")
+        
+        text = text.astype(object)
+        return text.where(text.notna(), None)
+    
+    def _stringify_frame(self, df):
+        """Column-wise safe_string_convert: every cell becomes a str or None"""
+        return df.apply(self._stringify_column)
+    
     def safe_import_to_database(self, df, table_name, mode):
         """Safely import dataframe to database with multiple fallback strategies"""
         try:
             db_type = self.current_connection_info['type'].lower()
             
+            # Keep the schema cache in step with the table this import creates or replaces
+            if mode != 'append':
+                self._schema_cache.pop(table_name, None)
+                if self._table_name_cache is not None:
+                    self._table_name_cache.add(table_name.lower())
+                self._table_cache.pop(id(self.current_connection), None)
+            
             # Strategy 1: Try database-specific import
             try:
                 if db_type == 'duckdb':
@@ -7188,11 +8607,11 @@ class SQLEditorApp(QMainWindow):
                         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
                         if cursor.fetchone():
                             raise ValueError(f"Table '{table_name}' already exists. Use 'Replace' mode to overwrite or 'Append' to add data.")
-                        df.to_sql(table_name, self.current_connection, if_exists='fail', index=False)
+                        df.to_sql(table_name, self.current_connection, if_exists='fail', index=False, chunksize=IMPORT_CHUNK_SIZE)
                     elif mode == 'append':
                         self.flexible_append_data(df, table_name, 'sqlite')
                     else:  # replace
-                        df.to_sql(table_name, self.current_connection, if_exists='replace', index=False)
+                        df.to_sql(table_name, self.current_connection, if_exists='replace', index=False, chunksize=IMPORT_CHUNK_SIZE)
                     self.current_connection.commit()
                 
                 print("Normal import successful")
@@ -7206,22 +8625,25 @@ class SQLEditorApp(QMainWindow):
                     print("Trying with all TEXT columns...")
                     
                     # Create table manually with all TEXT columns
-                    columns_sql = ", ".join([f'"{col}" TEXT' for col in df.columns])
-                    
-                    if mode == 'replace':
-                        self.current_connection.execute(f"DROP TABLE IF EXISTS {table_name}")
-                    
-                    create_sql = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_sql})"
-                    self.current_connection.execute(create_sql)
-                    
-                    if db_type == 'sqlite':
-                        self.current_connection.commit()
+                    self.create_text_table(table_name, df.columns, mode == 'replace', db_type)
                     
-                    # Insert data row by row if needed
-                    df.to_sql(table_name, self.current_connection, if_exists='append', index=False)
-                    
-                    if db_type == 'sqlite':
-                        self.current_connection.commit()
+                    column_list = ", ".join(f'"{col}"' for col in df.columns)
+                    if db_type == 'duckdb':
+                        # Scan the frame as a registered Arrow table instead of marshalling rows
+                        source = pa.Table.from_pandas(df, preserve_index=False) if PYARROW_AVAILABLE else df
+                        self.current_connection.register('__tmp_import', source)
+                        try:
+                            self.current_connection.execute(
+                                f"INSERT INTO {table_name} ({column_list}) SELECT * FROM __tmp_import"
+                            )
+                        finally:
+                            self.current_connection.unregister('__tmp_import')
+                    else:
+                        # Insert all rows with one cached statement inside a single transaction
+                        insert_sql = self.get_insert_statement(table_name, df.columns)
+                        rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+                        with self.current_connection:  # Commits on success, rolls back on error
+                            self.current_connection.executemany(insert_sql, rows)
                     
                     print("TEXT columns import successful")
                     return True
@@ -7233,39 +8655,29 @@ class SQLEditorApp(QMainWindow):
                     try:
                         print("Trying row-by-row insert...")
                         
-                        # Ensure table exists
-                        if mode == 'replace':
-                            self.current_connection.execute(f"DROP TABLE IF EXISTS {table_name}")
+                        # Ensure table exists with generic structure
+                        self.create_text_table(table_name, df.columns, mode == 'replace', db_type)
                         
-                        # Create table with generic structure
-                        columns_sql = ", ".join([f'"{col}" TEXT' for col in df.columns])
-                        create_sql = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_sql})"
-                        self.current_connection.execute(create_sql)
+                        # Insert rows in bulk, skipping only the problematic ones
+                        clean_df = self.sanitize_dataframe(df)
                         
-                        if db_type == 'sqlite':
-                            self.current_connection.commit()
-                        
-                        # Insert rows one by one, skipping problematic ones
-                        successful_rows = 0
-                        placeholders = ", ".join(["?" for _ in df.columns])
-                        insert_sql = f'INSERT INTO {table_name} VALUES ({placeholders})'
-                        
-                        for idx, row in df.iterrows():
-                            try:
-                                values = [self.safe_string_convert(val) for val in row.values]
-                                self.current_connection.execute(insert_sql, values)
-                                successful_rows += 1
-                                
-                                if successful_rows % 1000 == 0:
-                                    if db_type == 'sqlite':
-                                        self.current_connection.commit()
-                                    print(f"Inserted {successful_rows} rows...")
-                                    
-                            except Exception as row_error:
-                                print(f"Skipped row {idx}: {row_error}")
-                                continue
-                        
-                        if db_type == 'sqlite':
+                        if db_type == 'duckdb':
+                            # Appender-based bulk insert straight from the DataFrame
+                            self.current_connection.append(table_name, clean_df)
+                            successful_rows = len(clean_df)
+                        else:
+                            successful_rows = 0
+                            placeholders = ", ".join(["?" for _ in clean_df.columns])
+                            insert_sql = f'INSERT INTO {table_name} VALUES ({placeholders})'
+                            records = clean_df.itertuples(index=False, name=None)
+                            
+                            while True:
+                                chunk = list(islice(records, IMPORT_CHUNK_SIZE))
+                                if not chunk:
+                                    break
+                                successful_rows += self.insert_rows_bisecting(insert_sql, chunk)
+                                print(f"Inserted {successful_rows} rows...")
+                            
                             self.current_connection.commit()
                         
                         print(f"Row-by-row insert completed: {successful_rows} rows inserted")
@@ -7279,57 +8691,110 @@ class SQLEditorApp(QMainWindow):
             print(f"Safe import completely failed: {e}")
             return False
     
+    def create_text_table(self, table_name, columns, replace, db_type):
+        """Create an all-TEXT table, dropping any existing one first when replacing"""
+        columns_sql = ", ".join([f'"{col}" TEXT' for col in columns])
+        drop_sql = f"DROP TABLE IF EXISTS {table_name}; " if replace else ""
+        create_sql = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_sql})"
+        
+        if db_type == 'sqlite':
+            # One script and one commit instead of a journal sync per statement
+            self.current_connection.executescript(f"BEGIN; {drop_sql}{create_sql}; COMMIT;")
+        else:
+            self.current_connection.execute(f"{drop_sql}{create_sql}")
+    
+    def insert_rows_bisecting(self, insert_sql, rows):
+        """Insert rows with executemany, splitting failed chunks to isolate bad rows (SQLite)"""
+        try:
+            # Savepoint makes each attempt all-or-nothing so a retried half is never inserted twice
+            self.current_connection.execute("SAVEPOINT bulk_chunk")
+            self.current_connection.executemany(insert_sql, rows)
+            self.current_connection.execute("RELEASE bulk_chunk")
+            return len(rows)
+        except Exception as chunk_error:
+            self.current_connection.execute("ROLLBACK TO bulk_chunk")
+            self.current_connection.execute("RELEASE bulk_chunk")
+            if len(rows) == 1:
+                logger.debug("Skipped row: %s", chunk_error)
+                return 0
+            middle = len(rows) // 2
+            return (self.insert_rows_bisecting(insert_sql, rows[:middle]) +
+                    self.insert_rows_bisecting(insert_sql, rows[middle:]))
+    
+    def table_exists(self, table_name):
+        """Check if a table exists on the current connection with a parameterized lookup"""
+        if self.current_connection_info['type'].lower() == 'duckdb':
+            result = self.current_connection.execute(
+                "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?", [table_name]
+            ).fetchone()
+            return result[0] > 0
+        cursor = self.current_connection.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
+        return cursor.fetchone() is not None
+    
     def duckdb_safe_import(self, df, table_name, mode):
         """DuckDB-specific import method to handle transactions properly"""
         try:
             # For DuckDB, avoid pandas to_sql which can cause transaction issues
-            # Instead, create table manually and use INSERT statements
+            # Instead, build the table straight from the registered DataFrame
             
             if mode == 'create':
                 # Check if table exists for create mode
-                try:
-                    result = self.current_connection.execute(f"SELECT 1 FROM {table_name} LIMIT 1").fetchone()
-                    if result is not None:
-                        raise ValueError(f"Table '{table_name}' already exists. Use 'Replace' mode to overwrite or 'Append' to add data.")
-                except Exception as e:
-                    if "does not exist" not in str(e).lower() and "no such table" not in str(e).lower():
-                        raise e  # Re-raise if it's not a "table doesn't exist" error
-                    # Table doesn't exist, which is what we want for create mode
+                if self.table_exists(table_name):
+                    raise ValueError(f"Table '{table_name}' already exists. Use 'Replace' mode to overwrite or 'Append' to add data.")
             elif mode == 'replace':
                 try:
                     self.current_connection.execute(f"DROP TABLE IF EXISTS {table_name}")
                 except:
                     pass
             
-            # Create table with all TEXT columns for safety
-            columns_sql = ", ".join([f'"{col}" TEXT' for col in df.columns])
+            if mode == 'append':
+                # For append mode, table should already exist
+                if not self.table_exists(table_name):
+                    raise ValueError(f"Table '{table_name}' does not exist. Use 'Create' mode to create a new table.")
+            
+            # Convert all data to strings column by column to avoid type issues
+            text_df = self._stringify_frame(df)
+            
+            # Scan the DataFrame directly, casting every column to TEXT for safety
+            select_list = ", ".join(f'CAST("{col}" AS VARCHAR) AS "{col}"' for col in df.columns)
+            self.current_connection.register('df_view', text_df)
+            try:
+                if mode in ['create', 'replace']:
+                    self.current_connection.execute(f"CREATE TABLE {table_name} AS SELECT {select_list} FROM df_view")
+                else:
+                    self.current_connection.execute(f"INSERT INTO {table_name} SELECT {select_list} FROM df_view")
+                print(f"DuckDB import successful: {len(df)} rows")
+                return True
+            except Exception as bulk_error:
+                print(f"Bulk insert from DataFrame failed, using batched inserts: {bulk_error}")
+            finally:
+                self.current_connection.unregister('df_view')
             
+            # Create table with all TEXT columns for safety
             if mode in ['create', 'replace']:
-                create_sql = f"CREATE TABLE {table_name} ({columns_sql})"
+                columns_sql = ", ".join([f'"{col}" TEXT' for col in df.columns])
+                create_sql = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_sql})"
                 self.current_connection.execute(create_sql)
-            elif mode == 'append':
-                # For append mode, table should already exist
-                try:
-                    result = self.current_connection.execute(f"SELECT 1 FROM {table_name} LIMIT 1").fetchone()
-                except Exception as e:
-                    if "does not exist" in str(e).lower() or "no such table" in str(e).lower():
-                        raise ValueError(f"Table '{table_name}' does not exist. Use 'Create' mode to create a new table.")
-                    raise e
+            
+            # Push the whole frame through DuckDB's appender in one call
+            try:
+                self.current_connection.append(table_name, text_df)
+                print(f"DuckDB import successful: {len(df)} rows")
+                return True
+            except Exception as append_error:
+                print(f"Appender insert failed, using batched inserts: {append_error}")
             
             # Insert data using DuckDB's efficient INSERT
             placeholders = ", ".join(["?" for _ in df.columns])
             insert_sql = f'INSERT INTO {table_name} VALUES ({placeholders})'
             
-            # Convert all data to strings to avoid type issues
-            data_rows = []
-            for _, row in df.iterrows():
-                converted_row = [self.safe_string_convert(val) for val in row.values]
-                data_rows.append(converted_row)
+            # One object array for the whole frame; each batch becomes row lists with a single tolist()
+            data_rows = text_df.to_numpy(dtype=object, copy=False)
             
             # Batch insert for efficiency
-            batch_size = 1000
-            for i in range(0, len(data_rows), batch_size):
-                batch = data_rows[i:i + batch_size]
+            for start in range(0, len(data_rows), IMPORT_CHUNK_SIZE):
+                batch = data_rows[start:start + IMPORT_CHUNK_SIZE].tolist()
                 try:
                     self.current_connection.executemany(insert_sql, batch)
                 except Exception as batch_error:
@@ -7371,27 +8836,28 @@ class SQLEditorApp(QMainWindow):
             if db_type == 'sqlite':
                 self.current_connection.commit()
             
-            # Insert rows one by one with error handling
+            # Insert rows with error handling, skipping only the problematic ones
             successful_rows = 0
             placeholders = ", ".join(["?" for _ in df.columns])
             insert_sql = f'INSERT INTO {table_name} VALUES ({placeholders})'
-            
-            for idx, row in df.iterrows():
-                try:
-                    values = [self.safe_string_convert(val) for val in row.values]
-                    self.current_connection.execute(insert_sql, values)
-                    successful_rows += 1
-                    
-                    # Commit periodically for SQLite
-                    if successful_rows % 500 == 0 and db_type == 'sqlite':
-                        self.current_connection.commit()
-                        
-                except Exception as row_error:
-                    print(f"Skipped row {idx}: {row_error}")
-                    continue
+            rows = self._stringify_frame(df).itertuples(index=False, name=None)
             
             if db_type == 'sqlite':
+                # executemany per chunk inside one transaction, committed once at the end
+                while True:
+                    chunk = list(islice(rows, IMPORT_CHUNK_SIZE))
+                    if not chunk:
+                        break
+                    successful_rows += self.insert_rows_bisecting(insert_sql, chunk)
                 self.current_connection.commit()
+            else:
+                for idx, values in enumerate(rows):
+                    try:
+                        self.current_connection.execute(insert_sql, values)
+                        successful_rows += 1
+                    except Exception as row_error:
+                        logger.debug("Skipped row %d: %s", idx, row_error)
+                        continue
             
             print(f"Fallback import completed: {successful_rows}/{len(df)} rows inserted")
             return successful_rows > 0
@@ -7400,25 +8866,43 @@ class SQLEditorApp(QMainWindow):
             print(f"Fallback import failed: {e}")
             return False
     
+    def append_frame(self, df, table_name, db_type):
+        """Append a frame by column name in one bulk statement (DuckDB) or one transaction (SQLite)"""
+        if db_type == 'duckdb':
+            column_list = ", ".join(f'"{col}"' for col in df.columns)
+            self.current_connection.register('__tmp_append', df)
+            try:
+                self.current_connection.execute(f"INSERT INTO {table_name} ({column_list}) SELECT * FROM __tmp_append")
+            finally:
+                self.current_connection.unregister('__tmp_append')
+        else:
+            insert_sql = self.get_insert_statement(table_name, df.columns)
+            with self.current_connection:  # Commits on success, rolls back on error
+                self.current_connection.executemany(insert_sql, df.itertuples(index=False, name=None))
+    
     def flexible_append_data(self, df, table_name, db_type):
         """Append data with flexible column handling - adds missing columns automatically and handles all errors"""
         try:
-            # Get existing table schema with error handling
-            existing_columns = set()
-            table_exists = False
+            # Get existing table schema with error handling, reusing the cached columns if known
+            existing_columns = set(self._schema_cache.get(table_name, ()))
+            table_exists = bool(existing_columns)
             
-            try:
-                if db_type == 'duckdb':
-                    existing_columns_df = self.current_connection.execute(f"PRAGMA table_info('{table_name}')").fetchdf()
-                    existing_columns = set(existing_columns_df['name'].tolist())
-                    table_exists = True
-                else:  # sqlite
-                    cursor = self.current_connection.cursor()
-                    cursor.execute(f"PRAGMA table_info({table_name})")
-                    existing_columns = set([row[1] for row in cursor.fetchall()])
-                    table_exists = True
-            except:
-                table_exists = False
+            if not table_exists:
+                try:
+                    if db_type == 'duckdb':
+                        rows = self.current_connection.execute(f"PRAGMA table_info('{table_name}')").fetchall()
+                        existing_columns = {row[1] for row in rows}
+                        table_exists = True
+                    else:  # sqlite
+                        cursor = self.current_connection.cursor()
+                        cursor.execute(f"PRAGMA table_info({table_name})")
+                        existing_columns = set([row[1] for row in cursor.fetchall()])
+                        table_exists = True
+                    if existing_columns:
+                        self._schema_cache[table_name] = set(existing_columns)
+                except Exception as schema_error:
+                    print(f"Could not read columns of '{table_name}', treating it as a new table: {schema_error}")
+                    table_exists = False
             
             if not table_exists:
                 # Table doesn't exist, create it with all TEXT columns for safety
@@ -7429,12 +8913,10 @@ class SQLEditorApp(QMainWindow):
                     
                     if db_type == 'sqlite':
                         self.current_connection.commit()
+                    self._schema_cache[table_name] = set(df.columns)
                     
                     # Now insert the data
-                    df.to_sql(table_name, self.current_connection, if_exists='append', index=False)
-                    
-                    if db_type == 'sqlite':
-                        self.current_connection.commit()
+                    self.append_frame(self._stringify_frame(df), table_name, db_type)
                     return
                 except Exception as e:
                     print(f"Failed to create new table: {e}")
@@ -7450,11 +8932,15 @@ class SQLEditorApp(QMainWindow):
             # Add missing columns to the existing table (always as TEXT for safety)
             if missing_columns:
                 print(f"Adding new columns to table '{table_name}': {', '.join(missing_columns)}")
+                if db_type == 'sqlite' and not self.current_connection.in_transaction:
+                    # One transaction for every ALTER instead of a journal sync per column
+                    self.current_connection.execute("BEGIN")
                 for col in missing_columns:
                     try:
                         # Always use TEXT type to avoid conflicts
                         alter_sql = f'ALTER TABLE {table_name} ADD COLUMN "{col}" TEXT'
                         self.current_connection.execute(alter_sql)
+                        self._schema_cache.setdefault(table_name, set()).add(col)
                     except Exception as alter_error:
                         print(f"Failed to add column {col}: {alter_error}")
                         # Continue with other columns
@@ -7462,27 +8948,17 @@ class SQLEditorApp(QMainWindow):
                 if db_type == 'sqlite':
                     self.current_connection.commit()
             
-            # Find columns in the table that are not in the new data
-            extra_table_columns = existing_columns - new_columns
-            
-            # Add missing columns to the dataframe with NULL values
-            for col in extra_table_columns:
-                df[col] = None
-            
-            # Reorder dataframe columns to match table schema: existing columns first, new columns at the end
-            all_columns = list(existing_columns) + sorted(list(missing_columns))
+            # One reindex orders the columns like the table (existing first, new at the end)
+            # and fills the table columns missing from the new data with NULL
+            all_columns = list(existing_columns) + sorted(missing_columns)
             df = df.reindex(columns=all_columns)
             
             # Convert all data to strings to prevent type conflicts
-            for col in df.columns:
-                df[col] = df[col].apply(lambda x: self.safe_string_convert(x) if x is not None else None)
+            df = self._stringify_frame(df)
             
             # Try to append the data
             try:
-                df.to_sql(table_name, self.current_connection, if_exists='append', index=False)
-                
-                if db_type == 'sqlite':
-                    self.current_connection.commit()
+                self.append_frame(df, table_name, db_type)
                     
             except Exception as append_error:
                 print(f"Bulk append failed: {append_error}")
@@ -7493,9 +8969,9 @@ class SQLEditorApp(QMainWindow):
                     placeholders = ", ".join(["?" for _ in df.columns])
                     insert_sql = f'INSERT INTO {table_name} VALUES ({placeholders})'
                     
-                    for idx, row in df.iterrows():
+                    for idx, row in enumerate(df.itertuples(index=False, name=None)):
                         try:
-                            values = [self.safe_string_convert(val) for val in row.values]
+                            values = [self.safe_string_convert(val) for val in row]
                             self.current_connection.execute(insert_sql, values)
                             successful_rows += 1
                             
@@ -7525,11 +9001,8 @@ class SQLEditorApp(QMainWindow):
         # Convert to string and strip whitespace
         clean_name = str(column_name).strip()
         
-        # Replace spaces and special characters with underscores
-        clean_name = re.sub(r'[^a-zA-Z0-9_]', '_', clean_name)
-        
-        # Remove consecutive underscores
-        clean_name = re.sub(r'_+', '_', clean_name)
+        # Replace runs of spaces, special characters and underscores with one underscore
+        clean_name = _ASCII_NAME_JUNK_RE.sub('_', clean_name)
         
         # Remove leading/trailing underscores
         clean_name = clean_name.strip('_')
@@ -7567,14 +9040,8 @@ class SQLEditorApp(QMainWindow):
         # Convert to string and strip whitespace
         clean_name = str(table_name).strip()
         
-        # Replace problematic characters with underscores
-        clean_name = re.sub(r'[^\w\s]', '_', clean_name)
-        
-        # Replace whitespace with underscores
-        clean_name = re.sub(r'\s+', '_', clean_name)
-        
-        # Remove multiple consecutive underscores
-        clean_name = re.sub(r'_+', '_', clean_name)
+        # Replace runs of problematic characters, whitespace and underscores with one underscore
+        clean_name = _COLUMN_JUNK_RE.sub('_', clean_name)
         
         # Remove leading/trailing underscores
         clean_name = clean_name.strip('_')
@@ -7590,15 +9057,7 @@ class SQLEditorApp(QMainWindow):
             clean_name = clean_name[:50].rstrip('_')
         
         # Check against SQL reserved words
-        sql_reserved = {
-            'select', 'from', 'where', 'insert', 'update', 'delete', 'create', 'drop', 
-            'alter', 'table', 'index', 'view', 'database', 'schema', 'primary', 'key',
-            'foreign', 'references', 'constraint', 'unique', 'not', 'null', 'default',
-            'check', 'order', 'by', 'group', 'having', 'union', 'join', 'inner', 'outer',
-            'left', 'right', 'on', 'as', 'distinct', 'count', 'sum', 'avg', 'max', 'min'
-        }
-        
-        if clean_name.lower() in sql_reserved:
+        if clean_name.lower() in _SQL_RESERVED_TABLE_NAMES:
             clean_name = f"tbl_{clean_name}"
         
         return clean_name.lower()
@@ -7609,34 +9068,27 @@ class SQLEditorApp(QMainWindow):
             return base_name
         
         try:
-            # Get existing table names
-            existing_tables = set()
+            # Get existing table names, querying the database only once per schema change
+            existing_tables = self._table_name_cache
             
-            if self.current_connection_info['type'].lower() == 'duckdb':
-                tables_df = self.current_connection.execute("SHOW TABLES").fetchdf()
-                existing_tables = set(tables_df['name'].str.lower()) if not tables_df.empty else set()
-            else:  # SQLite
-                cursor = self.current_connection.cursor()
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                existing_tables = {row[0].lower() for row in cursor.fetchall()}
+            if existing_tables is None:
+                if self.current_connection_info['type'].lower() == 'duckdb':
+                    rows = self.current_connection.execute("SHOW TABLES").fetchall()
+                    existing_tables = {row[0].lower() for row in rows}
+                else:  # SQLite
+                    cursor = self.current_connection.cursor()
+                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                    existing_tables = {row[0].lower() for row in cursor.fetchall()}
+                self._table_name_cache = existing_tables
             
             # If base name is unique, use it
             if base_name.lower() not in existing_tables:
                 return base_name
             
-            # Find unique name with suffix
-            counter = 1
-            while True:
-                candidate = f"{base_name}_{counter}"
-                if candidate.lower() not in existing_tables:
-                    return candidate
-                counter += 1
-                
-                # Safety check to prevent infinite loop
-                if counter > 1000:
-                    import time
-                    timestamp = int(time.time())
-                    return f"{base_name}_{timestamp}"
+            # Continue numbering after the highest existing suffix, found in one pass
+            suffix_pattern = re.compile(rf'^{re.escape(base_name.lower())}_(\d+)$')
+            used = [int(m.group(1)) for name in existing_tables if (m := suffix_pattern.match(name))]
+            return f"{base_name}_{max(used, default=0) + 1}"
                     
         except Exception as e:
             print(f"Error checking table uniqueness: {e}")
@@ -7698,16 +9150,7 @@ class SQLEditorApp(QMainWindow):
         if mode in ['append', 'replace'] and self.current_connection:
             try:
                 # Check if target table exists for append/replace
-                table_exists = False
-                if self.current_connection_info['type'].lower() == 'duckdb':
-                    result = self.current_connection.execute(f"SELECT COUNT(*) FROM information_schema.tables WHERE table_name = '{table_name}'").fetchone()
-                    table_exists = result[0] > 0 if result else False
-                else:  # SQLite
-                    cursor = self.current_connection.cursor()
-                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
-                    table_exists = cursor.fetchone() is not None
-                
-                if not table_exists:
+                if not self.table_exists(table_name):
                     if mode == 'append':
                         errors.append(f"Cannot append to table '{table_name}' - table does not exist")
                     elif mode == 'replace':
@@ -7723,28 +9166,16 @@ class SQLEditorApp(QMainWindow):
         if df is None or df.empty:
             return df
         
-        # Get column names and find duplicates
-        columns = list(df.columns)
-        seen = {}
-        new_columns = []
-        
-        for col in columns:
-            col_str = str(col).strip()
-            col_lower = col_str.lower()
-            
-            if col_lower in seen:
-                # This is a duplicate, add a suffix
-                seen[col_lower] += 1
-                new_col = f"{col_str}_{seen[col_lower]}"
-            else:
-                # First occurrence
-                seen[col_lower] = 0
-                new_col = col_str
-            
-            new_columns.append(new_col)
+        # Get column names and find duplicates (case-insensitive)
+        columns = pd.Index([str(col).strip() for col in df.columns])
+        lower = pd.Series(columns.str.lower())
+        if not lower.duplicated().any():
+            df.columns = columns
+            return df
         
-        # Update dataframe columns
-        df.columns = new_columns
+        # Number each repeat of a name, then add that number as a suffix
+        counts = lower.groupby(lower).cumcount()
+        df.columns = [f"{col}_{n}" if n else col for col, n in zip(columns, counts)]
         return df
     
     def execute_current_query(self):
@@ -7819,6 +9250,8 @@ class SQLEditorApp(QMainWindow):
                     tab_index = self.tab_widget.currentIndex()
                 else:
                     tab = QueryTab(connection=self.current_connection, connection_info=self.current_connection_info)
+                    tab.schema_changed.connect(self.refresh_schema_browser)
+                    self._tabs.append(tab)
                     tab_index = self.tab_widget.addTab(tab, os.path.basename(file_path))
                     self.tab_widget.setCurrentIndex(tab_index)
                 